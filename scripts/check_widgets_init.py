@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Check that src/gui/widgets/__init__.py exports every widget class.
+
+The widgets package imports its submodules lazily, so a stale export
+table only fails when the missing name is first accessed. This script
+parses the widget modules (without importing Tk or matplotlib) and
+compares the public classes they define against __all__ and the
+name -> submodule table in __init__.py.
+
+Usage:
+    python scripts/check_widgets_init.py
+
+Exits with status 1 if the export lists are out of sync.
+"""
+
+import ast
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+WIDGETS_DIR = Path(__file__).parent.parent / 'src' / 'gui' / 'widgets'
+
+
+def find_widget_classes(widgets_dir: Path) -> Dict[str, str]:
+    """
+    Collect public top-level classes defined in each widget module.
+
+    Args:
+        widgets_dir: Path to the widgets package
+
+    Returns:
+        Dict mapping class name to defining module name
+    """
+    classes = {}
+    for path in sorted(widgets_dir.glob('*.py')):
+        if path.name == '__init__.py':
+            continue
+        tree = ast.parse(path.read_text(encoding='utf-8'), filename=str(path))
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef) and not node.name.startswith('_'):
+                classes[node.name] = path.stem
+    return classes
+
+
+def read_exports(init_path: Path) -> Tuple[List[str], Dict[str, str]]:
+    """
+    Read __all__ and _WIDGET_MODULES literals from the package __init__.
+
+    Args:
+        init_path: Path to widgets/__init__.py
+
+    Returns:
+        Tuple of (__all__ list, _WIDGET_MODULES dict)
+    """
+    tree = ast.parse(init_path.read_text(encoding='utf-8'), filename=str(init_path))
+    exports = {}
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and len(node.targets) == 1:
+            target = node.targets[0]
+            if isinstance(target, ast.Name) and target.id in ('__all__', '_WIDGET_MODULES'):
+                exports[target.id] = ast.literal_eval(node.value)
+    return exports.get('__all__', []), exports.get('_WIDGET_MODULES', {})
+
+
+def check(widgets_dir: Path = WIDGETS_DIR) -> List[str]:
+    """
+    Compare widget classes against the package's export tables.
+
+    Args:
+        widgets_dir: Path to the widgets package
+
+    Returns:
+        List of problems found (empty if in sync)
+    """
+    classes = find_widget_classes(widgets_dir)
+    all_names, module_map = read_exports(widgets_dir / '__init__.py')
+    problems = []
+
+    for name in sorted(set(classes) - set(all_names)):
+        problems.append(f"{name} ({classes[name]}.py) is not in __all__")
+    for name in sorted(set(all_names) - set(classes)):
+        problems.append(f"{name} is in __all__ but no widget module defines it")
+    if set(all_names) != set(module_map):
+        problems.append("__all__ and _WIDGET_MODULES list different names")
+    for name, module in sorted(module_map.items()):
+        if name in classes and classes[name] != module:
+            problems.append(f"{name} maps to {module}.py but is defined in {classes[name]}.py")
+
+    return problems
+
+
+def main() -> int:
+    problems = check()
+    if problems:
+        print("widgets/__init__.py is out of sync:")
+        for problem in problems:
+            print(f"  - {problem}")
+        return 1
+
+    print("widgets/__init__.py exports are in sync")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,12 +1,46 @@
 """Data processing to create Player objects with calculated probabilities."""
 
+import hashlib
+import os
+import pickle
+import sys
+from functools import lru_cache
 import pandas as pd
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from src.models.player import Player
 from src.models.position import parse_position, FieldingPosition
 from src.models.probability import decompose_slash_line
 import config
 
+# Bump when the roster cache payload layout changes
+ROSTER_CACHE_FORMAT = 2
+
+# Modules whose code or settings determine a prepared roster; editing any of
+# them invalidates existing roster caches
+_ROSTER_CACHE_MODULES = (
+    __name__,
+    'src.models.player',
+    'src.models.position',
+    'src.models.probability',
+    'config',
+)
+
+
+@lru_cache(maxsize=None)
+def _roster_cache_key() -> str:
+    """Fingerprint the cache format and the code/config a roster depends on.
+
+    Computed once per process; the sources can't change while it runs.
+
+    Returns:
+        Hex digest that changes whenever a cached roster could be stale
+    """
+    digest = hashlib.blake2b(str(ROSTER_CACHE_FORMAT).encode(), digest_size=16)
+    for module_name in _ROSTER_CACHE_MODULES:
+        with open(sys.modules[module_name].__file__, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
 
 def create_player_from_stats(row: pd.Series) -> Player:
     """Create a Player object from a DataFrame row with statistics.
@@ -131,6 +165,86 @@ def prepare_roster(df: pd.DataFrame) -> List[Player]:
     return roster
 
 
+def save_roster_cache(
+    roster: List[Player],
+    df: pd.DataFrame,
+    filename: str,
+    data_type: str = 'processed'
+):
+    """Pickle a prepared roster and its source DataFrame for fast reloads.
+
+    The payload records _roster_cache_key(), so the cache is ignored once
+    the player model, probability code, or config change.
+
+    Args:
+        roster: Player objects built by prepare_roster()
+        df: DataFrame the roster was built from
+        filename: Pickle filename (without path)
+        data_type: 'raw' or 'processed'
+    """
+    path = f"data/{data_type}/{filename}"
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    with open(path, 'wb') as f:
+        payload = {'cache_key': _roster_cache_key(), 'roster': roster, 'df': df}
+        pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+    print(f"Saved roster cache to {path}")
+
+
+def load_roster_cache(
+    filename: str,
+    source_filename: Optional[str] = None,
+    data_type: str = 'processed'
+) -> Optional[Tuple[List[Player], pd.DataFrame]]:
+    """Load a roster pickled by save_roster_cache().
+
+    The cache is treated as stale when the source CSV it was derived from
+    has been modified after the pickle was written, or when it was written
+    by a different cache format, model code, or config (see
+    _roster_cache_key()).
+
+    Args:
+        filename: Pickle filename (without path)
+        source_filename: Optional CSV filename the roster was built from
+        data_type: 'raw' or 'processed'
+
+    Returns:
+        (roster, df) tuple, or None if the cache is missing, stale, or unreadable
+    """
+    path = f"data/{data_type}/{filename}"
+    try:
+        cache_stat = os.stat(path)
+    except OSError:
+        return None
+
+    if cache_stat.st_size == 0:
+        return None
+
+    if source_filename is not None:
+        source_path = f"data/{data_type}/{source_filename}"
+        try:
+            if os.stat(source_path).st_mtime > cache_stat.st_mtime:
+                return None
+        except OSError:
+            pass  # No source CSV (roster came from the API); cache stands alone
+
+    try:
+        with open(path, 'rb') as f:
+            payload = pickle.load(f)
+    except Exception as e:
+        # Truncated file, or classes renamed since the cache was written
+        print(f"Warning: Ignoring unreadable roster cache {path}: {e}")
+        return None
+
+    if not isinstance(payload, dict) or payload.get('cache_key') != _roster_cache_key():
+        print(f"Ignoring outdated roster cache {path}")
+        return None
+    roster, df = payload['roster'], payload['df']
+
+    print(f"Loaded roster cache from {path}")
+    return roster, df
+
+
 def get_lineup_by_stat(df: pd.DataFrame, stat: str = 'ops', ascending: bool = False) -> List[Player]:
     """Create lineup ordered by a specific statistic.
     
@@ -192,7 +306,6 @@ def print_lineup(lineup: List[Player]):
 
 if __name__ == "__main__":
     # Test with 2025 Blue Jays data
-    import sys
     sys.path.append('..')
     from src.data.scraper import load_data
     
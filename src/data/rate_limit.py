@@ -0,0 +1,79 @@
+"""Process-wide rate limiting for outbound data requests."""
+
+import functools
+import threading
+import time
+from typing import Callable, TypeVar
+
+F = TypeVar('F', bound=Callable)
+
+
+class TokenBucket:
+    """Thread-safe token bucket that spaces out outbound requests.
+
+    Callers block in acquire() until a token is available. Tokens refill
+    continuously at rate_per_sec up to burst, so short bursts are allowed
+    but sustained traffic is held to the configured rate.
+
+    Attributes:
+        rate_per_sec: Token refill rate (requests per second)
+        burst: Maximum number of tokens that can accumulate
+    """
+
+    def __init__(self, rate_per_sec: float = 0.5, burst: int = 1):
+        """Initialize bucket.
+
+        Args:
+            rate_per_sec: Sustained request rate (default: 1 request / 2 s)
+            burst: Maximum back-to-back requests allowed (default: 1)
+        """
+        if rate_per_sec <= 0:
+            raise ValueError(f"rate_per_sec must be positive, got {rate_per_sec}")
+        if burst < 1:
+            raise ValueError(f"burst must be at least 1, got {burst}")
+
+        self.rate_per_sec = rate_per_sec
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then consume it.
+
+        This can sleep for seconds; GUI code must call rate-limited functions
+        off the Tk main thread (see load_team_roster_async).
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate_per_sec)
+            self._last = now
+
+            if self._tokens < 1.0:
+                # Sleep while holding the lock so waiting callers queue in order
+                time.sleep((1.0 - self._tokens) / self.rate_per_sec)
+                self._tokens = 1.0
+                self._last = time.monotonic()
+
+            self._tokens -= 1.0
+
+
+# Shared bucket for FanGraphs/Baseball Reference requests made via pybaseball
+_bucket = TokenBucket(rate_per_sec=0.5, burst=1)
+
+
+def rate_limited(func: F) -> F:
+    """Decorator that acquires a token from the shared bucket before each call.
+
+    Args:
+        func: Function that performs an outbound request
+
+    Returns:
+        Wrapped function
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        _bucket.acquire()
+        return func(*args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
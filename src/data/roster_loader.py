@@ -0,0 +1,101 @@
+"""Load team rosters and player stats, from cache or the API."""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Tuple
+import pandas as pd
+from src.models.player import Player
+from src.data.scraper import (
+    get_player_batting_stats,
+    get_team_batting_stats,
+    load_data,
+    prepare_player_stats,
+)
+from src.data.processor import prepare_roster, save_roster_cache, load_roster_cache
+
+# One background worker: loads run in request order, and rate-limited API
+# calls wait there instead of on the caller's (e.g. Tk main) thread
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='roster-loader')
+
+
+def load_team_roster(
+    team_code: str,
+    season: int,
+    min_pa: int = 50
+) -> Tuple[List[Player], pd.DataFrame, bool]:
+    """Load a team's roster, trying each cache before the API.
+
+    Sources, in order:
+    1. The pickled roster (skips CSV parsing and prepare_roster)
+    2. The prepared-stats CSV
+    3. The batting stats API (network; rate limited)
+
+    A roster built from the CSV or the API is pickled for next time.
+
+    Args:
+        team_code: Three-letter team code (e.g., "TOR")
+        season: Season year
+        min_pa: Minimum plate appearances for players fetched from the API
+
+    Returns:
+        Tuple of (roster, stats DataFrame, True if loaded from a cache)
+    """
+    cache_filename = f"{team_code.lower()}_{season}_prepared.csv"
+    roster_filename = f"{team_code.lower()}_{season}_roster.pkl"
+
+    cached = load_roster_cache(roster_filename, cache_filename)
+    if cached is not None:
+        roster, df = cached
+        return roster, df, True
+
+    try:
+        df = load_data(cache_filename, 'processed')
+        from_cache = True
+    except Exception:
+        df = get_team_batting_stats(team_code, season)
+        df = prepare_player_stats(df, min_pa=min_pa)
+        from_cache = False
+
+    roster = prepare_roster(df)
+    try:
+        save_roster_cache(roster, df, roster_filename)
+    except OSError as e:
+        print(f"Warning: Could not write roster cache: {e}")
+
+    return roster, df, from_cache
+
+
+def load_team_roster_async(
+    team_code: str,
+    season: int,
+    min_pa: int = 50
+) -> 'Future[Tuple[List[Player], pd.DataFrame, bool]]':
+    """Run load_team_roster() on a background thread.
+
+    GUI callers should poll the returned future (e.g. with after()) rather
+    than block on it, since API fetches can wait on the rate limiter.
+
+    Args:
+        team_code: Three-letter team code (e.g., "TOR")
+        season: Season year
+        min_pa: Minimum plate appearances for players fetched from the API
+
+    Returns:
+        Future resolving to load_team_roster()'s result (or its exception)
+    """
+    return _executor.submit(load_team_roster, team_code, season, min_pa)
+
+
+def get_player_batting_stats_async(player_name: str, season: int) -> 'Future[pd.DataFrame]':
+    """Run get_player_batting_stats() on the background loader thread.
+
+    Shares the worker with load_team_roster_async(), so player lookups and
+    team loads wait on the rate limiter there, one at a time.
+
+    Args:
+        player_name: Player name to search for
+        season: Season year
+
+    Returns:
+        Future resolving to the matching players' stats (or the exception)
+    """
+    return _executor.submit(get_player_batting_stats, player_name, season)
@@ -4,6 +4,7 @@ import pandas as pd
 from typing import Optional, List, Dict
 import pybaseball as pyb
 from pybaseball import batting_stats, team_batting, playerid_lookup, statcast_batter
+from src.data.rate_limit import rate_limited
 
 try:
     import statsapi
@@ -27,6 +28,7 @@ MLB_TEAM_IDS = {
 }
 
 
+@rate_limited
 def get_team_batting_stats(team: str, season: int) -> pd.DataFrame:
     """Fetch batting statistics for a team's roster.
 
@@ -75,6 +77,7 @@ def search_player(last_name: str, first_name: Optional[str] = None) -> pd.DataFr
     return results
 
 
+@rate_limited
 def get_player_batting_stats(player_name: str, season: int) -> pd.DataFrame:
     """Fetch batting statistics for a specific player by searching all players.
 
@@ -101,6 +104,7 @@ def get_player_batting_stats(player_name: str, season: int) -> pd.DataFrame:
     return player_stats
 
 
+@rate_limited
 def get_league_batting_stats(season: int, min_pa: int = 100) -> pd.DataFrame:
     """Fetch league-wide batting statistics for calculating averages.
 
@@ -18,6 +18,15 @@ class LineupPanel(ttk.Frame):
     and inline progress indicator.
     """
 
+    # (label, LineupBuilder method) for each control button; None is a separator
+    _CONTROL_BUTTONS = (
+        ("Move Up", 'move_up'),
+        ("Move Down", 'move_down'),
+        ("Remove", 'remove_player'),
+        None,
+        ("Clear All", 'clear_lineup'),
+    )
+
     def __init__(
         self,
         parent,
@@ -191,35 +200,17 @@ class LineupPanel(ttk.Frame):
         controls = ttk.Frame(self)
         controls.grid(row=2, column=1, sticky='ns')
 
-        ttk.Button(
-            controls,
-            text="Move Up",
-            command=self.lineup_builder.move_up,
-            width=12
-        ).pack(pady=2)
-
-        ttk.Button(
-            controls,
-            text="Move Down",
-            command=self.lineup_builder.move_down,
-            width=12
-        ).pack(pady=2)
-
-        ttk.Button(
-            controls,
-            text="Remove",
-            command=self.lineup_builder.remove_player,
-            width=12
-        ).pack(pady=2)
-
-        ttk.Separator(controls, orient='horizontal').pack(fill='x', pady=10)
-
-        ttk.Button(
-            controls,
-            text="Clear All",
-            command=self.lineup_builder.clear_lineup,
-            width=12
-        ).pack(pady=2)
+        for spec in self._CONTROL_BUTTONS:
+            if spec is None:
+                ttk.Separator(controls, orient='horizontal').pack(fill='x', pady=10)
+                continue
+            text, method = spec
+            ttk.Button(
+                controls,
+                text=text,
+                command=getattr(self.lineup_builder, method),
+                width=12
+            ).pack(pady=2)
 
     def _create_footer(self):
         """Create footer with Run button and inline progress indicator."""
@@ -4,11 +4,11 @@
 """Setup panel consolidating team configuration and simulation assumptions."""
 
 import tkinter as tk
+from concurrent.futures import Future
 from tkinter import ttk, messagebox
 from typing import Callable, Optional
 import config
-from src.data.scraper import get_team_batting_stats, prepare_player_stats, load_data
-from src.data.processor import prepare_roster
+from src.data.roster_loader import load_team_roster_async
 from src.gui.widgets.collapsible_frame import CollapsibleFrame
 from src.gui.widgets.labeled_slider import LabeledSlider
 from src.gui.widgets.seed_control import SeedControl
@@ -48,6 +48,12 @@ MLB_TEAMS = [
     ('WSN', 'Washington Nationals'),
 ]
 
+# Quiet interval before a slider drag is committed to the entry field
+SIMS_DEBOUNCE_MS = 50
+
+# How often a background team load is checked for completion (ms)
+LOAD_POLL_MS = 50
+
 
 class SetupPanel(ttk.Frame):
     """Consolidated setup panel with team configuration and assumptions subsection.
@@ -75,6 +81,9 @@ class SetupPanel(ttk.Frame):
         self.roster = []
         self.team_data = None
         self.data_loaded_callback: Optional[Callable] = None
+        self._sims_after_id: Optional[str] = None
+        self._load_future: Optional[Future] = None  # Team load in progress
+        self._load_after_id: Optional[str] = None
 
         # Configure grid for responsive layout
         self.columnconfigure(0, weight=1)
@@ -649,13 +658,33 @@ class SetupPanel(ttk.Frame):
     def _on_sims_change(self, value: str) -> None:
         """Handle simulations slider change.
 
+        Tk fires this for every pixel of slider motion, so the entry update
+        is deferred until the slider has been quiet for SIMS_DEBOUNCE_MS.
+
+        Args:
+            value: Slider value as string
+        """
+        if self._sims_after_id is not None:
+            self.after_cancel(self._sims_after_id)
+        self._sims_after_id = self.after(SIMS_DEBOUNCE_MS, self._commit_sims, value)
+
+    def _commit_sims(self, value: str) -> None:
+        """Write the settled slider value into the simulations entry.
+
         Args:
             value: Slider value as string
         """
+        self._sims_after_id = None
         int_val = int(float(value))
         self.n_sims_entry.delete(0, tk.END)
         self.n_sims_entry.insert(0, str(int_val))
 
+    def _flush_sims(self) -> None:
+        """Commit a pending debounced slider value now."""
+        if self._sims_after_id is not None:
+            self.after_cancel(self._sims_after_id)
+            self._commit_sims(self.n_sims_scale.get())
+
     def _on_sims_entry_change(self) -> None:
         """Handle simulations entry change."""
         try:
@@ -725,29 +754,34 @@ class SetupPanel(ttk.Frame):
             self.error_explanation.config(text="No errors")
 
     def _load_team_data(self) -> None:
-        """Load team data from API or cache."""
+        """Start loading team data from cache or API in the background."""
+        if self._load_future is not None:
+            return  # A load is already in progress
+
         team_code = self.get_team_code()
         season = int(self.season_spin.get())
 
         self.load_btn.config(state='disabled')
         self.status_label.config(text="Loading data...", foreground='blue')
-        self.update()
 
+        self._load_future = load_team_roster_async(team_code, season, min_pa=50)  # Lower threshold for GUI
+        self._poll_team_load()
+
+    def _poll_team_load(self) -> None:
+        """Finish a background team load once it completes, else check again later."""
+        if not self._load_future.done():
+            self._load_after_id = self.after(LOAD_POLL_MS, self._poll_team_load)
+            return
+
+        self._load_after_id = None
+        future = self._load_future
+        self._load_future = None
         try:
-            # Try loading from cache first
-            cache_filename = f"{team_code.lower()}_{season}_prepared.csv"
-            try:
-                import pandas as pd
-                df = load_data(cache_filename, 'processed')
-                self.status_label.config(text=f"Loaded from cache: {len(df)} players", foreground='green')
-            except:
-                # Fetch from API
-                df = get_team_batting_stats(team_code, season)
-                df = prepare_player_stats(df, min_pa=50)  # Lower threshold for GUI
-                self.status_label.config(text=f"Fetched from API: {len(df)} players", foreground='green')
+            roster, df, from_cache = future.result()
+            source = "Loaded from cache" if from_cache else "Fetched from API"
+            self.status_label.config(text=f"{source}: {len(df)} players", foreground='green')
 
-            # Convert to roster
-            self.roster = prepare_roster(df)
+            self.roster = roster
             self.team_data = df
 
             # Notify callback
@@ -761,14 +795,35 @@ class SetupPanel(ttk.Frame):
         finally:
             self.load_btn.config(state='normal')
 
+    def destroy(self) -> None:
+        """Cancel pending slider commits and team load polls before destroying the widget."""
+        if self._sims_after_id is not None:
+            self.after_cancel(self._sims_after_id)
+            self._sims_after_id = None
+        if self._load_after_id is not None:
+            self.after_cancel(self._load_after_id)
+            self._load_after_id = None
+        super().destroy()
+
     def get_team_code(self) -> str:
         """Get selected team code.
 
         Returns:
             Three-letter team code
         """
-        selection = self.team_combo.get()
-        return selection.split(' - ')[0]
+        return self._get_selected_team()[0]
+
+    def _get_selected_team(self) -> tuple:
+        """Get the MLB_TEAMS entry for the current combobox selection.
+
+        The combobox values are built from MLB_TEAMS in order, so the
+        selection index maps directly onto the list.
+
+        Returns:
+            (code, full_name) tuple, first team if nothing is selected
+        """
+        idx = self.team_combo.current()
+        return MLB_TEAMS[idx] if idx >= 0 else MLB_TEAMS[0]
 
     def get_team_full_name(self) -> str:
         """Get selected team full name.
@@ -776,11 +831,7 @@ class SetupPanel(ttk.Frame):
         Returns:
             Full team name (e.g., 'Toronto Blue Jays')
         """
-        code = self.get_team_code()
-        for team_code, full_name in MLB_TEAMS:
-            if team_code == code:
-                return full_name
-        return code  # Fallback to code
+        return self._get_selected_team()[1]
 
     def get_team_nickname(self) -> str:
         """Get user-entered team nickname.
@@ -796,6 +847,7 @@ class SetupPanel(ttk.Frame):
         Returns:
             Dictionary containing all configuration values
         """
+        self._flush_sims()  # Include a slider drag still inside the debounce window
         return {
             'team': self.get_team_code(),
             'season': int(self.season_spin.get()),
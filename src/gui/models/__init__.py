@@ -4,5 +4,6 @@
 """GUI data models package."""
 
 from src.gui.models.team_roster import Team, Roster, Lineup
+from src.gui.models.constraint import Constraint
 
-__all__ = ["Team", "Roster", "Lineup"]
+__all__ = ["Team", "Roster", "Lineup", "Constraint"]
@@ -0,0 +1,75 @@
+# ============================================================================
+# src/gui/models/constraint.py
+# ============================================================================
+"""Typed lineup constraint model."""
+
+from dataclasses import dataclass
+from typing import AbstractSet, Any, Dict, Optional
+
+# Constraint fields that name a roster player
+_PLAYER_FIELDS = ('player', 'player1', 'player2', 'player_a', 'player_b')
+
+
+@dataclass(frozen=True)
+class Constraint:
+    """A validated lineup constraint.
+
+    Constraints are stored and exchanged as plain dicts (sessions, the
+    validator); this is the normalized form of one such dict. Fields the
+    dict does not set are None. Which types exist, and which fields each
+    uses, is up to the consumers (ConstraintValidator, ConstraintDialog).
+
+    Attributes:
+        type: Constraint type, e.g. 'fixed_position', 'batting_order', 'platoon'
+        player: Player fixed at a position (fixed_position)
+        player1: Player who bats first (batting_order)
+        player2: Player who bats after player1 (batting_order)
+        player_a: First platoon player (platoon)
+        player_b: Second platoon player (platoon)
+        position: Batting order position, 1-9 (fixed_position, platoon)
+    """
+
+    type: str
+    player: Optional[str] = None
+    player1: Optional[str] = None
+    player2: Optional[str] = None
+    player_a: Optional[str] = None
+    player_b: Optional[str] = None
+    position: Optional[int] = None
+
+    @classmethod
+    def from_dict(
+        cls,
+        data: Dict[str, Any],
+        valid_names: Optional[AbstractSet[str]] = None
+    ) -> Optional['Constraint']:
+        """Normalize a constraint dict.
+
+        Player names not in valid_names, and positions outside 1-9, are
+        dropped (left as None) rather than rejecting the whole constraint.
+
+        Args:
+            data: Constraint dict with a 'type' key
+            valid_names: Roster player names, or None to accept any name
+
+        Returns:
+            Constraint, or None if the dict has no type
+        """
+        constraint_type = data.get('type')
+        if not isinstance(constraint_type, str):
+            return None
+
+        values: Dict[str, Any] = {}
+        for name in _PLAYER_FIELDS:
+            value = data.get(name)
+            if value and (valid_names is None or value in valid_names):
+                values[name] = value
+
+        try:
+            position = int(data.get('position'))
+        except (TypeError, ValueError):
+            position = None
+        if position is not None and 1 <= position <= 9:
+            values['position'] = position
+
+        return cls(type=constraint_type, **values)
@@ -1,16 +1,21 @@
 """Tab for lineup management with constraints."""
 
 import tkinter as tk
+from concurrent.futures import Future
 from tkinter import ttk, messagebox, simpledialog
 from typing import List, Optional
 import pandas as pd
 from src.models.player import Player
 from src.gui.widgets import PlayerList, LineupBuilder, ConstraintDialog
 from src.gui.utils import ConstraintValidator, ConfigManager
-from src.data.scraper import get_player_batting_stats, prepare_player_stats
+from src.data.scraper import prepare_player_stats
+from src.data.roster_loader import get_player_batting_stats_async
 from src.data.processor import prepare_roster
 import config
 
+# How often a background player search is checked for completion (ms)
+SEARCH_POLL_MS = 50
+
 
 class LineupTab(ttk.Frame):
     """Tab for lineup management."""
@@ -23,6 +28,8 @@ class LineupTab(ttk.Frame):
         self.roster_df: Optional[pd.DataFrame] = None
         self.constraints: List[dict] = []
         self.config_manager = ConfigManager()
+        self._search_future: Optional[Future] = None  # Player search in progress
+        self._search_after_id: Optional[str] = None
 
         self._create_widgets()
 
@@ -326,8 +333,10 @@ class LineupTab(ttk.Frame):
                         player = next((p for p in self.roster if p.name == name), None)
                         lineup.append(player)
 
-                self.lineup_builder.set_lineup(lineup)
-                self.lineup_builder.apply_constraints(self.constraints)
+                # One roster redraw for both updates
+                with self.lineup_builder.batch_updates():
+                    self.lineup_builder.set_lineup(lineup)
+                    self.lineup_builder.apply_constraints(self.constraints)
 
                 messagebox.showinfo("Success", "Lineup loaded successfully")
 
@@ -467,7 +476,10 @@ class LineupTab(ttk.Frame):
         return warnings
 
     def _scrape_player(self):
-        """Scrape and add an individual player to the roster."""
+        """Start searching for an individual player in the background."""
+        if self._search_future is not None:
+            return  # A search is already in progress
+
         player_name = self.player_name_var.get().strip()
         if not player_name:
             messagebox.showwarning("No Name", "Please enter a player name to search")
@@ -477,11 +489,21 @@ class LineupTab(ttk.Frame):
 
         self.scrape_btn.config(state='disabled')
         self.scrape_status_label.config(text="Searching...", foreground='blue')
-        self.update()
 
+        self._search_future = get_player_batting_stats_async(player_name, season)
+        self._poll_player_search()
+
+    def _poll_player_search(self):
+        """Add the searched player once the lookup completes, else check again later."""
+        if not self._search_future.done():
+            self._search_after_id = self.after(SEARCH_POLL_MS, self._poll_player_search)
+            return
+
+        self._search_after_id = None
+        future = self._search_future
+        self._search_future = None
         try:
-            # Fetch player data
-            player_df = get_player_batting_stats(player_name, season)
+            player_df = future.result()
 
             if len(player_df) > 1:
                 # Multiple matches - let user choose
@@ -536,6 +558,13 @@ class LineupTab(ttk.Frame):
         finally:
             self.scrape_btn.config(state='normal')
 
+    def destroy(self):
+        """Stop polling a pending player search before destroying the tab."""
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+            self._search_after_id = None
+        super().destroy()
+
     def _select_from_multiple_players(self, players_df: pd.DataFrame) -> Optional[int]:
         """Show dialog to select from multiple matching players.
 
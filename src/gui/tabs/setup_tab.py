@@ -1,11 +1,11 @@
 """Tab for team and simulation setup."""
 
 import tkinter as tk
+from concurrent.futures import Future
 from tkinter import ttk, messagebox
 from typing import Callable, Optional
 import config
-from src.data.scraper import get_team_batting_stats, prepare_player_stats, load_data
-from src.data.processor import prepare_roster
+from src.data.roster_loader import load_team_roster_async
 
 
 # MLB team codes with full names
@@ -42,6 +42,12 @@ MLB_TEAMS = [
     ('WSN', 'Washington Nationals'),
 ]
 
+# Quiet interval before a slider drag is committed to the entry field
+SIMS_DEBOUNCE_MS = 50
+
+# How often a background team load is checked for completion (ms)
+LOAD_POLL_MS = 50
+
 
 class SetupTab(ttk.Frame):
     """Tab for team and simulation setup."""
@@ -53,6 +59,9 @@ class SetupTab(ttk.Frame):
         self.roster = []
         self.team_data = None
         self.data_loaded_callback: Optional[Callable] = None
+        self._sims_after_id: Optional[str] = None
+        self._load_future: Optional[Future] = None  # Team load in progress
+        self._load_after_id: Optional[str] = None
 
         self._create_widgets()
         self._load_defaults()
@@ -156,11 +165,24 @@ class SetupTab(ttk.Frame):
         self.seed_entry.insert(0, str(config.RANDOM_SEED))
 
     def _on_sims_change(self, value):
-        """Handle simulations slider change."""
+        """Handle simulations slider change (debounced)."""
+        if self._sims_after_id is not None:
+            self.after_cancel(self._sims_after_id)
+        self._sims_after_id = self.after(SIMS_DEBOUNCE_MS, self._commit_sims, value)
+
+    def _commit_sims(self, value):
+        """Write the settled slider value into the simulations entry."""
+        self._sims_after_id = None
         int_val = int(float(value))
         self.n_sims_entry.delete(0, tk.END)
         self.n_sims_entry.insert(0, str(int_val))
 
+    def _flush_sims(self):
+        """Commit a pending debounced slider value now."""
+        if self._sims_after_id is not None:
+            self.after_cancel(self._sims_after_id)
+            self._commit_sims(self.n_sims_scale.get())
+
     def _on_sims_entry_change(self):
         """Handle simulations entry change."""
         try:
@@ -181,29 +203,34 @@ class SetupTab(ttk.Frame):
             self.seed_entry.config(state='disabled')
 
     def _load_team_data(self):
-        """Load team data from API or cache."""
+        """Start loading team data from cache or API in the background."""
+        if self._load_future is not None:
+            return  # A load is already in progress
+
         team_code = self.get_team_code()
         season = int(self.season_spin.get())
 
         self.load_btn.config(state='disabled')
         self.status_label.config(text="Loading data...", foreground='blue')
-        self.update()
 
+        self._load_future = load_team_roster_async(team_code, season, min_pa=50)  # Lower threshold for GUI
+        self._poll_team_load()
+
+    def _poll_team_load(self):
+        """Finish a background team load once it completes, else check again later."""
+        if not self._load_future.done():
+            self._load_after_id = self.after(LOAD_POLL_MS, self._poll_team_load)
+            return
+
+        self._load_after_id = None
+        future = self._load_future
+        self._load_future = None
         try:
-            # Try loading from cache first
-            cache_filename = f"{team_code.lower()}_{season}_prepared.csv"
-            try:
-                import pandas as pd
-                df = load_data(cache_filename, 'processed')
-                self.status_label.config(text=f"Loaded from cache: {len(df)} players", foreground='green')
-            except:
-                # Fetch from API
-                df = get_team_batting_stats(team_code, season)
-                df = prepare_player_stats(df, min_pa=50)  # Lower threshold for GUI
-                self.status_label.config(text=f"Fetched from API: {len(df)} players", foreground='green')
-
-            # Convert to roster
-            self.roster = prepare_roster(df)
+            roster, df, from_cache = future.result()
+            source = "Loaded from cache" if from_cache else "Fetched from API"
+            self.status_label.config(text=f"{source}: {len(df)} players", foreground='green')
+
+            self.roster = roster
             self.team_data = df
 
             # Notify callback
@@ -217,13 +244,25 @@ class SetupTab(ttk.Frame):
         finally:
             self.load_btn.config(state='normal')
 
+    def destroy(self):
+        """Cancel pending slider commits and team load polls before destroying the widget."""
+        if self._sims_after_id is not None:
+            self.after_cancel(self._sims_after_id)
+            self._sims_after_id = None
+        if self._load_after_id is not None:
+            self.after_cancel(self._load_after_id)
+            self._load_after_id = None
+        super().destroy()
+
     def get_team_code(self) -> str:
         """Get selected team code."""
-        selection = self.team_combo.get()
-        return selection.split(' - ')[0]
+        # Combobox values are built from MLB_TEAMS in order
+        idx = self.team_combo.current()
+        return MLB_TEAMS[idx][0] if idx >= 0 else MLB_TEAMS[0][0]
 
     def get_config(self) -> dict:
         """Get current configuration as dict."""
+        self._flush_sims()  # Include a slider drag still inside the debounce window
         return {
             'team': self.get_team_code(),
             'season': int(self.season_spin.get()),
@@ -14,13 +14,227 @@ Example:
     create_histogram_with_kde(ax, data, show_mean=True)
 """
 
-from typing import Optional, Tuple, List, Dict
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Optional, Tuple, List, Dict, TYPE_CHECKING
 import numpy as np
 from numpy.typing import ArrayLike
-from matplotlib.axes import Axes
-from matplotlib.projections.polar import PolarAxes
-import matplotlib.pyplot as plt
-import seaborn as sns
+
+# matplotlib and scipy are imported inside the functions that use them, so
+# importing this module (e.g. via src.gui.utils) stays cheap
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.projections.polar import PolarAxes
+
+try:
+    from fast_histogram import histogram1d
+    FAST_HISTOGRAM_AVAILABLE = True
+except ImportError:
+    FAST_HISTOGRAM_AVAILABLE = False
+
+
+# Minimum number of fine bins the KDE is evaluated on (rounded up to a
+# multiple of the display bin count). The data is binned once onto this grid
+# and smoothed by FFT convolution, so KDE cost depends on the grid size
+# rather than the number of samples.
+KDE_GRID_SIZE = 1024
+
+# Gaussian kernel is truncated at this many bandwidths either side
+KDE_KERNEL_SIGMAS = 4.0
+
+# Block length for the blocked mean/M2 reduction in _mean_m2
+STATS_BLOCK_SIZE = 65_536
+
+
+def _plot_kde(
+    ax: Axes,
+    fine_counts: np.ndarray,
+    fine_edges: np.ndarray,
+    n: int,
+    m2: float,
+    bin_width: float,
+    color: str,
+) -> None:
+    """
+    Overlay a Gaussian KDE curve scaled to histogram counts.
+
+    Equivalent to scipy's gaussian_kde with Scott's bandwidth, but computed
+    by convolving counts on a fine uniform grid with a sampled Gaussian
+    kernel via FFT. The caller bins the data onto the fine grid once and
+    derives the display histogram from the same counts, so the samples are
+    only walked by a single binning pass; smoothing is O(G log G) in the
+    grid size instead of O(N * G).
+
+    Args:
+        ax: Matplotlib Axes object to plot on
+        fine_counts: Counts of the data on the fine grid
+        fine_edges: Uniform edges of the fine grid
+        n: Number of samples
+        m2: Sum of squared deviations of the samples (see _mean_m2)
+        bin_width: Display histogram bin width (used to scale density to counts)
+        color: Line color
+    """
+    from scipy.signal import fftconvolve
+
+    if n < 2 or m2 == 0:
+        return  # Degenerate (single/constant) data has no density to estimate
+
+    # Scott's rule bandwidth (matches gaussian_kde's default in 1-D)
+    bandwidth = np.sqrt(m2 / (n - 1)) * n ** -0.2
+
+    # Smooth the fine counts with a unit-sum Gaussian kernel
+    fine_width = float(fine_edges[1] - fine_edges[0])
+    sigma_bins = bandwidth / fine_width
+    half_width = max(1, int(np.ceil(KDE_KERNEL_SIGMAS * sigma_bins)))
+    offsets = np.arange(-half_width, half_width + 1)
+    kernel = np.exp(-0.5 * (offsets / sigma_bins) ** 2)
+    kernel /= kernel.sum()
+
+    smoothed = fftconvolve(fine_counts, kernel, mode='same')
+    grid = 0.5 * (fine_edges[:-1] + fine_edges[1:])
+
+    # smoothed is in counts per fine bin; rescale to histogram bin width
+    ax.plot(grid, smoothed * (bin_width / fine_width), color=color, linewidth=1.5)
+
+
+def _mean_m2(data_arr: np.ndarray) -> Tuple[int, float, float]:
+    """
+    Compute sample size, mean, and sum of squared deviations (M2).
+
+    M2 is the quantity Welford's algorithm accumulates; variance with
+    ddof=1 is M2 / (n - 1). Computing it directly lets callers pool
+    variances without squaring standard deviations back out.
+
+    The array is reduced in blocks of STATS_BLOCK_SIZE and the per-block
+    results are merged with Chan's parallel update, so each element is read
+    while it is still cache-resident and temporaries stay block-sized
+    rather than growing with the input.
+
+    Args:
+        data_arr: 1-D numeric array
+
+    Returns:
+        Tuple of (n, mean, m2)
+    """
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    for start in range(0, len(data_arr), STATS_BLOCK_SIZE):
+        block = data_arr[start:start + STATS_BLOCK_SIZE]
+        n_b = len(block)
+        mean_b = float(np.mean(block))
+        deviations = block - mean_b
+        m2_b = float(np.dot(deviations, deviations))
+
+        # Chan et al. merge of (n, mean, m2) with the block's statistics
+        delta = mean_b - mean
+        total = n + n_b
+        mean += delta * n_b / total
+        m2 += m2_b + delta * delta * n * n_b / total
+        n = total
+
+    return n, mean, m2
+
+
+def _shared_bin_edges(arrays: List[np.ndarray], bins: int) -> np.ndarray:
+    """
+    Compute common uniform histogram bin edges spanning several arrays.
+
+    Uses per-array min/max instead of concatenating the inputs, so no
+    combined copy of the data is allocated. Matches numpy's convention of
+    widening a zero-width range by 0.5 on each side.
+
+    Args:
+        arrays: 1-D arrays to cover (empty arrays are ignored)
+        bins: Number of bins
+
+    Returns:
+        Array of bins + 1 edges
+    """
+    nonempty = [arr for arr in arrays if len(arr)]
+    if not nonempty:
+        return np.linspace(0.0, 1.0, bins + 1)
+
+    lo = min(float(arr.min()) for arr in nonempty)
+    hi = max(float(arr.max()) for arr in nonempty)
+    if lo == hi:
+        lo -= 0.5
+        hi += 0.5
+    return np.linspace(lo, hi, bins + 1)
+
+
+def _bin_counts(data_arr: np.ndarray, bin_edges: np.ndarray) -> np.ndarray:
+    """
+    Count data into uniform bins.
+
+    Uses fast-histogram when installed (no searchsorted, no input
+    validation), otherwise numpy.histogram. Either way the last bin is
+    closed on the right, as in numpy.
+
+    fast-histogram does not re-check values against the edges, so a value
+    lying exactly on an internal edge can be counted in the bin below it.
+    Integer-valued data (e.g. simulated run totals) lands on edges often,
+    so it always goes through numpy.histogram and matches it exactly. For
+    other data the per-bin counts may differ from numpy for values within
+    rounding of an edge; the total is the same.
+
+    Args:
+        data_arr: 1-D numeric array
+        bin_edges: Uniform bin edges from _shared_bin_edges
+
+    Returns:
+        Array of len(bin_edges) - 1 counts
+    """
+    lo = float(bin_edges[0])
+    hi = float(bin_edges[-1])
+    bins = len(bin_edges) - 1
+
+    if FAST_HISTOGRAM_AVAILABLE and not _is_integral(data_arr):
+        counts = histogram1d(data_arr, bins=bins, range=(lo, hi))
+        # fast-histogram bins are half-open; include values on the right edge
+        counts[-1] += np.count_nonzero(data_arr == hi)
+        return counts
+
+    counts, _ = np.histogram(data_arr, bins=bins, range=(lo, hi))
+    return counts
+
+
+def _is_integral(data_arr: np.ndarray) -> bool:
+    """Whether every value in the array is a whole number."""
+    if np.issubdtype(data_arr.dtype, np.integer):
+        return True
+    return bool(np.all(data_arr == np.floor(data_arr)))
+
+
+def _add_mean_lines(ax: Axes, means: List[float], colors: List[str]) -> None:
+    """
+    Draw dashed full-height vertical lines at each mean as one artist.
+
+    Equivalent to one ax.axvline per mean, but batched into a single
+    LineCollection in x-data / y-axes coordinates so the draw cost does
+    not grow with the number of overlays.
+
+    Args:
+        ax: Matplotlib Axes object to plot on
+        means: X positions of the lines
+        colors: Line colors (one per mean)
+    """
+    from matplotlib.collections import LineCollection
+
+    segments = [[(m, 0.0), (m, 1.0)] for m in means]
+    ax.add_collection(
+        LineCollection(
+            segments,
+            colors=colors[:len(means)],
+            linestyles='--',
+            linewidths=2,
+            alpha=0.8,
+            transform=ax.get_xaxis_transform(),
+        ),
+        # y spans the axes, not data; means lie within the plotted data
+        autolim=False,
+    )
 
 
 def create_histogram_with_kde(
@@ -38,8 +252,13 @@ def create_histogram_with_kde(
     """
     Create a histogram with KDE (kernel density estimate) overlay.
 
-    Uses seaborn's histplot with kde=True for smooth distribution
-    visualization. Adds optional mean/median vertical lines with labels.
+    Bins the data once (fast-histogram when installed, else numpy) and
+    draws the bars directly, avoiding seaborn's DataFrame conversion
+    overhead on large simulation outputs. The bars and the KDE overlay
+    share one fine-grid binning pass; the KDE is computed by FFT
+    convolution on that grid, so its cost does not grow with the number
+    of samples. Adds optional mean/median vertical lines with
+    labels.
 
     Args:
         ax: Matplotlib Axes object to plot on
@@ -54,8 +273,8 @@ def create_histogram_with_kde(
         alpha: Bar transparency (default: 0.7)
 
     Note:
-        Does NOT call sns.set_theme() to avoid modifying global matplotlib
-        state. The ax parameter is passed explicitly to seaborn.
+        Does NOT modify global matplotlib state. All drawing goes through
+        the ax parameter.
     """
     # Convert to numpy array for consistent handling
     data_arr = np.asarray(data)
@@ -74,21 +293,32 @@ def create_histogram_with_kde(
         ax.set_yticks([])
         return
 
-    # Create histogram with KDE overlay
-    # Pass ax explicitly to avoid global state changes
-    sns.histplot(
-        data_arr,
-        kde=True,
-        ax=ax,
-        bins=bins,
+    # Bin once onto a fine grid that subdivides each display bin evenly.
+    # The display counts are sums of whole fine bins, and the same fine
+    # counts feed the KDE, so the samples are only binned in one pass.
+    coarse_edges = _shared_bin_edges([data_arr], bins)
+    fine_per_bin = -(-KDE_GRID_SIZE // bins)
+    fine_edges = np.linspace(coarse_edges[0], coarse_edges[-1], bins * fine_per_bin + 1)
+    fine_counts = _bin_counts(data_arr, fine_edges)
+    counts = fine_counts.reshape(bins, fine_per_bin).sum(axis=1)
+    bin_edges = fine_edges[::fine_per_bin]
+    ax.bar(
+        bin_edges[:-1],
+        counts,
+        width=np.diff(bin_edges),
+        align='edge',
         alpha=alpha,
         color=color,
         edgecolor='black',
         linewidth=0.5,
     )
 
+    # KDE overlay (FFT-smoothed fine histogram)
+    n, mean_val, m2 = _mean_m2(data_arr.astype(float, copy=False))
+    bin_width = float(bin_edges[1] - bin_edges[0])
+    _plot_kde(ax, fine_counts, fine_edges, n, m2, bin_width, color)
+
     # Calculate statistics
-    mean_val = float(np.mean(data_arr))
     median_val = float(np.median(data_arr))
 
     # Add mean line
@@ -140,12 +370,13 @@ def create_comparison_overlay(
     title: Optional[str] = None,
     xlabel: str = 'Runs per Season',
     ylabel: str = 'Frequency',
-) -> None:
+) -> Optional[Dict[str, float]]:
     """
     Create overlaid histograms for comparing two distributions.
 
-    Uses step histograms for clarity when overlaying. Adds mean lines
-    for each distribution with difference annotation.
+    Bins both distributions against shared edges (fast-histogram when
+    installed, else numpy) and draws them as filled step outlines for clarity when overlaying. Adds
+    mean lines for each distribution with difference annotation.
 
     Args:
         ax: Matplotlib Axes object to plot on
@@ -159,6 +390,11 @@ def create_comparison_overlay(
         title: Optional chart title
         xlabel: X-axis label (default: 'Runs per Season')
         ylabel: Y-axis label (default: 'Frequency')
+
+    Returns:
+        Summary statistics dict with keys n1, mean1, std1, n2, mean2, std2
+        (std uses ddof=1), suitable for passing to add_effect_size_annotation
+        as stats. None if either distribution is empty.
     """
     # Default colors
     if colors is None:
@@ -180,54 +416,35 @@ def create_comparison_overlay(
         )
         ax.set_xticks([])
         ax.set_yticks([])
-        return
+        return None
 
     # Calculate common bin edges for fair comparison
-    all_data = np.concatenate([data1_arr, data2_arr])
-    bin_edges = np.histogram_bin_edges(all_data, bins=bins).tolist()
-
-    # Create overlaid step histograms
-    ax.hist(
-        data1_arr,
-        bins=bin_edges,
-        alpha=alpha,
-        color=colors[0],
-        edgecolor=colors[0],
-        linewidth=1.5,
-        histtype='stepfilled',
-        label=label1,
-    )
-    ax.hist(
-        data2_arr,
-        bins=bin_edges,
-        alpha=alpha,
-        color=colors[1],
-        edgecolor=colors[1],
-        linewidth=1.5,
-        histtype='stepfilled',
-        label=label2,
-    )
+    bin_edges = _shared_bin_edges([data1_arr, data2_arr], bins)
+
+    # Bin both series against the shared edges, then draw filled steps
+    for data_arr, color, label in (
+        (data1_arr, colors[0], label1),
+        (data2_arr, colors[1], label2),
+    ):
+        counts = _bin_counts(data_arr, bin_edges)
+        ax.stairs(
+            counts,
+            bin_edges,
+            fill=True,
+            alpha=alpha,
+            color=color,
+            linewidth=1.5,
+            label=label,
+        )
 
-    # Calculate means
-    mean1 = float(np.mean(data1_arr))
-    mean2 = float(np.mean(data2_arr))
+    # Calculate summary statistics (reusable for effect size)
+    stats = _summary_stats(data1_arr, data2_arr)
+    mean1 = stats['mean1']
+    mean2 = stats['mean2']
     diff = mean2 - mean1
 
     # Add mean lines
-    ax.axvline(
-        mean1,
-        color=colors[0],
-        linestyle='--',
-        linewidth=2,
-        alpha=0.8,
-    )
-    ax.axvline(
-        mean2,
-        color=colors[1],
-        linestyle='--',
-        linewidth=2,
-        alpha=0.8,
-    )
+    _add_mean_lines(ax, [mean1, mean2], colors)
 
     # Add difference annotation
     diff_sign = '+' if diff >= 0 else ''
@@ -256,13 +473,36 @@ def create_comparison_overlay(
     # Add grid
     ax.grid(True, alpha=0.3)
 
+    return stats
+
+
+def _summary_stats(data1_arr: np.ndarray, data2_arr: np.ndarray) -> Dict[str, float]:
+    """
+    Compute n, mean and sample std (ddof=1) for a pair of distributions.
+
+    Args:
+        data1_arr: First distribution data
+        data2_arr: Second distribution data
+
+    Returns:
+        Dict with keys n1, mean1, std1, n2, mean2, std2
+    """
+    stats: Dict[str, float] = {}
+    for suffix, data_arr in (('1', data1_arr), ('2', data2_arr)):
+        n, mean, m2 = _mean_m2(data_arr.astype(float, copy=False))
+        stats[f'n{suffix}'] = n
+        stats[f'mean{suffix}'] = mean
+        stats[f'std{suffix}'] = float(np.sqrt(m2 / (n - 1))) if n > 1 else 0.0
+    return stats
+
 
 def add_effect_size_annotation(
     ax: Axes,
-    data1: ArrayLike,
-    data2: ArrayLike,
+    data1: Optional[ArrayLike] = None,
+    data2: Optional[ArrayLike] = None,
     x_position: float = 0.95,
     y_position: float = 0.85,
+    stats: Optional[Dict[str, float]] = None,
 ) -> float:
     """
     Calculate Cohen's d effect size and add annotation to chart.
@@ -280,30 +520,41 @@ def add_effect_size_annotation(
         data2: Second distribution data (treatment/comparison)
         x_position: X position in axes fraction (default: 0.95, right side)
         y_position: Y position in axes fraction (default: 0.85)
+        stats: Optional precomputed statistics as returned by
+            create_comparison_overlay. When given, data1/data2 are not
+            read and no pass is made over the arrays.
 
     Returns:
         Cohen's d value (positive means data2 > data1)
+
+    Example:
+        >>> stats = create_comparison_overlay(ax, data1, data2, 'A', 'B')
+        >>> add_effect_size_annotation(ax, stats=stats)
     """
-    # Convert to numpy arrays
-    data1_arr = np.asarray(data1)
-    data2_arr = np.asarray(data2)
+    if stats is None:
+        # Convert to numpy arrays
+        data1_arr = np.asarray(data1)
+        data2_arr = np.asarray(data2)
+
+        if len(data1_arr) < 2 or len(data2_arr) < 2:
+            return 0.0
+
+        # Calculate Cohen's d
+        # d = (mean2 - mean1) / pooled_std
+        n1, mean1, m2_1 = _mean_m2(data1_arr.astype(float, copy=False))
+        n2, mean2, m2_2 = _mean_m2(data2_arr.astype(float, copy=False))
+    else:
+        n1, mean1 = int(stats['n1']), stats['mean1']
+        n2, mean2 = int(stats['n2']), stats['mean2']
+        if n1 < 2 or n2 < 2:
+            return 0.0
 
-    if len(data1_arr) < 2 or len(data2_arr) < 2:
-        return 0.0
+        # Recover M2 from sample std: M2 = (n - 1) * std^2
+        m2_1 = (n1 - 1) * stats['std1'] ** 2
+        m2_2 = (n2 - 1) * stats['std2'] ** 2
 
-    # Calculate Cohen's d
-    # d = (mean2 - mean1) / pooled_std
-    mean1 = np.mean(data1_arr)
-    mean2 = np.mean(data2_arr)
-    std1 = np.std(data1_arr, ddof=1)
-    std2 = np.std(data2_arr, ddof=1)
-    n1 = len(data1_arr)
-    n2 = len(data2_arr)
-
-    # Pooled standard deviation
-    pooled_std = np.sqrt(
-        ((n1 - 1) * std1**2 + (n2 - 1) * std2**2) / (n1 + n2 - 2)
-    )
+    # Pooled standard deviation: (n-1) * var == M2, so pool M2 directly
+    pooled_std = np.sqrt((m2_1 + m2_2) / (n1 + n2 - 2))
 
     if pooled_std == 0:
         cohens_d = 0.0
@@ -354,18 +605,44 @@ def calculate_axis_lower_bound(data: ArrayLike, percentile: float = 1.0) -> floa
         >>> calculate_axis_lower_bound(data)
         685.5  # Shows all data with 5% padding
     """
-    data_arr = np.asarray(data)
+    data_arr = np.asarray(data, dtype=float)
+    n = len(data_arr)
 
-    if len(data_arr) == 0:
+    if n == 0:
         return 0.0
 
-    lower = float(np.percentile(data_arr, percentile))
-    data_range = float(np.max(data_arr)) - lower
+    # One partial sort yields both order statistics around the percentile
+    # (linear interpolation, as np.percentile) and the maximum
+    pos = percentile / 100.0 * (n - 1)
+    k = int(np.floor(pos))
+    k_next = min(k + 1, n - 1)
+    part = np.partition(data_arr, sorted({k, k_next, n - 1}))
+
+    lower = float(part[k] + (pos - k) * (part[k_next] - part[k]))
+    data_range = float(part[n - 1]) - lower
 
     # Add 5% padding below minimum
     return max(0.0, lower - data_range * 0.05)
 
 
+@lru_cache(maxsize=16)
+def _radar_angles(num_vars: int) -> np.ndarray:
+    """
+    Get closed-loop radar axis angles for a category count (cached).
+
+    Args:
+        num_vars: Number of radar categories
+
+    Returns:
+        Read-only array of num_vars + 1 angles, last equal to the first
+    """
+    angles = np.empty(num_vars + 1)
+    angles[:num_vars] = np.linspace(0, 2 * np.pi, num_vars, endpoint=False)
+    angles[num_vars] = angles[0]  # Complete the loop
+    angles.setflags(write=False)  # Shared between calls
+    return angles
+
+
 def create_radar_chart(
     ax: PolarAxes,
     categories: List[str],
@@ -376,7 +653,9 @@ def create_radar_chart(
     Create radar/spider chart comparing 1-4 players.
 
     Draws a polar chart with each category as an axis, allowing visual
-    comparison of player profiles across multiple dimensions.
+    comparison of player profiles across multiple dimensions. All players
+    are drawn through a single fill, outline and marker collection rather
+    than separate artists per player.
 
     Args:
         ax: Matplotlib Axes with polar projection (subplot_kw={'projection': 'polar'})
@@ -408,21 +687,53 @@ def create_radar_chart(
 
     num_vars = len(categories)
 
-    # Calculate angle for each axis
-    angles = np.linspace(0, 2 * np.pi, num_vars, endpoint=False).tolist()
-    angles += angles[:1]  # Complete the loop
+    # Angle for each axis (closed loop), cached per category count
+    angles = _radar_angles(num_vars)
 
-    # Get colors from Set2 colormap
-    colors = plt.cm.Set2(np.linspace(0, 1, len(values_dict)))
+    from matplotlib import colormaps
+    from matplotlib.collections import LineCollection, PolyCollection
+    from matplotlib.lines import Line2D
 
-    # Plot each player
-    for (name, values), color in zip(values_dict.items(), colors):
-        if len(values) != num_vars:
-            continue  # Skip if values don't match categories
+    # Get colors from Set2 colormap
+    colors = colormaps['Set2'](np.linspace(0, 1, len(values_dict)))
+
+    # Keep players whose values match the categories
+    players = [
+        (name, values, color)
+        for (name, values), color in zip(values_dict.items(), colors)
+        if len(values) == num_vars
+    ]
+
+    legend_handles = []
+    if players:
+        # Closed-loop polygon vertices for all players: (players, num_vars + 1, 2)
+        radii = np.empty((len(players), num_vars + 1))
+        radii[:, :num_vars] = [values for _, values, _ in players]
+        radii[:, num_vars] = radii[:, 0]  # Complete the loop
+        verts = np.stack([np.broadcast_to(angles, radii.shape), radii], axis=-1)
+        player_colors = np.array([color for _, _, color in players])
+
+        # One collection each for fills, outlines and vertex markers
+        ax.add_collection(PolyCollection(
+            verts,
+            facecolors=player_colors,
+            edgecolors=player_colors,
+            alpha=0.25,
+        ))
+        ax.add_collection(LineCollection(verts, colors=player_colors, linewidths=2))
+        ax.scatter(
+            verts[:, :num_vars, 0].ravel(),
+            verts[:, :num_vars, 1].ravel(),
+            c=np.repeat(player_colors, num_vars, axis=0),
+            s=36,
+            zorder=3,
+        )
 
-        values_plot = list(values) + [values[0]]  # Complete the loop
-        ax.plot(angles, values_plot, 'o-', linewidth=2, label=name, color=color)
-        ax.fill(angles, values_plot, alpha=0.25, color=color)
+        # Collections carry no per-player labels, so build legend proxies
+        legend_handles = [
+            Line2D([], [], color=color, marker='o', linewidth=2, label=name)
+            for name, _, color in players
+        ]
 
     # Set category labels
     ax.set_xticks(angles[:-1])
@@ -435,7 +746,8 @@ def create_radar_chart(
         ax.set_title(title, pad=20)
 
     # Add legend outside plot
-    ax.legend(loc='upper right', bbox_to_anchor=(1.3, 1.0))
+    if legend_handles:
+        ax.legend(handles=legend_handles, loc='upper right', bbox_to_anchor=(1.3, 1.0))
 
 
 def create_run_expectancy_chart(
@@ -478,10 +790,10 @@ def create_run_expectancy_chart(
 
     # Sort by slot number and prepare data
     slots = sorted(slot_data.keys())
-    values = [slot_data[s] for s in slots]
+    values = np.fromiter((slot_data[s] for s in slots), dtype=np.float64, count=len(slots))
 
     # Find highest contributor for highlighting
-    max_idx = values.index(max(values))
+    max_idx = int(values.argmax())
 
     # Create bar colors (highlight max)
     colors = ['steelblue'] * len(slots)
@@ -509,7 +821,7 @@ def create_run_expectancy_chart(
         ax.set_title(title)
 
     # Use meaningful axis limits if requested
-    if use_meaningful_axis and values:
+    if use_meaningful_axis and len(values):
         lower_bound = calculate_axis_lower_bound(values)
         ax.set_ylim(lower_bound, None)
 
@@ -517,6 +829,87 @@ def create_run_expectancy_chart(
     ax.grid(True, alpha=0.3, axis='y')
 
 
+class RunExpectancyChart:
+    """
+    Run expectancy bar chart that updates its artists in place.
+
+    The first update() draws the chart with create_run_expectancy_chart and
+    keeps the bar and label artists. Later updates with the same slots only
+    change bar heights, highlight colors, and label text/positions rather
+    than clearing the axes and rebuilding every artist. If the axes were
+    cleared in between (e.g. to show a placeholder), the chart is redrawn
+    from scratch.
+
+    Example:
+        >>> chart = RunExpectancyChart(ax, title='Average Runs by Slot')
+        >>> chart.update(slot_data)
+        >>> canvas.draw_idle()
+    """
+
+    def __init__(
+        self,
+        ax: Axes,
+        title: Optional[str] = None,
+        use_meaningful_axis: bool = True
+    ):
+        """
+        Initialize chart wrapper.
+
+        Args:
+            ax: Matplotlib Axes object to plot on
+            title: Optional chart title
+            use_meaningful_axis: If True, use calculate_axis_lower_bound for Y-axis
+        """
+        self.ax = ax
+        self.title = title
+        self.use_meaningful_axis = use_meaningful_axis
+        self._slots: List[int] = []
+        self._bars: List = []
+        self._labels: List = []
+
+    def _is_drawn(self) -> bool:
+        """Check whether the cached artists are still attached to the axes."""
+        return bool(self._bars) and self._bars[0] in self.ax.patches
+
+    def update(self, slot_data: Dict[int, float]) -> None:
+        """
+        Show new slot data, reusing existing artists when possible.
+
+        Args:
+            slot_data: Dictionary mapping slot (1-9) to average runs
+        """
+        slots = sorted(slot_data.keys())
+
+        if not slot_data or slots != self._slots or not self._is_drawn():
+            self.ax.clear()
+            create_run_expectancy_chart(
+                self.ax,
+                slot_data,
+                title=self.title,
+                use_meaningful_axis=self.use_meaningful_axis
+            )
+            self._slots = slots
+            self._bars = list(self.ax.patches)
+            self._labels = list(self.ax.texts)
+            return
+
+        values = np.fromiter((slot_data[s] for s in slots), dtype=np.float64, count=len(slots))
+        max_idx = int(values.argmax())
+
+        for i, (bar, label, val) in enumerate(zip(self._bars, self._labels, values)):
+            bar.set_height(val)
+            bar.set_facecolor('coral' if i == max_idx else 'steelblue')
+            label.set_y(val + 0.01)
+            label.set_text(f'{val:.2f}')
+
+        # Rescale to the new heights, then reapply the meaningful lower bound
+        self.ax.relim()
+        self.ax.set_autoscaley_on(True)
+        self.ax.autoscale_view(scalex=False)
+        if self.use_meaningful_axis:
+            self.ax.set_ylim(calculate_axis_lower_bound(values), None)
+
+
 def create_multi_overlay(
     ax: Axes,
     data_dict: Dict[str, ArrayLike],
@@ -538,7 +931,7 @@ def create_multi_overlay(
 
     Note:
         Limited to 4 distributions for visual clarity.
-        Uses common bin edges calculated from all data for fair comparison.
+        Uses common bin edges spanning all data for fair comparison.
 
     Example:
         >>> fig, ax = plt.subplots()
@@ -566,36 +959,32 @@ def create_multi_overlay(
     colors = ['steelblue', 'coral', 'forestgreen', 'darkorchid']
     items = list(data_dict.items())[:4]
 
-    # Calculate common bin edges from all data
-    all_data = np.concatenate([np.asarray(data) for _, data in items])
-    bin_edges = np.histogram_bin_edges(all_data, bins=bins).tolist()
+    arrays = [np.asarray(data) for _, data in items]
+
+    # Calculate common bin edges from per-array min/max (no concatenation)
+    bin_edges = _shared_bin_edges(arrays, bins)
 
     # Plot each distribution
-    for i, (label, data) in enumerate(items):
-        data_arr = np.asarray(data)
+    means = []
+    for i, ((label, _), data_arr) in enumerate(zip(items, arrays)):
         color = colors[i]
-        mean_val = float(np.mean(data_arr))
-
-        # Create step histogram
-        ax.hist(
-            data_arr,
-            bins=bin_edges,
+        _, mean_val, _ = _mean_m2(data_arr.astype(float, copy=False))
+        means.append(mean_val)
+
+        # Bin against shared edges and draw as a filled step histogram
+        counts = _bin_counts(data_arr, bin_edges)
+        ax.stairs(
+            counts,
+            bin_edges,
+            fill=True,
             alpha=0.4,
             color=color,
-            edgecolor=color,
             linewidth=1.5,
-            histtype='stepfilled',
             label=f"{label} (mean: {mean_val:.1f})"
         )
 
-        # Add mean line
-        ax.axvline(
-            mean_val,
-            color=color,
-            linestyle='--',
-            linewidth=2,
-            alpha=0.8
-        )
+    # Add mean lines
+    _add_mean_lines(ax, means, colors)
 
     # Set labels
     ax.set_xlabel('Runs per Season')
@@ -1,11 +1,90 @@
 """Configuration management for GUI settings."""
 
+import hashlib
 import json
+import logging
 import os
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize obj to indented JSON bytes (orjson when available).
+
+    Args:
+        obj: JSON-compatible object
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            obj,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes (orjson when available).
+
+    Both parsers raise json.JSONDecodeError subclasses on invalid input.
+
+    Args:
+        data: UTF-8 encoded JSON
+
+    Returns:
+        Parsed object
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _read_json(path: Path) -> Any:
+    """Read and parse a JSON file in a single read."""
+    with open(path, 'rb') as f:
+        return _loads(f.read())
+
+
+def _write_bytes_atomic(path: Path, data: bytes) -> None:
+    """Write data to path atomically.
+
+    The bytes are written to a temporary sibling file in a single write,
+    flushed to disk, and then moved over path with os.replace, so a crash
+    mid-save never leaves a truncated file behind.
+    """
+    tmp_path = path.with_name(path.name + '.tmp')
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _write_json(path: Path, obj: Any) -> None:
+    """Serialize obj and write it to path atomically."""
+    _write_bytes_atomic(path, _dumps(obj))
+
 
 class ConfigManager:
     """Manages saving and loading GUI configurations."""
@@ -29,6 +108,98 @@ class ConfigManager:
         self.lineups_dir = self.config_dir / 'lineups'
         self.lineups_dir.mkdir(exist_ok=True)
 
+        # Parsed team lineups files keyed by path, with
+        # the (mtime_ns, size) stamp they were parsed or written at
+        self._json_cache: Dict[Path, Tuple[Tuple[int, int], Any]] = {}
+
+        # Digest of the last payload written to each path, with the file's
+        # (mtime_ns, size) stamp right after that write
+        self._last_write: Dict[Path, Tuple[Tuple[int, int], bytes]] = {}
+
+    def _write_json_if_changed(self, path: Path, obj: Any) -> None:
+        """Write obj to path atomically, skipping the write if nothing changed.
+
+        The payload is serialized once and hashed. If it matches the last
+        payload this manager wrote to path and the file has not been
+        touched since (same mtime and size), the disk write is skipped.
+
+        Args:
+            path: JSON file to write
+            obj: JSON-compatible object
+        """
+        data = _dumps(obj)
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+
+        cached = self._last_write.get(path)
+        if cached is not None and cached[1] == digest:
+            try:
+                st = path.stat()
+                if (st.st_mtime_ns, st.st_size) == cached[0]:
+                    return
+            except FileNotFoundError:
+                pass  # Deleted since last write; write it again
+
+        _write_bytes_atomic(path, data)
+        st = path.stat()
+        self._last_write[path] = ((st.st_mtime_ns, st.st_size), digest)
+
+    def _cached_json(self, path: Path) -> Optional[Any]:
+        """Get the cached parse of path if the file is unchanged since.
+
+        Args:
+            path: JSON file previously read or written through the cache
+
+        Returns:
+            Cached parsed content, or None if not cached, changed, or missing
+        """
+        cached = self._json_cache.get(path)
+        if cached is None:
+            return None
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return None
+        return cached[1] if cached[0] == (st.st_mtime_ns, st.st_size) else None
+
+    def _write_json_cached(self, path: Path, obj: Any) -> None:
+        """Write obj to path atomically and cache it as the file's parse.
+
+        Args:
+            path: JSON file to write
+            obj: JSON-compatible object; not to be mutated afterwards
+        """
+        _write_json(path, obj)
+        st = path.stat()
+        self._json_cache[path] = ((st.st_mtime_ns, st.st_size), obj)
+
+    def _read_json_cached(self, path: Path) -> Any:
+        """Read a JSON file, reusing the last parse while the file is unchanged.
+
+        The file is re-parsed only when its modification time or size
+        differs from the cached copy. Callers must treat the returned
+        object as read-only since it is shared between calls.
+
+        Args:
+            path: JSON file to read
+
+        Returns:
+            Parsed JSON content
+
+        Raises:
+            FileNotFoundError: If path does not exist
+            json.JSONDecodeError: If the file is not valid JSON
+        """
+        st = path.stat()
+        stamp = (st.st_mtime_ns, st.st_size)
+
+        cached = self._json_cache.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        data = _read_json(path)
+        self._json_cache[path] = (stamp, data)
+        return data
+
     def save_gui_config(self, config: Dict[str, Any]) -> bool:
         """
         Save GUI configuration to file.
@@ -40,11 +211,10 @@ class ConfigManager:
             True if successful, False otherwise
         """
         try:
-            with open(self.gui_config_file, 'w') as f:
-                json.dump(config, f, indent=2)
+            self._write_json_if_changed(self.gui_config_file, config)
             return True
-        except Exception as e:
-            print(f"Error saving GUI config: {e}")
+        except Exception:
+            logger.exception("Error saving GUI config")
             return False
 
     def load_gui_config(self) -> Dict[str, Any]:
@@ -54,14 +224,12 @@ class ConfigManager:
         Returns:
             Dictionary of GUI settings, or empty dict if file doesn't exist
         """
-        if not self.gui_config_file.exists():
-            return {}
-
         try:
-            with open(self.gui_config_file, 'r') as f:
-                return json.load(f)
-        except Exception as e:
-            print(f"Error loading GUI config: {e}")
+            return _read_json(self.gui_config_file)
+        except FileNotFoundError:
+            return {}
+        except Exception:
+            logger.exception("Error loading GUI config")
             return {}
 
     def save_lineup(self, name: str, lineup_data: Dict[str, Any]) -> bool:
@@ -77,11 +245,10 @@ class ConfigManager:
         """
         try:
             filename = self.lineups_dir / f"{name}.json"
-            with open(filename, 'w') as f:
-                json.dump(lineup_data, f, indent=2)
+            self._write_json_if_changed(filename, lineup_data)
             return True
-        except Exception as e:
-            print(f"Error saving lineup '{name}': {e}")
+        except Exception:
+            logger.exception("Error saving lineup '%s'", name)
             return False
 
     def load_lineup(self, name: str) -> Optional[Dict[str, Any]]:
@@ -99,10 +266,9 @@ class ConfigManager:
             if not filename.exists():
                 return None
 
-            with open(filename, 'r') as f:
-                return json.load(f)
-        except Exception as e:
-            print(f"Error loading lineup '{name}': {e}")
+            return _read_json(filename)
+        except Exception:
+            logger.exception("Error loading lineup '%s'", name)
             return None
 
     def list_lineups(self) -> list:
@@ -113,9 +279,14 @@ class ConfigManager:
             List of lineup preset names
         """
         try:
-            return [f.stem for f in self.lineups_dir.glob('*.json')]
-        except Exception as e:
-            print(f"Error listing lineups: {e}")
+            # scandir yields names without building a Path per entry
+            with os.scandir(self.lineups_dir) as it:
+                return [
+                    entry.name[:-len('.json')] for entry in it
+                    if entry.name.endswith('.json') and entry.is_file()
+                ]
+        except OSError:
+            logger.exception("Error listing lineups")
             return []
 
     def delete_lineup(self, name: str) -> bool:
@@ -134,8 +305,8 @@ class ConfigManager:
                 filename.unlink()
                 return True
             return False
-        except Exception as e:
-            print(f"Error deleting lineup '{name}': {e}")
+        except Exception:
+            logger.exception("Error deleting lineup '%s'", name)
             return False
 
     def save_session(self, dashboard_state: Dict[str, Any]) -> None:
@@ -151,10 +322,9 @@ class ConfigManager:
         """
         try:
             session_file = self.config_dir / 'last_session.json'
-            with open(session_file, 'w') as f:
-                json.dump(dashboard_state, f, indent=2)
-        except IOError as e:
-            print(f"Error saving session state: {e}")
+            self._write_json_if_changed(session_file, dashboard_state)
+        except IOError:
+            logger.exception("Error saving session state")
 
     def load_session(self) -> Optional[Dict[str, Any]]:
         """
@@ -162,18 +332,16 @@ class ConfigManager:
 
         Returns:
             Dictionary containing dashboard state, or None if file doesn't exist
-            or is invalid.
+            or is invalid
         """
         session_file = self.config_dir / 'last_session.json'
 
-        if not session_file.exists():
-            return None
-
         try:
-            with open(session_file, 'r') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError) as e:
-            print(f"Error loading session state: {e}")
+            return _read_json(session_file)
+        except FileNotFoundError:
+            return None
+        except json.JSONDecodeError:
+            logger.exception("Error loading session state")
             return None
 
     def session_exists(self) -> bool:
@@ -185,12 +353,8 @@ class ConfigManager:
         """
         session_file = self.config_dir / 'last_session.json'
 
-        if not session_file.exists():
-            return False
-
         try:
-            with open(session_file, 'r') as f:
-                json.load(f)
+            _read_json(session_file)
             return True
         except (FileNotFoundError, json.JSONDecodeError):
             return False
@@ -211,6 +375,26 @@ class ConfigManager:
         """
         return self.lineups_dir / f"{team_code.lower()}_{season}.json"
 
+    def _get_team_lineups_data(self, team_code: str, season: int) -> Dict[str, Any]:
+        """Get the parsed lineups dict for a team/season.
+
+        The file is re-read whenever it has changed on disk (e.g. edited by
+        another instance), so saves never write back a stale copy.
+
+        Args:
+            team_code: Three-letter team code
+            season: Season year
+
+        Returns:
+            Dict mapping lineup name to lineup data. It is shared with the
+            cache; copy it before modifying.
+        """
+        lineups_file = self._get_team_lineups_file(team_code, season)
+        try:
+            return self._read_json_cached(lineups_file)
+        except FileNotFoundError:
+            return {}
+
     def save_team_lineup(
         self,
         team_code: str,
@@ -233,25 +417,21 @@ class ConfigManager:
         try:
             lineups_file = self._get_team_lineups_file(team_code, season)
 
-            # Load existing lineups
-            existing: Dict[str, Any] = {}
-            if lineups_file.exists():
-                with open(lineups_file, "r") as f:
-                    existing = json.load(f)
+            # Existing lineups, copied so the cached parse is left intact
+            existing = dict(self._get_team_lineups_data(team_code, season))
 
             # Add/update lineup
             existing[lineup_name] = {
-                "players": player_names,
+                "players": list(player_names),
                 "created_at": datetime.now().isoformat(),
             }
 
             # Save back
-            with open(lineups_file, "w") as f:
-                json.dump(existing, f, indent=2)
+            self._write_json_cached(lineups_file, existing)
 
             return True
-        except Exception as e:
-            print(f"Error saving team lineup: {e}")
+        except Exception:
+            logger.exception("Error saving team lineup")
             return False
 
     def load_team_lineups(self, team_code: str, season: int) -> List[Dict[str, Any]]:
@@ -266,21 +446,15 @@ class ConfigManager:
             List of lineup dictionaries with 'name', 'players', 'created_at'
         """
         try:
-            lineups_file = self._get_team_lineups_file(team_code, season)
-
-            if not lineups_file.exists():
-                return []
-
-            with open(lineups_file, "r") as f:
-                data = json.load(f)
+            data = self._get_team_lineups_data(team_code, season)
 
             # Convert dict to list of lineup dicts
             return [
                 {"name": name, **lineup_data}
                 for name, lineup_data in data.items()
             ]
-        except Exception as e:
-            print(f"Error loading team lineups: {e}")
+        except Exception:
+            logger.exception("Error loading team lineups")
             return []
 
     def delete_team_lineup(self, team_code: str, season: int, lineup_name: str) -> bool:
@@ -301,20 +475,18 @@ class ConfigManager:
             if not lineups_file.exists():
                 return False
 
-            with open(lineups_file, "r") as f:
-                data = json.load(f)
+            data = dict(self._get_team_lineups_data(team_code, season))
 
             if lineup_name not in data:
                 return False
 
             del data[lineup_name]
 
-            with open(lineups_file, "w") as f:
-                json.dump(data, f, indent=2)
+            self._write_json_cached(lineups_file, data)
 
             return True
-        except Exception as e:
-            print(f"Error deleting team lineup: {e}")
+        except Exception:
+            logger.exception("Error deleting team lineup")
             return False
 
     def get_team_lineup_names(self, team_code: str, season: int) -> List[str]:
@@ -327,6 +499,31 @@ class ConfigManager:
 
         Returns:
             List of lineup names
+
+        Note:
+            If the file has not been parsed yet and ijson is installed, only
+            the top-level keys are streamed from disk; the lineup bodies are
+            skipped without being materialized.
         """
+        lineups_file = self._get_team_lineups_file(team_code, season)
+        cached = self._cached_json(lineups_file)
+        if cached is not None:
+            return list(cached)
+
+        if IJSON_AVAILABLE:
+            try:
+                if not lineups_file.exists():
+                    return []
+
+                with open(lineups_file, 'rb') as f:
+                    return [
+                        value
+                        for prefix, event, value in ijson.parse(f)
+                        if prefix == '' and event == 'map_key'
+                    ]
+            except Exception:
+                logger.exception("Error listing team lineups")
+                return []
+
         lineups = self.load_team_lineups(team_code, season)
         return [lineup["name"] for lineup in lineups]
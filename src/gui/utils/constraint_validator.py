@@ -1,92 +1,171 @@
 """Validates lineup against constraints and applies constraint rules."""
 
-from typing import List, Dict, Any, Tuple, Optional
+from typing import List, Dict, Any, Tuple, Optional, Set, Iterable
 
 
-class ConstraintValidator:
-    """Validates and applies lineup constraints."""
+def _index_lineup(lineup: List[Optional[str]]) -> Dict[str, int]:
+    """
+    Map each player in a lineup to its (first) 0-based slot.
 
-    @staticmethod
-    def validate_constraint(constraint: Dict[str, Any], lineup: List[str], roster: List[str]) -> Tuple[bool, str]:
-        """
-        Validate a single constraint against current lineup.
+    Args:
+        lineup: Player names in batting order (None for empty slots)
 
-        Args:
-            constraint: Constraint dict with 'type' and constraint-specific fields
-            lineup: List of player names in batting order (9 players, None for empty slots)
-            roster: List of all available player names
+    Returns:
+        Dict of player name to slot index, matching list.index semantics
+    """
+    lineup_idx: Dict[str, int] = {}
+    for i, player in enumerate(lineup):
+        if player is not None:
+            lineup_idx.setdefault(player, i)
+    return lineup_idx
 
-        Returns:
-            Tuple of (is_valid, error_message)
-        """
-        constraint_type = constraint.get('type')
 
-        if constraint_type == 'fixed_position':
-            player = constraint.get('player')
-            position = constraint.get('position')  # 1-based index
+def _validate_fixed_position(
+    constraint: Dict[str, Any],
+    lineup: List[Optional[str]],
+    roster_set: Set[str],
+    lineup_idx: Dict[str, int],
+) -> Tuple[bool, str]:
+    """Player must bat at a fixed 1-based position."""
+    player = constraint.get('player')
+    position = constraint.get('position')  # 1-based index
+
+    if player not in roster_set:
+        return False, f"Player '{player}' not in roster"
+
+    if position is None:
+        return False, "Constraint missing 'position' field"
+
+    if position < 1 or position > 9:
+        return False, f"Position must be 1-9, got {position}"
+
+    # Check if player is in lineup at specified position
+    slot_idx = position - 1  # Convert to 0-based
+    if len(lineup) > slot_idx:
+        if lineup[slot_idx] != player:
+            return False, f"'{player}' must bat in position {position}"
+
+    return True, ""
+
+
+def _validate_batting_order(
+    constraint: Dict[str, Any],
+    lineup: List[Optional[str]],
+    roster_set: Set[str],
+    lineup_idx: Dict[str, int],
+) -> Tuple[bool, str]:
+    """player2 must bat somewhere after player1."""
+    player1 = constraint.get('player1')  # Bats first
+    player2 = constraint.get('player2')  # Bats after player1
+
+    if player1 not in roster_set or player2 not in roster_set:
+        return False, f"Players not in roster"
+
+    # Find positions
+    idx1 = lineup_idx.get(player1)
+    idx2 = lineup_idx.get(player2)
+
+    if idx1 is None or idx2 is None:
+        return True, ""  # Constraint doesn't apply if players not in lineup
+
+    if idx1 >= idx2:
+        return False, f"'{player2}' must bat after '{player1}'"
 
-            if player not in roster:
-                return False, f"Player '{player}' not in roster"
+    return True, ""
 
-            if position is None:
-                return False, "Constraint missing 'position' field"
 
-            if position < 1 or position > 9:
-                return False, f"Position must be 1-9, got {position}"
+def _validate_platoon(
+    constraint: Dict[str, Any],
+    lineup: List[Optional[str]],
+    roster_set: Set[str],
+    lineup_idx: Dict[str, int],
+) -> Tuple[bool, str]:
+    """Exactly one of player_a / player_b fills a 1-based position."""
+    player_a = constraint.get('player_a')
+    player_b = constraint.get('player_b')
+    position = constraint.get('position')  # 1-based
 
-            # Check if player is in lineup at specified position
-            lineup_idx = position - 1  # Convert to 0-based
-            if len(lineup) > lineup_idx:
-                if lineup[lineup_idx] != player:
-                    return False, f"'{player}' must bat in position {position}"
+    if player_a not in roster_set or player_b not in roster_set:
+        return False, f"Players not in roster"
 
-            return True, ""
+    if position is None:
+        return False, "Constraint missing 'position' field"
 
-        elif constraint_type == 'batting_order':
-            player1 = constraint.get('player1')  # Bats first
-            player2 = constraint.get('player2')  # Bats after player1
+    if position < 1 or position > 9:
+        return False, f"Position must be 1-9"
 
-            if player1 not in roster or player2 not in roster:
-                return False, f"Players not in roster"
+    slot_idx = position - 1
+    if len(lineup) > slot_idx and lineup[slot_idx] is not None:
+        if lineup[slot_idx] not in (player_a, player_b):
+            return False, f"Position {position} must be either '{player_a}' or '{player_b}'"
 
-            if player1 not in lineup or player2 not in lineup:
-                return True, ""  # Constraint doesn't apply if players not in lineup
+    # Check that both players are not in lineup simultaneously
+    if player_a in lineup_idx and player_b in lineup_idx:
+        return False, f"Cannot have both '{player_a}' and '{player_b}' in lineup (platoon)"
 
-            # Find positions
-            idx1 = lineup.index(player1)
-            idx2 = lineup.index(player2)
+    return True, ""
 
-            if idx1 >= idx2:
-                return False, f"'{player2}' must bat after '{player1}'"
 
-            return True, ""
+# Constraint type -> validator, looked up once per constraint
+_VALIDATORS = {
+    'fixed_position': _validate_fixed_position,
+    'batting_order': _validate_batting_order,
+    'platoon': _validate_platoon,
+}
 
-        elif constraint_type == 'platoon':
-            player_a = constraint.get('player_a')
-            player_b = constraint.get('player_b')
-            position = constraint.get('position')  # 1-based
 
-            if player_a not in roster or player_b not in roster:
-                return False, f"Players not in roster"
+class _MissingAsNone(dict):
+    """format_map mapping that renders absent constraint fields as None."""
 
-            if position is None:
-                return False, "Constraint missing 'position' field"
+    def __missing__(self, key: str) -> None:
+        return None
 
-            if position < 1 or position > 9:
-                return False, f"Position must be 1-9"
 
-            lineup_idx = position - 1
-            if len(lineup) > lineup_idx and lineup[lineup_idx] is not None:
-                if lineup[lineup_idx] not in [player_a, player_b]:
-                    return False, f"Position {position} must be either '{player_a}' or '{player_b}'"
+# Constraint type -> description template (rendered with str.format_map)
+_DESCRIPTIONS = {
+    'fixed_position': "{player} always bats #{position}",
+    'batting_order': "{player2} always bats after {player1}",
+    'platoon': "Platoon {player_a} / {player_b} at position #{position}",
+}
 
-            # Check that both players are not in lineup simultaneously
-            if player_a in lineup and player_b in lineup:
-                return False, f"Cannot have both '{player_a}' and '{player_b}' in lineup (platoon)"
 
-            return True, ""
+class ConstraintValidator:
+    """Validates and applies lineup constraints."""
+
+    @staticmethod
+    def validate_constraint(
+        constraint: Dict[str, Any],
+        lineup: List[str],
+        roster: Iterable[str],
+        roster_set: Optional[Set[str]] = None,
+        lineup_idx: Optional[Dict[str, int]] = None,
+    ) -> Tuple[bool, str]:
+        """
+        Validate a single constraint against current lineup.
 
-        return False, f"Unknown constraint type: {constraint_type}"
+        Args:
+            constraint: Constraint dict with 'type' and constraint-specific fields
+            lineup: List of player names in batting order (9 players, None for empty slots)
+            roster: List of all available player names
+            roster_set: Optional precomputed set(roster), for validating many
+                constraints against the same roster
+            lineup_idx: Optional precomputed player -> slot map (see
+                _index_lineup), for validating many constraints against the
+                same lineup
+
+        Returns:
+            Tuple of (is_valid, error_message)
+        """
+        if roster_set is None:
+            roster_set = set(roster)
+        if lineup_idx is None:
+            lineup_idx = _index_lineup(lineup)
+
+        validator = _VALIDATORS.get(constraint.get('type'))
+        if validator is None:
+            return False, f"Unknown constraint type: {constraint.get('type')}"
+
+        return validator(constraint, lineup, roster_set, lineup_idx)
 
     @staticmethod
     def validate_all_constraints(constraints: List[Dict], lineup: List[str], roster: List[str]) -> Tuple[bool, List[str]]:
@@ -104,8 +183,14 @@ class ConstraintValidator:
         errors = []
         all_valid = True
 
+        # Build lookups once rather than rescanning lineup/roster per constraint
+        roster_set = set(roster)
+        lineup_idx = _index_lineup(lineup)
+
         for constraint in constraints:
-            is_valid, error_msg = ConstraintValidator.validate_constraint(constraint, lineup, roster)
+            is_valid, error_msg = ConstraintValidator.validate_constraint(
+                constraint, lineup, roster, roster_set=roster_set, lineup_idx=lineup_idx
+            )
             if not is_valid:
                 all_valid = False
                 errors.append(error_msg)
@@ -126,6 +211,10 @@ class ConstraintValidator:
             Modified lineup with constraints applied (best effort)
         """
         result = lineup.copy()
+        roster_set = set(roster)
+
+        # Player -> slot, kept in sync with result as players are moved
+        positions = _index_lineup(result)
 
         # Apply fixed_position constraints first
         for constraint in constraints:
@@ -138,13 +227,18 @@ class ConstraintValidator:
 
                 position_idx = position - 1  # Convert to 0-based
 
-                if player in roster and 0 <= position_idx < 9:
+                if player in roster_set and 0 <= position_idx < 9:
                     # Remove player from current position if present
-                    if player in result:
-                        result[result.index(player)] = None
-
-                    # Place player at fixed position
+                    old_idx = positions.pop(player, None)
+                    if old_idx is not None:
+                        result[old_idx] = None
+
+                    # Place player at fixed position, displacing any occupant
+                    displaced = result[position_idx]
+                    if displaced is not None and positions.get(displaced) == position_idx:
+                        del positions[displaced]
                     result[position_idx] = player
+                    positions[player] = position_idx
 
         # Apply platoon constraints (exclude one player from roster if both present)
         for constraint in constraints:
@@ -152,12 +246,17 @@ class ConstraintValidator:
                 player_a = constraint.get('player_a')
                 player_b = constraint.get('player_b')
 
-                if player_a in result and player_b in result:
+                idx_a = positions.get(player_a)
+                idx_b = positions.get(player_b)
+
+                if idx_a is not None and idx_b is not None:
                     # Keep the first one, remove the second
-                    if result.index(player_a) < result.index(player_b):
-                        result[result.index(player_b)] = None
+                    if idx_a < idx_b:
+                        result[idx_b] = None
+                        del positions[player_b]
                     else:
-                        result[result.index(player_a)] = None
+                        result[idx_a] = None
+                        del positions[player_a]
 
         return result
 
@@ -172,22 +271,8 @@ class ConstraintValidator:
         Returns:
             Description string
         """
-        constraint_type = constraint.get('type')
-
-        if constraint_type == 'fixed_position':
-            player = constraint.get('player')
-            position = constraint.get('position')
-            return f"{player} always bats #{position}"
-
-        elif constraint_type == 'batting_order':
-            player1 = constraint.get('player1')
-            player2 = constraint.get('player2')
-            return f"{player2} always bats after {player1}"
-
-        elif constraint_type == 'platoon':
-            player_a = constraint.get('player_a')
-            player_b = constraint.get('player_b')
-            position = constraint.get('position')
-            return f"Platoon {player_a} / {player_b} at position #{position}"
+        template = _DESCRIPTIONS.get(constraint.get('type'))
+        if template is None:
+            return f"Unknown constraint: {constraint.get('type')}"
 
-        return f"Unknown constraint: {constraint_type}"
+        return template.format_map(_MissingAsNone(constraint))
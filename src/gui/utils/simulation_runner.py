@@ -1,20 +1,159 @@
 """Threading wrapper for running simulations without freezing the GUI."""
 
+import logging
+import multiprocessing
+import os
+import sys
 import threading
 import queue
 import time
-from typing import List, Dict, Any, Callable, Optional
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_EXCEPTION
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Dict, Any, Callable, Optional, Tuple
 import config
 from src.models.player import Player
-from src.simulation.batch import run_simulations
+from src.simulation.batch import simulate_seasons, build_results
+
+logger = logging.getLogger(__name__)
+
+# Runs of PARALLEL_MIN_ITERATIONS or more are split into this many
+# independently seeded chunks, whether they run in a process pool or one
+# after another in a thread. The count is fixed (not tied to the CPU count)
+# so a given seed reproduces the same results on every machine.
+PARALLEL_CHUNKS = 8
+
+# Below this many iterations, process start-up costs more than it saves.
+# Smaller runs use a single chunk seeded with the run's seed, matching
+# src.simulation.batch.run_simulations (the CLI) for the same seed.
+PARALLEL_MIN_ITERATIONS = 1000
+
+# How often the coordinating thread polls worker progress (seconds)
+PROGRESS_POLL_INTERVAL = 0.1
+
+
+# Guards the process-global config module while overrides are applied
+_config_lock = threading.Lock()
+
+
+def _apply_config_overrides(config_overrides: Dict[str, Any]) -> Dict[str, Any]:
+    """Apply overrides for existing config attributes in one dict update.
+
+    Keys that are not already config attributes are ignored. Callers in
+    the GUI process must hold _config_lock until the returned originals
+    have been restored with config.__dict__.update().
+
+    Args:
+        config_overrides: Dict of config parameters to override
+
+    Returns:
+        Original values of the overridden keys
+    """
+    namespace = config.__dict__
+    overrides = {k: v for k, v in config_overrides.items() if k in namespace}
+    original_values = {k: namespace[k] for k in overrides}
+    namespace.update(overrides)
+    return original_values
+
+
+def _chunk_plan(n_iterations: int, random_seed: Optional[int]) -> List[Tuple[int, Optional[int]]]:
+    """Split a run into its seeded chunks.
+
+    Runs below PARALLEL_MIN_ITERATIONS are one chunk with random_seed, so
+    they reproduce run_simulations() exactly. Larger runs are split into
+    PARALLEL_CHUNKS chunks seeded random_seed, random_seed + 1, ...; their
+    results depend only on the seed, but differ from a single-seed
+    run_simulations() call with the same seed.
+
+    Args:
+        n_iterations: Total seasons to simulate
+        random_seed: Seed for the run, or None for unseeded
+
+    Returns:
+        List of (iterations, seed) pairs in chunk order, skipping empty chunks
+    """
+    if n_iterations < PARALLEL_MIN_ITERATIONS:
+        return [(n_iterations, random_seed)] if n_iterations > 0 else []
+
+    base, extra = divmod(n_iterations, PARALLEL_CHUNKS)
+    plan = []
+    for i in range(PARALLEL_CHUNKS):
+        size = base + (1 if i < extra else 0)
+        if size > 0:
+            plan.append((size, None if random_seed is None else random_seed + i))
+    return plan
+
+
+def _concat_chunks(chunk_results: List[Dict[str, List[int]]]) -> Dict[str, List[int]]:
+    """Concatenate per-chunk season totals in chunk order."""
+    raw_data: Dict[str, List[int]] = {}
+    for chunk in chunk_results:
+        for key, values in chunk.items():
+            raw_data.setdefault(key, []).extend(values)
+    return raw_data
+
+
+def _run_chunk(
+    lineup: List[Player],
+    config_overrides: Dict[str, Any],
+    n_iterations: int,
+    n_games: int,
+    random_seed: Optional[int],
+    progress_queue,
+    stop_event,
+) -> Dict[str, List[int]]:
+    """Simulate one chunk of seasons in a worker process.
+
+    Config overrides are applied to the worker's own copy of the config
+    module, so the parent's module is never shared or mutated.
+
+    Args:
+        lineup: List of 9 Player objects
+        config_overrides: Dict of config parameters to override
+        n_iterations: Seasons to simulate in this chunk
+        n_games: Games per season
+        random_seed: Seed for this chunk
+        progress_queue: Manager queue receiving completed-iteration deltas
+        stop_event: Manager event set by the parent to request a stop
+
+    Returns:
+        Raw per-season totals from simulate_seasons
+    """
+    # Worker processes have their own config module; nothing to restore
+    _apply_config_overrides(config_overrides)
+
+    reported = 0
+
+    def progress_wrapper(current: int, total: int):
+        nonlocal reported
+        if stop_event.is_set():
+            raise InterruptedError("Simulation stopped by user")
+        progress_queue.put(current - reported)
+        reported = current
+
+    return simulate_seasons(
+        lineup,
+        n_iterations=n_iterations,
+        n_games=n_games,
+        random_seed=random_seed,
+        verbose=0,
+        progress_callback=progress_wrapper
+    )
 
 
 class SimulationRunner:
-    """Manages simulation execution in a separate thread."""
+    """Manages simulation execution off the GUI thread.
+
+    Large runs are split across a process pool so they use every core;
+    small runs, or environments where worker processes cannot be spawned
+    (e.g. frozen apps), run in a single background thread.
+    """
 
     def __init__(self):
         self.thread: Optional[threading.Thread] = None
         self.stop_flag = threading.Event()
+        # Unlocked mirror of stop_flag for hot-path checks; a bool attribute
+        # read/write is atomic under the GIL, unlike Event.is_set()'s lock
+        self._stop = False
         self.progress_queue = queue.Queue()
         self.result_queue = queue.Queue()
 
@@ -34,6 +173,7 @@ class SimulationRunner:
             progress_callback: Called with (current, total) on progress updates
             complete_callback: Called with results dict when complete
         """
+        self._stop = False
         self.stop_flag.clear()
         self.thread = threading.Thread(
             target=self._run_simulation,
@@ -49,55 +189,188 @@ class SimulationRunner:
         progress_callback: Optional[Callable],
         complete_callback: Optional[Callable]
     ):
-        """Worker thread that runs the simulation."""
-        try:
-            # Save original config values
-            original_values = {}
-            for key, value in config_overrides.items():
-                if hasattr(config, key):
-                    original_values[key] = getattr(config, key)
-                    setattr(config, key, value)
-
-            # Define progress callback wrapper
-            def progress_wrapper(current: int, total: int):
-                if self.stop_flag.is_set():
-                    raise InterruptedError("Simulation stopped by user")
-                if progress_callback:
-                    progress_callback(current, total)
+        """Worker thread that runs (or coordinates) the simulation."""
+        n_iterations = config_overrides.get('n_iterations', config.N_SIMULATIONS)
 
+        if self._can_parallelize(n_iterations):
             try:
-                # Run simulation with progress callback
-                results = run_simulations(
-                    lineup=lineup,
-                    n_iterations=config_overrides.get('n_iterations', config.N_SIMULATIONS),
-                    n_games=config_overrides.get('n_games', config.N_GAMES_PER_SEASON),
-                    random_seed=config_overrides.get('random_seed', config.RANDOM_SEED),
-                    verbose=config_overrides.get('verbosity', config.VERBOSITY),
-                    progress_callback=progress_wrapper
+                self._run_parallel(lineup, config_overrides, progress_callback, complete_callback)
+                return
+            except (OSError, NotImplementedError, BrokenProcessPool) as e:
+                # Worker processes unavailable; fall back to a single thread
+                logger.warning("Process pool unavailable, running in thread: %s", e)
+            except Exception as e:
+                logger.exception("Simulation failed")
+                if complete_callback:
+                    complete_callback({'error': str(e)})
+                return
+
+        self._run_serial(lineup, config_overrides, progress_callback, complete_callback)
+
+    @staticmethod
+    def _can_parallelize(n_iterations: int) -> bool:
+        """Whether a run is worth (and able to be) split across processes."""
+        if getattr(sys, 'frozen', False):
+            return False
+        return n_iterations >= PARALLEL_MIN_ITERATIONS and (os.cpu_count() or 1) > 1
+
+    def _run_parallel(
+        self,
+        lineup: List[Player],
+        config_overrides: Dict[str, Any],
+        progress_callback: Optional[Callable],
+        complete_callback: Optional[Callable]
+    ):
+        """Split iterations into seeded chunks and run them in a process pool.
+
+        Raises:
+            OSError, NotImplementedError, BrokenProcessPool: If worker
+                processes cannot be started (caller falls back to a thread)
+        """
+        n_iterations = config_overrides.get('n_iterations', config.N_SIMULATIONS)
+        n_games = config_overrides.get('n_games', config.N_GAMES_PER_SEASON)
+        random_seed = config_overrides.get('random_seed', config.RANDOM_SEED)
+
+        plan = _chunk_plan(n_iterations, random_seed)
+        n_workers = min(PARALLEL_CHUNKS, os.cpu_count() or 1)
+
+        # Spawn rather than fork: forking a process running Tk threads is unsafe
+        ctx = multiprocessing.get_context('spawn')
+        with ctx.Manager() as manager, ProcessPoolExecutor(max_workers=n_workers, mp_context=ctx) as executor:
+            progress_queue = manager.Queue()
+            stop_event = manager.Event()
+
+            futures = [
+                executor.submit(
+                    _run_chunk,
+                    lineup,
+                    config_overrides,
+                    size,
+                    n_games,
+                    seed,
+                    progress_queue,
+                    stop_event,
                 )
+                for size, seed in plan
+            ]
 
-                # Send results to callback
-                if complete_callback and not self.stop_flag.is_set():
-                    complete_callback(results)
+            completed = 0
+            pending = set(futures)
+            while pending:
+                _, pending = wait(pending, timeout=PROGRESS_POLL_INTERVAL, return_when=FIRST_EXCEPTION)
 
-            except InterruptedError:
-                # Simulation was stopped - send None to indicate interruption
-                if complete_callback:
-                    complete_callback(None)
+                if self._stop:
+                    stop_event.set()
+
+                # Drain progress deltas reported by the workers
+                while True:
+                    try:
+                        completed += progress_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                if progress_callback and completed:
+                    progress_callback(completed, n_iterations)
+
+                if any(f.done() and f.exception() is not None for f in futures):
+                    stop_event.set()  # Stop the other chunks early
+                    break
+
+            # Wait for remaining chunks to wind down before reading results
+            wait(futures)
+
+        errors = [f.exception() for f in futures if f.exception() is not None]
+        if errors and isinstance(errors[0], BrokenProcessPool) and completed == 0:
+            raise errors[0]  # Workers never ran; let the caller fall back
+
+        if self._stop or any(isinstance(e, InterruptedError) for e in errors):
+            if complete_callback:
+                complete_callback(None)
+            return
+
+        if errors:
+            logger.error("Simulation chunk failed", exc_info=errors[0])
+            if complete_callback:
+                complete_callback({'error': str(errors[0])})
+            return
+
+        # Concatenate chunk totals in chunk order, then summarize once
+        raw_data = _concat_chunks([future.result() for future in futures])
+
+        try:
+            results = build_results(raw_data, n_games, lineup)
+        except Exception as e:
+            logger.exception("Failed to summarize simulation results")
+            if complete_callback:
+                complete_callback({'error': str(e)})
+            return
+
+        if complete_callback:
+            complete_callback(results)
+
+    def _run_serial(
+        self,
+        lineup: List[Player],
+        config_overrides: Dict[str, Any],
+        progress_callback: Optional[Callable],
+        complete_callback: Optional[Callable]
+    ):
+        """Run the simulation's chunks one after another in the current thread.
+
+        Uses the same seeded chunks as _run_parallel (see _chunk_plan), so
+        both paths give identical results for a given seed.
+        """
+        n_iterations = config_overrides.get('n_iterations', config.N_SIMULATIONS)
+        n_games = config_overrides.get('n_games', config.N_GAMES_PER_SEASON)
+        random_seed = config_overrides.get('random_seed', config.RANDOM_SEED)
 
-            finally:
-                # Restore original config values
-                for key, value in original_values.items():
-                    setattr(config, key, value)
+        completed = 0
+
+        # Define progress callback wrapper (reports progress across all chunks)
+        def progress_wrapper(current: int, total: int):
+            if self._stop:
+                raise InterruptedError("Simulation stopped by user")
+            if progress_callback:
+                progress_callback(completed + current, n_iterations)
+
+        try:
+            # config is process-global; hold the lock while it is overridden
+            with _config_lock:
+                original_values = _apply_config_overrides(config_overrides)
+                try:
+                    chunk_results = []
+                    for size, seed in _chunk_plan(n_iterations, random_seed):
+                        chunk_results.append(simulate_seasons(
+                            lineup,
+                            n_iterations=size,
+                            n_games=n_games,
+                            random_seed=seed,
+                            verbose=0,
+                            progress_callback=progress_wrapper
+                        ))
+                        completed += size
+                    results = build_results(_concat_chunks(chunk_results), n_games, lineup)
+                except InterruptedError:
+                    # Simulation was stopped - None indicates interruption
+                    results = None
+                finally:
+                    # Restore original config values
+                    config.__dict__.update(original_values)
 
         except Exception as e:
+            logger.exception("Simulation failed")
             # Send error to callback
             if complete_callback:
                 complete_callback({'error': str(e)})
+            return
+
+        # Send results to callback
+        if complete_callback and (results is None or not self._stop):
+            complete_callback(results)
 
     def stop(self):
         """Stop the running simulation."""
-        self.stop_flag.set()
+        self._stop = True
+        self.stop_flag.set()  # Kept for callers that wait() on the event
 
     def is_running(self) -> bool:
         """Check if a simulation is currently running."""
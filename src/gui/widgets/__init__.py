@@ -1,17 +1,43 @@
-"""GUI widgets package."""
-
-from .collapsible_frame import CollapsibleFrame
-from .labeled_slider import LabeledSlider
-from .player_list import PlayerList
-from .lineup_builder import LineupBuilder
-from .lineup_treeview import LineupTreeview
-from .constraint_dialog import ConstraintDialog
-from .summary_card import SummaryCard
-from .comparison_table import ComparisonTable
-from .player_contribution_chart import PlayerContributionChart
-from .optimization_preview import LineupRankingList, LineupDiffView
-from .seed_control import SeedControl
-from .visuals_panel import VisualsPanel
+"""GUI widgets package.
+
+Widgets are imported lazily on first attribute access (PEP 562), so
+importing one widget does not pull in every other widget's dependencies
+(e.g. matplotlib for the chart widgets).
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .collapsible_frame import CollapsibleFrame
+    from .labeled_slider import LabeledSlider
+    from .player_list import PlayerList
+    from .lineup_builder import LineupBuilder
+    from .lineup_treeview import LineupTreeview
+    from .constraint_dialog import ConstraintDialog
+    from .summary_card import SummaryCard
+    from .comparison_table import ComparisonTable
+    from .player_contribution_chart import PlayerContributionChart
+    from .optimization_preview import LineupRankingList, LineupDiffView
+    from .seed_control import SeedControl
+    from .visuals_panel import VisualsPanel
+
+# Exported name -> submodule that defines it
+_WIDGET_MODULES = {
+    'CollapsibleFrame': 'collapsible_frame',
+    'LabeledSlider': 'labeled_slider',
+    'PlayerList': 'player_list',
+    'LineupBuilder': 'lineup_builder',
+    'LineupTreeview': 'lineup_treeview',
+    'ConstraintDialog': 'constraint_dialog',
+    'SummaryCard': 'summary_card',
+    'ComparisonTable': 'comparison_table',
+    'PlayerContributionChart': 'player_contribution_chart',
+    'LineupRankingList': 'optimization_preview',
+    'LineupDiffView': 'optimization_preview',
+    'SeedControl': 'seed_control',
+    'VisualsPanel': 'visuals_panel',
+}
 
 __all__ = [
     'CollapsibleFrame',
@@ -28,3 +54,19 @@ __all__ = [
     'SeedControl',
     'VisualsPanel',
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a widget's submodule on first access and cache the class."""
+    module_name = _WIDGET_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(f'.{module_name}', __name__)
+    value = getattr(module, name)
+    globals()[name] = value  # Later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -4,6 +4,7 @@ import tkinter as tk
 from tkinter import ttk
 from typing import List, Dict, Any, Optional
 from src.models.player import Player
+from src.gui.models.constraint import Constraint
 
 
 class ConstraintDialog(tk.Toplevel):
@@ -26,19 +27,46 @@ class ConstraintDialog(tk.Toplevel):
 
         self.players = players
         self.player_names = [p.name for p in players]
+        self._player_name_set = frozenset(self.player_names)  # O(1) membership
+        self._combo_values = tuple(self.player_names)  # Shared by every player combobox
         self.result: Optional[Dict[str, Any]] = None
         self.constraint_type = tk.StringVar(value='fixed_position')
 
+        # Constraint type -> (create fields, set fields from constraint, collect result)
+        self._type_handlers = {
+            'fixed_position': (
+                self._create_fixed_position_fields,
+                self._set_fixed_position_values,
+                self._collect_fixed_position,
+            ),
+            'batting_order': (
+                self._create_batting_order_fields,
+                self._set_batting_order_values,
+                self._collect_batting_order,
+            ),
+            'platoon': (
+                self._create_platoon_fields,
+                self._set_platoon_values,
+                self._collect_platoon,
+            ),
+        }
+
         # Create widgets
         self._create_widgets(constraint)
 
-        # Center on parent
-        self.update_idletasks()
-        width = self.winfo_width()
-        height = self.winfo_height()
+        # Center on parent once the pending layout pass has run, rather than
+        # forcing one synchronously with update_idletasks()
+        self.after_idle(self._center_on_parent, parent)
+
+    def _center_on_parent(self, parent):
+        """Position the dialog over the center of its parent window."""
+        if not self.winfo_exists():
+            return  # Closed before the idle callback ran
+        width = self.winfo_reqwidth()
+        height = self.winfo_reqheight()
         x = parent.winfo_x() + (parent.winfo_width() // 2) - (width // 2)
         y = parent.winfo_y() + (parent.winfo_height() // 2) - (height // 2)
-        self.geometry(f'{width}x{height}+{x}+{y}')
+        self.geometry(f'+{x}+{y}')
 
     def _create_widgets(self, constraint: Optional[Dict]):
         """Create dialog widgets."""
@@ -79,16 +107,29 @@ class ConstraintDialog(tk.Toplevel):
         self.fields_frame = ttk.LabelFrame(main_frame, text="Constraint Details", padding=10)
         self.fields_frame.grid(row=2, column=0, columnspan=2, sticky='ew', pady=10)
 
+        # Build every type's fields once; type changes only swap frames
+        self._field_frames: Dict[str, ttk.Frame] = {}
+        for constraint_type, handlers in self._type_handlers.items():
+            frame = ttk.Frame(self.fields_frame)
+            handlers[0](frame)
+            self._field_frames[constraint_type] = frame
+
+        # Validate an edited constraint once against the roster; unknown
+        # types open with the default fields
+        existing = Constraint.from_dict(constraint, self._player_name_set) if constraint else None
+        if existing and existing.type not in self._type_handlers:
+            existing = None
+
         # Set initial type if editing
-        if constraint:
-            self.constraint_type.set(constraint.get('type', 'fixed_position'))
+        if existing:
+            self.constraint_type.set(existing.type)
 
-        # Create initial fields
+        # Show initial fields
         self._on_type_change()
 
         # Set values if editing
-        if constraint:
-            self._set_constraint_values(constraint)
+        if existing:
+            self._set_constraint_values(existing)
 
         # Buttons
         btn_frame = ttk.Frame(main_frame)
@@ -99,119 +140,122 @@ class ConstraintDialog(tk.Toplevel):
 
     def _on_type_change(self):
         """Handle constraint type change."""
-        # Clear existing fields
-        for widget in self.fields_frame.winfo_children():
-            widget.destroy()
-
-        constraint_type = self.constraint_type.get()
-
-        if constraint_type == 'fixed_position':
-            self._create_fixed_position_fields()
-        elif constraint_type == 'batting_order':
-            self._create_batting_order_fields()
-        elif constraint_type == 'platoon':
-            self._create_platoon_fields()
-
-    def _create_fixed_position_fields(self):
-        """Create fields for fixed position constraint."""
-        ttk.Label(self.fields_frame, text="Player:").grid(row=0, column=0, sticky='w', pady=5)
-        self.player_combo = ttk.Combobox(self.fields_frame, values=self.player_names, state='readonly', width=25)
+        for frame in self._field_frames.values():
+            frame.grid_remove()
+
+        frame = self._field_frames.get(self.constraint_type.get())
+        if frame is not None:
+            frame.grid(row=0, column=0, sticky='nsew')
+
+    def _create_fixed_position_fields(self, parent: ttk.Frame):
+        """Create fields for fixed position constraint in parent."""
+        ttk.Label(parent, text="Player:").grid(row=0, column=0, sticky='w', pady=5)
+        self.player_combo = self._create_player_combo(parent, 0)
         self.player_combo.grid(row=0, column=1, sticky='w', pady=5)
-        if self.player_names:
-            self.player_combo.current(0)
 
-        ttk.Label(self.fields_frame, text="Position (#1-9):").grid(row=1, column=0, sticky='w', pady=5)
-        self.position_spin = ttk.Spinbox(self.fields_frame, from_=1, to=9, width=10)
+        ttk.Label(parent, text="Position (#1-9):").grid(row=1, column=0, sticky='w', pady=5)
+        self.position_spin = ttk.Spinbox(parent, from_=1, to=9, width=10)
         self.position_spin.set(1)
         self.position_spin.grid(row=1, column=1, sticky='w', pady=5)
 
-    def _create_batting_order_fields(self):
-        """Create fields for batting order constraint."""
-        ttk.Label(self.fields_frame, text="Player (bats first):").grid(row=0, column=0, sticky='w', pady=5)
-        self.player1_combo = ttk.Combobox(self.fields_frame, values=self.player_names, state='readonly', width=25)
+    def _create_batting_order_fields(self, parent: ttk.Frame):
+        """Create fields for batting order constraint in parent."""
+        ttk.Label(parent, text="Player (bats first):").grid(row=0, column=0, sticky='w', pady=5)
+        self.player1_combo = self._create_player_combo(parent, 0)
         self.player1_combo.grid(row=0, column=1, sticky='w', pady=5)
-        if self.player_names:
-            self.player1_combo.current(0)
 
-        ttk.Label(self.fields_frame, text="Player (bats after):").grid(row=1, column=0, sticky='w', pady=5)
-        self.player2_combo = ttk.Combobox(self.fields_frame, values=self.player_names, state='readonly', width=25)
+        ttk.Label(parent, text="Player (bats after):").grid(row=1, column=0, sticky='w', pady=5)
+        self.player2_combo = self._create_player_combo(parent, 1)
         self.player2_combo.grid(row=1, column=1, sticky='w', pady=5)
-        if len(self.player_names) > 1:
-            self.player2_combo.current(1)
 
-    def _create_platoon_fields(self):
-        """Create fields for platoon constraint."""
-        ttk.Label(self.fields_frame, text="Player A:").grid(row=0, column=0, sticky='w', pady=5)
-        self.player_a_combo = ttk.Combobox(self.fields_frame, values=self.player_names, state='readonly', width=25)
+    def _create_platoon_fields(self, parent: ttk.Frame):
+        """Create fields for platoon constraint in parent."""
+        ttk.Label(parent, text="Player A:").grid(row=0, column=0, sticky='w', pady=5)
+        self.player_a_combo = self._create_player_combo(parent, 0)
         self.player_a_combo.grid(row=0, column=1, sticky='w', pady=5)
-        if self.player_names:
-            self.player_a_combo.current(0)
 
-        ttk.Label(self.fields_frame, text="Player B:").grid(row=1, column=0, sticky='w', pady=5)
-        self.player_b_combo = ttk.Combobox(self.fields_frame, values=self.player_names, state='readonly', width=25)
+        ttk.Label(parent, text="Player B:").grid(row=1, column=0, sticky='w', pady=5)
+        self.player_b_combo = self._create_player_combo(parent, 1)
         self.player_b_combo.grid(row=1, column=1, sticky='w', pady=5)
-        if len(self.player_names) > 1:
-            self.player_b_combo.current(1)
 
-        ttk.Label(self.fields_frame, text="Position (#1-9):").grid(row=2, column=0, sticky='w', pady=5)
-        self.position_spin = ttk.Spinbox(self.fields_frame, from_=1, to=9, width=10)
-        self.position_spin.set(1)
-        self.position_spin.grid(row=2, column=1, sticky='w', pady=5)
-
-    def _set_constraint_values(self, constraint: Dict):
-        """Set field values from existing constraint."""
-        constraint_type = constraint.get('type')
-
-        if constraint_type == 'fixed_position':
-            player = constraint.get('player')
-            position = constraint.get('position')
-            if player and player in self.player_names:
-                self.player_combo.set(player)
-            if position:
-                self.position_spin.set(position)
-
-        elif constraint_type == 'batting_order':
-            player1 = constraint.get('player1')
-            player2 = constraint.get('player2')
-            if player1 and player1 in self.player_names:
-                self.player1_combo.set(player1)
-            if player2 and player2 in self.player_names:
-                self.player2_combo.set(player2)
-
-        elif constraint_type == 'platoon':
-            player_a = constraint.get('player_a')
-            player_b = constraint.get('player_b')
-            position = constraint.get('position')
-            if player_a and player_a in self.player_names:
-                self.player_a_combo.set(player_a)
-            if player_b and player_b in self.player_names:
-                self.player_b_combo.set(player_b)
-            if position:
-                self.position_spin.set(position)
+        ttk.Label(parent, text="Position (#1-9):").grid(row=2, column=0, sticky='w', pady=5)
+        self.platoon_position_spin = ttk.Spinbox(parent, from_=1, to=9, width=10)
+        self.platoon_position_spin.set(1)
+        self.platoon_position_spin.grid(row=2, column=1, sticky='w', pady=5)
+
+    def _create_player_combo(self, parent: ttk.Frame, default_index: int) -> ttk.Combobox:
+        """
+        Create a read-only player combobox.
+
+        Args:
+            parent: Frame to create the combobox in
+            default_index: Index of the initially selected player
+
+        Returns:
+            The combobox (caller grids it)
+        """
+        combo = ttk.Combobox(parent, values=self._combo_values, state='readonly', width=25)
+        if default_index < len(self.player_names):
+            combo.current(default_index)
+        return combo
+
+    def _set_constraint_values(self, constraint: Constraint):
+        """Set field values from an existing (validated) constraint."""
+        self._type_handlers[constraint.type][1](constraint)
+
+    def _set_fixed_position_values(self, constraint: Constraint):
+        """Set fixed position fields from an existing constraint."""
+        if constraint.player:
+            self.player_combo.set(constraint.player)
+        if constraint.position:
+            self.position_spin.set(constraint.position)
+
+    def _set_batting_order_values(self, constraint: Constraint):
+        """Set batting order fields from an existing constraint."""
+        if constraint.player1:
+            self.player1_combo.set(constraint.player1)
+        if constraint.player2:
+            self.player2_combo.set(constraint.player2)
+
+    def _set_platoon_values(self, constraint: Constraint):
+        """Set platoon fields from an existing constraint."""
+        if constraint.player_a:
+            self.player_a_combo.set(constraint.player_a)
+        if constraint.player_b:
+            self.player_b_combo.set(constraint.player_b)
+        if constraint.position:
+            self.platoon_position_spin.set(constraint.position)
+
+    def _collect_fixed_position(self) -> Dict[str, Any]:
+        """Build a fixed position constraint from the fields."""
+        return {
+            'type': 'fixed_position',
+            'player': self.player_combo.get(),
+            'position': int(self.position_spin.get())
+        }
+
+    def _collect_batting_order(self) -> Dict[str, Any]:
+        """Build a batting order constraint from the fields."""
+        return {
+            'type': 'batting_order',
+            'player1': self.player1_combo.get(),
+            'player2': self.player2_combo.get()
+        }
+
+    def _collect_platoon(self) -> Dict[str, Any]:
+        """Build a platoon constraint from the fields."""
+        return {
+            'type': 'platoon',
+            'player_a': self.player_a_combo.get(),
+            'player_b': self.player_b_combo.get(),
+            'position': int(self.platoon_position_spin.get())
+        }
 
     def _on_ok(self):
         """Handle OK button."""
-        constraint_type = self.constraint_type.get()
-
-        if constraint_type == 'fixed_position':
-            self.result = {
-                'type': 'fixed_position',
-                'player': self.player_combo.get(),
-                'position': int(self.position_spin.get())
-            }
-        elif constraint_type == 'batting_order':
-            self.result = {
-                'type': 'batting_order',
-                'player1': self.player1_combo.get(),
-                'player2': self.player2_combo.get()
-            }
-        elif constraint_type == 'platoon':
-            self.result = {
-                'type': 'platoon',
-                'player_a': self.player_a_combo.get(),
-                'player_b': self.player_b_combo.get(),
-                'position': int(self.position_spin.get())
-            }
+        handlers = self._type_handlers.get(self.constraint_type.get())
+        if handlers:
+            self.result = handlers[2]()
 
         self.destroy()
 
@@ -4,6 +4,10 @@ import tkinter as tk
 from tkinter import ttk
 from typing import Callable, Optional
 
+# Slider drag events are coalesced so at most one update (and command
+# callback) runs per this many milliseconds (~one frame at 60 Hz)
+SLIDER_FLUSH_MS = 16
+
 
 class LabeledSlider(ttk.Frame):
     """Slider with label and entry field for value display/input."""
@@ -42,6 +46,13 @@ class LabeledSlider(ttk.Frame):
         self.format_str = format_str
         self.command = command
 
+        # Whole-number sliders (the default) skip the divide/multiply
+        self._snap = self._snap_unit if resolution == 1.0 else self._snap_step
+
+        # Pending coalesced slider update
+        self._pending_after: Optional[str] = None
+        self._pending_value: float = initial
+
         # Create variable
         self.var = tk.DoubleVar(value=initial)
 
@@ -66,41 +77,108 @@ class LabeledSlider(ttk.Frame):
         self.entry.grid(row=0, column=2, padx=(5, 0))
         self.entry.bind('<Return>', self._on_entry_change)
         self.entry.bind('<FocusOut>', self._on_entry_change)
+        # Typing makes the entry text differ from the last value we wrote
+        self.entry.bind('<Key>', self._on_entry_key)
+
+        # Tcl variable name of self.var, and the entry text last written
+        self._var_name = str(self.var)
+        self._last_text: Optional[str] = self.entry_var.get()
+        # True while the entry holds typed text that hasn't been committed
+        self._entry_edited = False
 
         # Configure column weights
         self.columnconfigure(1, weight=1)
 
     def _on_slider_change(self, value):
-        """Handle slider value change."""
-        float_val = float(value)
-        # Round to resolution
-        float_val = round(float_val / self.resolution) * self.resolution
-        # Clamp to range
-        float_val = max(self.from_, min(self.to, float_val))
+        """Handle slider value change.
+
+        Drag events arrive for every pixel of movement, so the snapped value
+        is recorded and applied at most once per SLIDER_FLUSH_MS.
+        """
+        self._pending_value = self._snap(float(value))
+        if self._pending_after is None:
+            self._pending_after = self.after(SLIDER_FLUSH_MS, self._flush_slider)
+
+    def _snap_step(self, value: float) -> float:
+        """Round value to the slider resolution, then clamp to range."""
+        value = round(value / self.resolution) * self.resolution
+        return max(self.from_, min(self.to, value))
 
-        self.var.set(float_val)
-        self.entry_var.set(self.format_str.format(float_val))
+    def _snap_unit(self, value: float) -> float:
+        """Round value to a whole number, then clamp to range."""
+        return max(self.from_, min(self.to, float(round(value))))
+
+    def _flush_slider(self):
+        """Apply the latest slider value and notify the command callback."""
+        self._pending_after = None
+        float_val = self._pending_value
+
+        # Don't overwrite text the user is in the middle of typing
+        typing = self._entry_edited and self._entry_has_focus()
+        self._show_value(float_val, update_entry=not typing)
 
         if self.command:
             self.command(float_val)
 
+    def _show_value(self, value: float, update_entry: bool = True):
+        """Write value to the slider variable and the entry text.
+
+        The variable is written with a single globalsetvar call, and the
+        entry is only rewritten when its formatted text actually changes.
+
+        Args:
+            value: Snapped, clamped value to display
+            update_entry: False to leave the entry text untouched
+        """
+        self.tk.globalsetvar(self._var_name, value)
+
+        if not update_entry:
+            self._last_text = None  # Entry no longer shows the last text
+            return
+
+        text = self.format_str.format(value)
+        if text != self._last_text:
+            self.entry_var.set(text)
+            self._last_text = text
+
+    def _entry_has_focus(self) -> bool:
+        """Check whether the entry field has keyboard focus."""
+        # Ask Tk directly; focus_get() can raise KeyError for widgets
+        # Tkinter didn't create (e.g. a combobox popdown)
+        return str(self.tk.call('focus')) == str(self.entry)
+
+    def _on_entry_key(self, event=None):
+        """Forget the cached entry text once the user starts typing."""
+        self._entry_edited = True
+        self._last_text = None
+
+    def _cancel_pending(self):
+        """Drop a scheduled slider update (superseded or widget going away)."""
+        if self._pending_after is not None:
+            self.after_cancel(self._pending_after)
+            self._pending_after = None
+
+    def destroy(self):
+        """Cancel any pending slider update before destroying the widget."""
+        self._cancel_pending()
+        super().destroy()
+
     def _on_entry_change(self, event=None):
         """Handle entry field value change."""
+        self._cancel_pending()
+        self._entry_edited = False
         try:
-            value = float(self.entry_var.get())
-            # Clamp to range
-            value = max(self.from_, min(self.to, value))
-            # Round to resolution
-            value = round(value / self.resolution) * self.resolution
+            value = self._snap(float(self.entry_var.get()))
 
-            self.var.set(value)
-            self.entry_var.set(self.format_str.format(value))
+            self._last_text = None  # Entry holds user text; always rewrite
+            self._show_value(value)
 
             if self.command:
                 self.command(value)
         except ValueError:
             # Invalid input - reset to current value
-            self.entry_var.set(self.format_str.format(self.var.get()))
+            self._last_text = self.format_str.format(self.var.get())
+            self.entry_var.set(self._last_text)
 
     def get(self) -> float:
         """Get current value."""
@@ -108,9 +186,10 @@ class LabeledSlider(ttk.Frame):
 
     def set(self, value: float):
         """Set value."""
+        self._cancel_pending()
+        self._entry_edited = False
         value = max(self.from_, min(self.to, value))
-        self.var.set(value)
-        self.entry_var.set(self.format_str.format(value))
+        self._show_value(value)
 
     def configure_command(self, command: Callable):
         """Set command callback."""
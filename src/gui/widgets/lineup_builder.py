@@ -1,11 +1,27 @@
 """Lineup builder widget with 9 batting order slots."""
 
+import contextlib
 import tkinter as tk
+from functools import lru_cache
 from tkinter import ttk
-from typing import List, Optional, Dict, Any
+from typing import Iterator, List, Optional, Dict, Any
 from src.models.player import Player
 from src.gui.widgets.lineup_treeview import LineupTreeview
 
+# Bound str.format for the BA/OBP/SLG slash line
+_SLASH_LINE = "{:.3f}/{:.3f}/{:.3f}".format
+
+
+@lru_cache(maxsize=512)
+def _format_player_text(name: str, pos_abbrev: str, ba: float, obp: float, slg: float) -> str:
+    """Format a player's position, name and slash line.
+
+    Cached on the displayed values themselves, so a player whose stats or
+    position are edited in place gets fresh text automatically.
+    """
+    pos_display = f"[{pos_abbrev}] " if pos_abbrev else ""
+    return f"{pos_display}{name} ({_SLASH_LINE(ba, obp, slg)})"
+
 
 class LineupBuilder(ttk.Frame):
     """Widget for building and managing 9-player lineup.
@@ -25,10 +41,20 @@ class LineupBuilder(ttk.Frame):
         super().__init__(parent, **kwargs)
 
         self.constraints: List[Dict[str, Any]] = []
-        self.locked_positions: set = set()  # Positions with constraints
+        self._roster_rows: Dict[int, int] = {}  # id(player) -> roster listbox row
+        self._rendered_rows: List[str] = []  # Roster listbox text, row by row
+        self._locked_mask: int = 0  # Bit i set = position i has a constraint
         self.roster: List[Player] = []
         self.team_data = None
 
+        # Nesting depth of batch_updates(), and whether a refresh was deferred
+        self._batch_depth = 0
+        self._refresh_pending = False
+
+        # Players whose roster rows await an idle-time update
+        self._pending_roster_players: Dict[int, Player] = {}
+        self._roster_after_id: Optional[str] = None
+
         # Configure grid weights for two-panel layout
         self.rowconfigure(0, weight=1)
         self.columnconfigure(0, weight=1)  # Roster panel (left)
@@ -113,6 +139,10 @@ class LineupBuilder(ttk.Frame):
         self.lineup_treeview = LineupTreeview(lineup_frame)
         self.lineup_treeview.grid(row=1, column=0, sticky='nsew')
 
+        # Ctrl+Up/Down move the selected player; plain arrows still navigate
+        self.lineup_treeview.tree.bind('<Control-Up>', self._on_move_up_key)
+        self.lineup_treeview.tree.bind('<Control-Down>', self._on_move_down_key)
+
     def _on_roster_double_click(self, event):
         """Handle double-click on roster player to add to lineup."""
         selection = self.roster_listbox.curselection()
@@ -122,30 +152,162 @@ class LineupBuilder(ttk.Frame):
         idx = selection[0]
         if 0 <= idx < len(self.roster):
             player = self.roster[idx]
-            # Add to first empty slot
-            if self.add_player(player):
-                self.refresh()
+            # Add to first empty slot (add_player updates the displays)
+            self.add_player(player)
+
+    def _on_move_up_key(self, event):
+        """Move the selected player up (Ctrl+Up)."""
+        self.move_up()
+        return 'break'
+
+    def _on_move_down_key(self, event):
+        """Move the selected player down (Ctrl+Down)."""
+        self.move_down()
+        return 'break'
+
+    @staticmethod
+    def _roster_row_text(player: Player, in_lineup: bool) -> str:
+        """Format one roster listbox row."""
+        pos_abbrev = player.position.abbrev if player.position else ""
+        text = _format_player_text(player.name, pos_abbrev, player.ba, player.obp, player.slg)
+        # Show if player is already in lineup
+        return "[IN LINEUP] " + text if in_lineup else text
+
+    @contextlib.contextmanager
+    def batch_updates(self) -> Iterator[None]:
+        """Defer refreshes until the outermost batch exits.
+
+        Reentrant: nested batches share one pending refresh, which runs
+        once when the outermost block exits (even if it raised).
+
+        Example:
+            with builder.batch_updates():
+                builder.set_lineup(lineup)
+                builder.apply_constraints(constraints)
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._refresh_pending:
+                self._refresh_pending = False
+                self._do_refresh()
 
     def refresh(self):
-        """Refresh both the roster and lineup displays."""
-        # Get current lineup from treeview
-        lineup = self.lineup_treeview.get_lineup()
+        """Refresh both the roster and lineup displays.
 
-        # Refresh roster listbox
-        self.roster_listbox.delete(0, tk.END)
+        Inside batch_updates() the refresh is deferred to the end of the batch.
+        """
+        if self._batch_depth:
+            self._refresh_pending = True
+        else:
+            self._do_refresh()
+
+    def _do_refresh(self):
+        """Redraw the roster listbox.
+
+        Roster rows are diffed against the text last rendered, so only rows
+        that changed are rewritten in the listbox.
+        """
+        # A full redraw covers any single-row updates still queued
+        self._pending_roster_players.clear()
+
+        rows = []
+        in_lineup_flags = []
         for player in self.roster:
-            # Show if player is already in lineup
-            in_lineup = player in lineup
-            prefix = "[IN LINEUP] " if in_lineup else ""
-            pos_abbrev = player.position.abbrev if player.position else ""
-            pos_display = f"[{pos_abbrev}] " if pos_abbrev else ""
-            text = f"{prefix}{pos_display}{player.name} ({player.ba:.3f}/{player.obp:.3f}/{player.slg:.3f})"
-            self.roster_listbox.insert(tk.END, text)
-
-            # Gray out players already in lineup
+            in_lineup = self.lineup_treeview.contains(player)
+            rows.append(self._roster_row_text(player, in_lineup))
+            in_lineup_flags.append(in_lineup)
+
+        # Roster row for each player, for single-row updates
+        self._roster_rows = {id(player): i for i, player in enumerate(self.roster)}
+
+        old_rows = self._rendered_rows
+        n_old = len(old_rows)
+        n_new = len(rows)
+        gray_idx = []
+
+        # Rewrite changed rows in place; a re-inserted row starts uncolored
+        for i in range(min(n_old, n_new)):
+            if rows[i] != old_rows[i]:
+                self.roster_listbox.delete(i)
+                self.roster_listbox.insert(i, rows[i])
+                if in_lineup_flags[i]:
+                    gray_idx.append(i)
+
+        # Trim or extend the tail
+        if n_old > n_new:
+            self.roster_listbox.delete(n_new, tk.END)
+        elif n_new > n_old:
+            self.roster_listbox.insert(tk.END, *rows[n_old:])
+            gray_idx.extend(i for i in range(n_old, n_new) if in_lineup_flags[i])
+
+        self._rendered_rows = rows
+
+        # Gray out players already in lineup, as one Tcl script rather than
+        # one itemconfig round-trip per row
+        if gray_idx:
+            path = str(self.roster_listbox)
+            self.tk.eval('\n'.join(f'{path} itemconfigure {i} -foreground gray' for i in gray_idx))
+
+    def _refresh_roster_rows(self, players: List[Optional[Player]]):
+        """Re-render only the roster rows of players whose lineup status changed.
+
+        Players not in the roster have no row and are skipped. Falls back to
+        a full refresh if the row index no longer matches the roster.
+
+        Args:
+            players: Players added to or removed from the lineup (None ignored)
+        """
+        for player in players:
+            if player is None:
+                continue
+            i = self._roster_rows.get(id(player))
+            if i is None:
+                continue
+            if i >= len(self.roster) or i >= len(self._rendered_rows) or self.roster[i] is not player:
+                self.refresh()
+                return
+
+            in_lineup = self.lineup_treeview.contains(player)
+            text = self._roster_row_text(player, in_lineup)
+            if text == self._rendered_rows[i]:
+                continue
+            self.roster_listbox.delete(i)
+            self.roster_listbox.insert(i, text)
             if in_lineup:
-                idx = self.roster_listbox.size() - 1
-                self.roster_listbox.itemconfig(idx, foreground='gray')
+                self.roster_listbox.itemconfig(i, foreground='gray')
+            self._rendered_rows[i] = text
+
+    def _schedule_roster_rows(self, players: List[Optional[Player]]):
+        """Queue roster row updates for when the event queue is idle.
+
+        Event handlers return immediately, and a burst of adds/removes
+        (e.g. adding several selected players) is drawn in one pass.
+
+        Args:
+            players: Players added to or removed from the lineup (None ignored)
+        """
+        for player in players:
+            if player is not None:
+                self._pending_roster_players[id(player)] = player
+        if self._pending_roster_players and self._roster_after_id is None:
+            self._roster_after_id = self.after_idle(self._flush_roster_rows)
+
+    def _flush_roster_rows(self):
+        """Apply roster row updates queued by _schedule_roster_rows."""
+        self._roster_after_id = None
+        players = list(self._pending_roster_players.values())
+        self._pending_roster_players.clear()
+        self._refresh_roster_rows(players)
+
+    def destroy(self):
+        """Cancel any queued roster update before destroying the widget."""
+        if self._roster_after_id is not None:
+            self.after_cancel(self._roster_after_id)
+            self._roster_after_id = None
+        super().destroy()
 
     def add_player(self, player: Player, position: Optional[int] = None) -> bool:
         """
@@ -158,49 +320,54 @@ class LineupBuilder(ttk.Frame):
         Returns:
             True if player was added, False otherwise
         """
+        # A player already in the slot is replaced; their row changes too
+        displaced = None
+        if position is not None and 0 <= position < 9:
+            displaced = self.lineup_treeview.get_player(position)
         result = self.lineup_treeview.add_player(player, position)
         if result:
-            self.refresh()
+            self._schedule_roster_rows([player, displaced])
         return result
 
     def remove_player(self):
         """Remove the selected player from lineup."""
         idx = self.lineup_treeview.get_selected_index()
-        if idx is not None and idx in self.locked_positions:
+        if idx is not None and self._is_locked(idx):
             return
-        self.lineup_treeview.remove_selected()
-        self.refresh()
+        removed = self.lineup_treeview.remove_selected()
+        self._schedule_roster_rows([removed])
 
     def move_up(self):
         """Move selected player up in batting order."""
         idx = self.lineup_treeview.get_selected_index()
         if idx is not None:
-            if idx in self.locked_positions or (idx - 1) in self.locked_positions:
+            if self._is_locked(idx) or self._is_locked(idx - 1):
                 return
+        # Reordering doesn't change who is in the lineup; roster rows stay as-is
         self.lineup_treeview.move_up()
-        self.refresh()
 
     def move_down(self):
         """Move selected player down in batting order."""
         idx = self.lineup_treeview.get_selected_index()
         if idx is not None:
-            if idx in self.locked_positions or (idx + 1) in self.locked_positions:
+            if self._is_locked(idx) or self._is_locked(idx + 1):
                 return
+        # Reordering doesn't change who is in the lineup; roster rows stay as-is
         self.lineup_treeview.move_down()
-        self.refresh()
 
     def clear_lineup(self):
         """Clear the entire lineup (except locked positions)."""
-        if not self.locked_positions:
-            self.lineup_treeview.clear_lineup()
-        else:
-            # Selectively clear non-locked positions
-            lineup = self.lineup_treeview.get_lineup()
-            for i in range(9):
-                if i not in self.locked_positions:
-                    lineup[i] = None
-            self.lineup_treeview.set_lineup(lineup)
-        self.refresh()
+        with self.batch_updates():
+            if not self._locked_mask:
+                self.lineup_treeview.clear_lineup()
+            else:
+                # Selectively clear non-locked positions
+                lineup = self.lineup_treeview.get_lineup()
+                for i in range(9):
+                    if not self._is_locked(i):
+                        lineup[i] = None
+                self.lineup_treeview.set_lineup(lineup)
+            self.refresh()
 
     def get_lineup(self) -> List[Optional[Player]]:
         """Get current lineup."""
@@ -213,8 +380,9 @@ class LineupBuilder(ttk.Frame):
         Args:
             lineup: List of 9 Player objects (or None for empty slots)
         """
-        self.lineup_treeview.set_lineup(lineup)
-        self.refresh()
+        with self.batch_updates():
+            self.lineup_treeview.set_lineup(lineup)
+            self.refresh()
 
     def apply_constraints(self, constraints: List[Dict[str, Any]]):
         """
@@ -224,25 +392,40 @@ class LineupBuilder(ttk.Frame):
             constraints: List of constraint dicts
         """
         self.constraints = constraints
-        self.locked_positions.clear()
+        mask = 0
 
         # Mark positions that have fixed_position constraints
         for constraint in constraints:
             if constraint.get('type') == 'fixed_position':
                 position = constraint.get('position')
                 if position and 1 <= position <= 9:
-                    self.locked_positions.add(position - 1)
+                    mask |= 1 << (position - 1)
 
-        self.refresh()
+        # Callers re-apply after every constraint edit (often the same list,
+        # mutated in place); skip the redraw when the locks didn't change
+        if mask == self._locked_mask:
+            return
+
+        with self.batch_updates():
+            self._locked_mask = mask
+            self.refresh()
+
+    def _is_locked(self, idx: int) -> bool:
+        """Check if lineup position idx (0-8) is locked by a constraint."""
+        return 0 <= idx < 9 and bool(self._locked_mask >> idx & 1)
+
+    @property
+    def locked_positions(self) -> set:
+        """Locked positions (0-8) as a new set, for backward compatibility."""
+        return {i for i in range(9) if self._locked_mask >> i & 1}
 
     def is_full(self) -> bool:
         """Check if lineup has all 9 players."""
-        lineup = self.lineup_treeview.get_lineup()
-        return all(player is not None for player in lineup)
+        return self.lineup_treeview.is_full()
 
     def is_valid(self) -> bool:
         """Check if lineup is valid (all 9 slots filled)."""
-        return self.is_full()
+        return self.lineup_treeview.is_full()
 
     def load_data(self, roster: List[Player], team_data) -> None:
         """
@@ -4,10 +4,50 @@
 """Spreadsheet-like lineup display widget with drag-and-drop reordering."""
 
 import tkinter as tk
+from functools import lru_cache
+from operator import itemgetter
 from tkinter import ttk
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set
 from src.models.player import Player
 
+# Free-slot mask with all 9 slot bits set
+FULL_MASK = (1 << 9) - 1
+
+
+def _format_stat_value(value: Optional[float], is_k_pct: bool = False) -> str:
+    """Format a stat value for display ('--' if missing)."""
+    if value is None:
+        return '--'
+    if is_k_pct:
+        return f"{value * 100:.1f}%"
+    return f"{value:.3f}"
+
+
+@lru_cache(maxsize=256)
+def _player_values(
+    pos: str,
+    name: str,
+    typical: int,
+    ba: Optional[float],
+    obp: Optional[float],
+    slg: Optional[float],
+    k_pct: Optional[float]
+) -> tuple:
+    """Format a filled slot's display values, minus the slot number.
+
+    Cached on the displayed values themselves, so a player whose stats or
+    position are edited in place gets fresh values automatically.
+    """
+    return (
+        pos,
+        name,
+        str(typical) if typical > 0 else '--',
+        _format_stat_value(ba),
+        _format_stat_value(obp),
+        _format_stat_value(slg),
+        _format_stat_value(k_pct, is_k_pct=True)
+    )
+
 
 class LineupTreeview(ttk.Frame):
     """Treeview-based lineup display with spreadsheet columns and drag-and-drop.
@@ -27,6 +67,12 @@ class LineupTreeview(ttk.Frame):
 
         # Internal lineup storage
         self._lineup: List[Optional[Player]] = [None] * 9
+        # Names of players in the lineup, for O(1) membership checks.
+        # Player is an unhashable dataclass; names identify players across
+        # roster reloads, as they do for constraints and saved sessions.
+        self._lineup_names: Set[str] = set()
+        # Bit i set = slot i is empty; the lowest set bit is the first free slot
+        self._free_mask = FULL_MASK
 
         # Configure grid weights
         self.rowconfigure(0, weight=1)
@@ -77,8 +123,19 @@ class LineupTreeview(ttk.Frame):
         # Configure tag for empty slots (gray text)
         self.tree.tag_configure('empty', foreground='gray')
 
-        # Initial display
-        self._refresh()
+        # One persistent row per slot; updates rewrite rows in place
+        self._items: List[str] = [self.tree.insert('', 'end') for _ in range(9)]
+        # Row item -> slot index; items never change slots
+        self._item_index: Dict[str, int] = {item: i for i, item in enumerate(self._items)}
+        # (values, tags) last written to each row, to skip unchanged rows
+        self._rendered: List[Optional[tuple]] = [None] * 9
+
+        # Rows awaiting a deferred redraw, and the pending after_idle id
+        self._dirty_rows: Set[int] = set()
+        self._flush_after_id: Optional[str] = None
+
+        # Initial display (drawn now so the widget never shows blank rows)
+        self._update_rows(range(9))
 
     def _on_press(self, event):
         """Handle mouse press - start drag operation."""
@@ -87,10 +144,8 @@ class LineupTreeview(ttk.Frame):
         if item:
             # Store the item being dragged
             self._drag_item = item
-            # Get the current index (slot number - 1)
-            values = self.tree.item(item, 'values')
-            if values:
-                self._drag_start_index = int(values[0]) - 1
+            # Get the current slot index
+            self._drag_start_index = self._item_index.get(item)
             # Store original selection
             self._original_selection = self.tree.selection()
 
@@ -114,12 +169,11 @@ class LineupTreeview(ttk.Frame):
             return
 
         # Get target index
-        target_values = self.tree.item(target_item, 'values')
-        if not target_values:
+        target_index = self._item_index.get(target_item)
+        if target_index is None:
             self._reset_drag_state()
             return
 
-        target_index = int(target_values[0]) - 1
         source_index = self._drag_start_index
 
         if source_index != target_index:
@@ -127,6 +181,7 @@ class LineupTreeview(ttk.Frame):
             player = self._lineup[source_index]
             self._lineup.pop(source_index)
             self._lineup.insert(target_index, player)
+            self._free_mask = self._compute_free_mask()
             self._refresh()
 
         self._reset_drag_state()
@@ -150,7 +205,7 @@ class LineupTreeview(ttk.Frame):
         games_by_slot = getattr(player, 'games_by_slot', None)
         if not games_by_slot:
             return 0
-        return max(games_by_slot.keys(), key=lambda k: games_by_slot.get(k, 0))
+        return max(games_by_slot.items(), key=itemgetter(1))[0]
 
     def _format_stat(self, value: Optional[float], is_k_pct: bool = False) -> str:
         """Format a stat value for display.
@@ -162,50 +217,112 @@ class LineupTreeview(ttk.Frame):
         Returns:
             Formatted string
         """
-        if value is None:
-            return '--'
-        if is_k_pct:
-            return f"{value * 100:.1f}%"
-        return f"{value:.3f}"
-
-    def _refresh(self):
-        """Refresh the treeview display."""
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        return _format_stat_value(value, is_k_pct)
 
-        # Add lineup items
+    def _compute_free_mask(self) -> int:
+        """Build the free-slot mask from the lineup list."""
+        mask = 0
         for i, player in enumerate(self._lineup):
-            slot = i + 1
             if player is None:
-                # Empty slot
-                values = (
-                    slot,
-                    '',
-                    '(empty)',
-                    '--',
-                    '--',
-                    '--',
-                    '--',
-                    '--'
-                )
-                self.tree.insert('', 'end', values=values, tags=('empty',))
+                mask |= 1 << i
+        return mask
+
+    def _swap_free_bits(self, lo: int):
+        """Swap the free bits of adjacent slots lo and lo + 1."""
+        pair = 0b11 << lo
+        bits = self._free_mask & pair
+        if bits and bits != pair:
+            # Exactly one of the two is free; swapping flips both
+            self._free_mask ^= pair
+
+    def _render_row(self, i: int) -> tuple:
+        """Build the display values and tags for one slot.
+
+        Args:
+            i: Slot index (0-8)
+
+        Returns:
+            Tuple of (values, tags) for the slot's treeview row
+        """
+        slot = i + 1
+        player = self._lineup[i]
+        if player is None:
+            # Empty slot
+            values = (
+                slot,
+                '',
+                '(empty)',
+                '--',
+                '--',
+                '--',
+                '--',
+                '--'
+            )
+            return values, ('empty',)
+
+        # Filled slot
+        pos = player.position.abbrev if player.position else ''
+        values = (slot,) + _player_values(
+            pos,
+            player.name,
+            self._calculate_typical_slot(player),
+            player.ba,
+            player.obp,
+            player.slg,
+            player.k_pct
+        )
+        return values, ()
+
+    def _update_rows(self, indices):
+        """Rewrite the given slots' rows in place, skipping unchanged rows.
+
+        Args:
+            indices: Slot indices (0-8) whose contents changed
+        """
+        for i in indices:
+            row = self._render_row(i)
+            old = self._rendered[i]
+            if row == old:
+                continue
+            values, tags = row
+            if old is not None and old[1] == tags:
+                # Same styling (e.g. a filled slot swapped with another);
+                # leave the row's tags alone
+                self.tree.item(self._items[i], values=values)
             else:
-                # Filled slot
-                pos = player.position.abbrev if player.position else ''
-                typical = self._calculate_typical_slot(player)
-                typical_str = str(typical) if typical > 0 else '--'
-                values = (
-                    slot,
-                    pos,
-                    player.name,
-                    typical_str,
-                    self._format_stat(player.ba),
-                    self._format_stat(player.obp),
-                    self._format_stat(player.slg),
-                    self._format_stat(player.k_pct, is_k_pct=True)
-                )
-                self.tree.insert('', 'end', values=values)
+                self.tree.item(self._items[i], values=values, tags=tags)
+            self._rendered[i] = row
+
+    def _schedule_rows(self, indices):
+        """Redraw the given slots' rows once the event queue is idle.
+
+        Every mutation goes through here, so a burst of changes (held
+        move keys, a programmatic rebuild) redraws each touched row once.
+
+        Args:
+            indices: Slot indices (0-8) whose contents changed
+        """
+        self._dirty_rows.update(indices)
+        if self._flush_after_id is None:
+            self._flush_after_id = self.after_idle(self._flush_rows)
+
+    def _flush_rows(self):
+        """Redraw rows queued by _schedule_rows."""
+        self._flush_after_id = None
+        rows = sorted(self._dirty_rows)
+        self._dirty_rows.clear()
+        self._update_rows(rows)
+
+    def destroy(self):
+        """Cancel any deferred redraw before destroying the widget."""
+        if self._flush_after_id is not None:
+            self.after_cancel(self._flush_after_id)
+            self._flush_after_id = None
+        super().destroy()
+
+    def _refresh(self):
+        """Refresh the whole treeview display at the next idle point."""
+        self._schedule_rows(range(9))
 
     def set_lineup(self, lineup: List[Optional[Player]]):
         """Set the lineup.
@@ -216,16 +333,31 @@ class LineupTreeview(ttk.Frame):
         if len(lineup) != 9:
             raise ValueError("Lineup must have exactly 9 slots")
         self._lineup = lineup.copy()
+        self._lineup_names = {p.name for p in self._lineup if p is not None}
+        self._free_mask = self._compute_free_mask()
         self._refresh()
 
     def get_lineup(self) -> List[Optional[Player]]:
         """Get current lineup.
 
+        Returns a copy; use get_player() to read a single slot without one.
+
         Returns:
             List of 9 Player objects (or None for empty slots)
         """
         return self._lineup.copy()
 
+    def get_player(self, slot: int) -> Optional[Player]:
+        """Get the player in one slot.
+
+        Args:
+            slot: Slot index (0-8)
+
+        Returns:
+            Player object, or None if the slot is empty
+        """
+        return self._lineup[slot]
+
     def add_player(self, player: Player, slot: Optional[int] = None) -> bool:
         """Add a player to the lineup.
 
@@ -237,46 +369,83 @@ class LineupTreeview(ttk.Frame):
             True if player was added, False otherwise
         """
         # Check if player already in lineup
-        if player in self._lineup:
+        if player.name in self._lineup_names:
             return False
 
         if slot is not None:
             # Add to specific slot
             if 0 <= slot < 9:
+                displaced = self._lineup[slot]
+                if displaced is not None:
+                    self._lineup_names.discard(displaced.name)
+                self._free_mask &= ~(1 << slot)
                 self._lineup[slot] = player
-                self._refresh()
+                self._lineup_names.add(player.name)
+                self._schedule_rows((slot,))
                 return True
             return False
         else:
-            # Find first empty slot
-            try:
-                idx = self._lineup.index(None)
-                self._lineup[idx] = player
-                self._refresh()
-                return True
-            except ValueError:
+            # Find first empty slot (lowest set bit of the free mask)
+            if not self._free_mask:
                 # Lineup is full
                 return False
+            bit = self._free_mask & -self._free_mask
+            idx = bit.bit_length() - 1
+            self._lineup[idx] = player
+            self._lineup_names.add(player.name)
+            self._free_mask ^= bit
+            self._schedule_rows((idx,))
+            return True
+
+    def remove_selected(self) -> Optional[Player]:
+        """Remove the selected player from lineup.
 
-    def remove_selected(self):
-        """Remove the selected player from lineup."""
+        Returns:
+            The removed player, or None if nothing was removed
+        """
         selection = self.tree.selection()
         if not selection:
-            return
+            return None
 
         # Get the selected item
-        item = selection[0]
-        values = self.tree.item(item, 'values')
-        if values:
-            idx = int(values[0]) - 1
-            self._lineup[idx] = None
-            self._refresh()
+        idx = self._item_index.get(selection[0])
+        if idx is None:
+            return None
+
+        removed = self._lineup[idx]
+        if removed is not None:
+            self._lineup_names.discard(removed.name)
+            self._free_mask |= 1 << idx
+        self._lineup[idx] = None
+        self._schedule_rows((idx,))
+        return removed
 
     def clear_lineup(self):
         """Clear all players from lineup."""
         self._lineup = [None] * 9
+        self._lineup_names.clear()
+        self._free_mask = FULL_MASK
         self._refresh()
 
+    def contains(self, player: Player) -> bool:
+        """Check whether a player (matched by name) is in the lineup.
+
+        Args:
+            player: Player object
+
+        Returns:
+            True if the player occupies a slot
+        """
+        return player.name in self._lineup_names
+
+    def is_full(self) -> bool:
+        """Check if all 9 slots are filled.
+
+        Returns:
+            True if no slot is empty
+        """
+        return not self._free_mask
+
     def get_selected_index(self) -> Optional[int]:
         """Get the index of the currently selected slot.
 
@@ -286,11 +455,7 @@ class LineupTreeview(ttk.Frame):
         selection = self.tree.selection()
         if not selection:
             return None
-        item = selection[0]
-        values = self.tree.item(item, 'values')
-        if values:
-            return int(values[0]) - 1
-        return None
+        return self._item_index.get(selection[0])
 
     def move_up(self):
         """Move selected player up in batting order (swap with previous)."""
@@ -300,12 +465,11 @@ class LineupTreeview(ttk.Frame):
 
         # Swap with previous
         self._lineup[idx], self._lineup[idx - 1] = self._lineup[idx - 1], self._lineup[idx]
-        self._refresh()
+        self._swap_free_bits(idx - 1)
+        self._schedule_rows((idx - 1, idx))
 
         # Reselect the moved item
-        children = self.tree.get_children()
-        if idx - 1 < len(children):
-            self.tree.selection_set(children[idx - 1])
+        self.tree.selection_set(self._items[idx - 1])
 
     def move_down(self):
         """Move selected player down in batting order (swap with next)."""
@@ -315,9 +479,8 @@ class LineupTreeview(ttk.Frame):
 
         # Swap with next
         self._lineup[idx], self._lineup[idx + 1] = self._lineup[idx + 1], self._lineup[idx]
-        self._refresh()
+        self._swap_free_bits(idx)
+        self._schedule_rows((idx, idx + 1))
 
         # Reselect the moved item
-        children = self.tree.get_children()
-        if idx + 1 < len(children):
-            self.tree.selection_set(children[idx + 1])
+        self.tree.selection_set(self._items[idx + 1])
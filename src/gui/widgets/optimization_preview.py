@@ -4,23 +4,142 @@
 """Optimization preview widgets for viewing and comparing lineup candidates."""
 
 import tkinter as tk
+import tkinter.font as tkfont
+from functools import lru_cache
 from tkinter import ttk
-from typing import Any, Callable, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from src.models.player import Player
 
 
+# Font name -> (base named font, overrides); created once per Tk root
+_FONT_SPECS = {
+    "small": ("TkDefaultFont", {"size": 9}),
+    "bold": ("TkDefaultFont", {"size": 9, "weight": "bold"}),
+    "italic": ("TkDefaultFont", {"size": 9, "slant": "italic"}),
+    "title": ("TkDefaultFont", {"size": 10, "weight": "bold"}),
+    "fixed": ("TkFixedFont", {"size": 9}),
+}
+
+_fonts: Dict[str, tkfont.Font] = {}
+_fonts_root: Optional[tk.Misc] = None
+
+
+def _get_fonts(widget: tk.Misc) -> Dict[str, tkfont.Font]:
+    """
+    Get the shared fonts for the preview widgets, creating them on first use.
+
+    Widgets are given these Font objects instead of font tuples, so Tk
+    resolves each font once rather than once per widget or tag.
+
+    Args:
+        widget: Any widget in the application (identifies the Tk root)
+
+    Returns:
+        Dict of font name -> Font, keyed as in _FONT_SPECS
+    """
+    global _fonts_root
+    root = widget._root()
+    if root is not _fonts_root:
+        _fonts.clear()
+        for name, (base, options) in _FONT_SPECS.items():
+            font = tkfont.nametofont(base, root=root).copy()
+            font.configure(**options)
+            _fonts[name] = font
+        _fonts_root = root
+    return _fonts
+
+
+def _lineup_names(lineup: List["Player"]) -> Tuple[str, ...]:
+    """Player names of a lineup, in batting order."""
+    return tuple(getattr(p, "name", str(p)) for p in lineup)
+
+
+@lru_cache(maxsize=64)
+def _compute_diff_names(
+    names_a: Tuple[str, ...],
+    names_b: Tuple[str, ...],
+    label_a: str,
+    label_b: str,
+) -> str:
+    """
+    Compute human-readable diff string between two lineups of names.
+
+    Results are cached by (names, labels).
+
+    Args:
+        names_a: Player names of the first lineup, in batting order
+        names_b: Player names of the second lineup, in batting order
+        label_a: Label for first lineup
+        label_b: Label for second lineup
+
+    Returns:
+        Formatted diff string
+    """
+    # Check for identical lineups
+    if names_a == names_b:
+        return "Lineups are identical."
+
+    # Find slot changes
+    changes: List[str] = []
+    swaps: List[tuple[int, int]] = []  # Track detected swaps
+    processed_swaps: set[tuple[int, int]] = set()
+
+    # Build position maps
+    pos_a = {name: idx for idx, name in enumerate(names_a)}
+    pos_b = {name: idx for idx, name in enumerate(names_b)}
+
+    # Single pass over slots present in both lineups
+    for slot, (name_a, name_b) in enumerate(zip(names_a, names_b)):
+        if name_a == name_b:
+            continue
+        # A simple swap: each player sits in the other's slot
+        slot_of_a_in_b = pos_b.get(name_a)
+        if slot_of_a_in_b is not None and slot_of_a_in_b == pos_a.get(name_b):
+            swap_key = (min(slot, slot_of_a_in_b), max(slot, slot_of_a_in_b))
+            if swap_key not in processed_swaps:
+                swaps.append((slot + 1, slot_of_a_in_b + 1))
+                processed_swaps.add(swap_key)
+        else:
+            changes.append(f"Slot {slot + 1}: {name_a} -> {name_b}")
+
+    set_a = frozenset(names_a)
+    set_b = frozenset(names_b)
+    only_in_a = set_a - set_b  # Removed
+    only_in_b = set_b - set_a  # Added
+
+    # One string per section; empty sections are dropped below
+    header = f"{label_a} vs {label_b}\n{'=' * 40}"
+    swaps_block = swaps and "Swaps: " + ", ".join(f"{a}<->{b}" for a, b in swaps)
+    changes_block = changes and "Slot Changes:\n" + "\n".join(f"  {c}" for c in changes)
+    removed_block = only_in_a and f"Removed from {label_b}:\n" + "\n".join(
+        f"  - {name}" for name in only_in_a
+    )
+    added_block = only_in_b and f"Added in {label_b}:\n" + "\n".join(
+        f"  + {name}" for name in only_in_b
+    )
+    total_changes = len(swaps) + len(changes) + len(only_in_a) + len(only_in_b)
+    summary = f"Total: {total_changes} change(s)"
+
+    return "\n\n".join(
+        filter(None, (header, swaps_block, changes_block, removed_block, added_block, summary))
+    )
+
+
 class LineupRankingList(ttk.Frame):
     """
     Ranked list of lineup candidates ordered by expected runs.
 
-    Displays top N lineups from optimizer with:
+    Displays top N lineups from optimizer in a Treeview with:
     - Rank number
     - Expected runs (mean)
     - Confidence interval
-    - Expandable stat breakdown
-    - Copy-to-panel button
+    - Expandable lineup and stat breakdown (child rows)
+    - Copy-to-panel action (button, double-click, or Return)
+
+    Candidate rows are kept across set_candidates() calls and their values
+    rewritten in place.
     """
 
     def __init__(
@@ -35,69 +154,78 @@ class LineupRankingList(ttk.Frame):
 
         Args:
             parent: Parent widget
-            on_copy: Callback when user clicks "Copy" (receives lineup list)
+            on_copy: Callback when user copies a candidate (receives lineup list)
             max_display: Maximum candidates to show (default 10)
         """
         super().__init__(parent, **kwargs)
         self.on_copy = on_copy
         self.max_display = max_display
         self._candidates: List[Dict[str, Any]] = []
-        self._row_frames: List[ttk.Frame] = []
-        self._detail_frames: List[ttk.Frame] = []
-        self._detail_visible: List[bool] = []
+        self._row_iids: List[str] = []  # Candidate rows, reused across updates
+        # Detail lines inserted under each row; None until it is first opened
+        self._row_details: List[Optional[List[tuple[str, str]]]] = []
+        self._empty_iid: Optional[str] = None
         self._create_widgets()
 
     def _create_widgets(self) -> None:
         """Create the widget layout."""
-        # Header row
-        header = ttk.Frame(self)
-        header.pack(fill=tk.X, padx=5, pady=(5, 2))
+        fonts = _get_fonts(self)
+        self.rowconfigure(0, weight=1)
+        self.columnconfigure(0, weight=1)
 
-        ttk.Label(header, text="Rank", width=6, font=("TkDefaultFont", 9, "bold")).pack(
-            side=tk.LEFT, padx=(0, 5)
+        self.tree = ttk.Treeview(
+            self,
+            columns=("expected", "ci"),
+            show="tree headings",
+            selectmode="browse",
         )
+        self.tree.heading("#0", text="Rank", anchor=tk.W)
+        self.tree.heading("expected", text="Expected Runs")
+        self.tree.heading("ci", text="95% CI")
+        # The tree column also holds the detail lines, so it gets the width
+        self.tree.column("#0", width=280, stretch=True)
+        self.tree.column("expected", width=110, anchor=tk.CENTER, stretch=False)
+        self.tree.column("ci", width=110, anchor=tk.CENTER, stretch=False)
+        self.tree.grid(row=0, column=0, sticky="nsew", padx=(5, 0), pady=(5, 0))
+
+        scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar.grid(row=0, column=1, sticky="ns", pady=(5, 0))
+
+        self.tree.tag_configure("empty", foreground="gray")
+        self.tree.tag_configure("section", font=fonts["bold"])
+        self.tree.tag_configure("detail", font=fonts["fixed"])
+
+        # Detail rows are inserted the first time a candidate is expanded
+        self.tree.bind("<<TreeviewOpen>>", self._on_open)
+
+        # Copy the selected candidate
+        self.tree.bind("<Double-Button-1>", self._on_double_click)
+        self.tree.bind("<Return>", self._on_return)
+
+        actions = ttk.Frame(self)
+        actions.grid(row=1, column=0, columnspan=2, sticky="ew", padx=5, pady=5)
+        ttk.Button(
+            actions, text="Copy", width=6, command=self._copy_selected
+        ).pack(side=tk.LEFT)
         ttk.Label(
-            header, text="Expected Runs", width=14, font=("TkDefaultFont", 9, "bold")
+            actions,
+            text="Expand a row for details; double-click to copy",
+            foreground="gray",
+            font=fonts["small"],
         ).pack(side=tk.LEFT, padx=5)
-        ttk.Label(header, text="95% CI", width=14, font=("TkDefaultFont", 9, "bold")).pack(
-            side=tk.LEFT, padx=5
-        )
-        ttk.Label(header, text="Actions", width=16, font=("TkDefaultFont", 9, "bold")).pack(
-            side=tk.LEFT, padx=5
-        )
-
-        # Separator
-        ttk.Separator(self, orient=tk.HORIZONTAL).pack(fill=tk.X, padx=5, pady=2)
-
-        # Scrollable container for candidate rows
-        self._canvas = tk.Canvas(self, highlightthickness=0)
-        scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self._canvas.yview)
 
-        self._scroll_frame = ttk.Frame(self._canvas)
-        self._scroll_frame.bind(
-            "<Configure>",
-            lambda e: self._canvas.configure(scrollregion=self._canvas.bbox("all")),
-        )
-
-        self._canvas.create_window((0, 0), window=self._scroll_frame, anchor=tk.NW)
-        self._canvas.configure(yscrollcommand=scrollbar.set)
-
-        self._canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-
-        # Bind mousewheel for scrolling
-        self._canvas.bind_all(
-            "<MouseWheel>",
-            lambda e: self._canvas.yview_scroll(int(-1 * (e.delta / 120)), "units"),
-        )
+        self._show_empty(True)
 
-        # Empty state message
-        self._empty_label = ttk.Label(
-            self._scroll_frame,
-            text="No candidates available",
-            foreground="gray",
-            font=("TkDefaultFont", 10, "italic"),
-        )
+    def _show_empty(self, show: bool) -> None:
+        """Show or remove the empty-state placeholder row."""
+        if show and self._empty_iid is None:
+            self._empty_iid = self.tree.insert(
+                "", tk.END, text="No candidates available", tags=("empty",)
+            )
+        elif not show and self._empty_iid is not None:
+            self.tree.delete(self._empty_iid)
+            self._empty_iid = None
 
     def set_candidates(self, candidates: List[Dict[str, Any]]) -> None:
         """
@@ -111,173 +239,157 @@ class LineupRankingList(ttk.Frame):
                 - ci_upper: float
                 - stats: Dict (optional detailed stats)
         """
-        # Clear existing rows
-        for frame in self._row_frames:
-            frame.destroy()
-        for frame in self._detail_frames:
-            frame.destroy()
-        self._row_frames.clear()
-        self._detail_frames.clear()
-        self._detail_visible.clear()
         self._candidates = candidates[: self.max_display] if candidates else []
+        n = len(self._candidates)
 
-        # Hide empty label if we have candidates
-        if self._candidates:
-            self._empty_label.pack_forget()
-        else:
-            self._empty_label.pack(pady=20)
-            return
+        # Drop rows beyond the new count, add rows up to it
+        if len(self._row_iids) > n:
+            self.tree.delete(*self._row_iids[n:])
+            del self._row_iids[n:]
+            del self._row_details[n:]
+        while len(self._row_iids) < n:
+            iid = self.tree.insert("", tk.END)
+            self.tree.insert(iid, tk.END)  # Placeholder so the row can expand
+            self._row_iids.append(iid)
+            self._row_details.append(None)
 
-        # Create rows for each candidate
-        for rank, candidate in enumerate(self._candidates, start=1):
-            row_frame, detail_frame = self._create_candidate_row(rank, candidate)
-            self._row_frames.append(row_frame)
-            self._detail_frames.append(detail_frame)
-            self._detail_visible.append(False)
+        self._show_empty(n == 0)
 
-    def _create_candidate_row(
-        self, rank: int, candidate: Dict[str, Any]
-    ) -> tuple[ttk.Frame, ttk.Frame]:
+        for idx, candidate in enumerate(self._candidates):
+            self._fill_candidate_row(idx, candidate)
+
+    def _fill_candidate_row(self, idx: int, candidate: Dict[str, Any]) -> None:
         """
-        Create a row for a single candidate.
+        Write a candidate's summary values.
+
+        Detail child rows already inserted are kept if the candidate's lines
+        are unchanged; otherwise the row goes back to a placeholder child
+        until it is next expanded.
 
         Args:
-            rank: The candidate's rank (1-based)
+            idx: Index of the candidate's row (0-based)
             candidate: Candidate data dict
-
-        Returns:
-            Tuple of (summary_frame, detail_frame)
         """
-        # Summary row
-        row = ttk.Frame(self._scroll_frame)
-        row.pack(fill=tk.X, padx=5, pady=2)
-
+        iid = self._row_iids[idx]
         expected_runs = candidate.get("expected_runs", 0)
         ci_lower = candidate.get("ci_lower", 0)
         ci_upper = candidate.get("ci_upper", 0)
-        lineup = candidate.get("lineup", [])
-
-        # Rank
-        ttk.Label(row, text=f"#{rank}", width=6).pack(side=tk.LEFT, padx=(0, 5))
-
-        # Expected runs
-        ttk.Label(row, text=f"{expected_runs:.1f}", width=14).pack(side=tk.LEFT, padx=5)
-
-        # CI
-        ci_text = f"[{ci_lower:.0f}-{ci_upper:.0f}]"
-        ttk.Label(row, text=ci_text, width=14).pack(side=tk.LEFT, padx=5)
 
-        # Actions frame
-        actions = ttk.Frame(row)
-        actions.pack(side=tk.LEFT, padx=5)
-
-        # Copy button - use helper to create callback with captured lineup
-        def make_copy_callback(lineup_ref: List["Player"]) -> Callable[[], None]:
-            return lambda: self._handle_copy(lineup_ref)
-
-        copy_btn = ttk.Button(
-            actions,
-            text="Copy",
-            width=6,
-            command=make_copy_callback(lineup),
+        self.tree.item(
+            iid,
+            text=f"#{idx + 1}",
+            values=(f"{expected_runs:.1f}", f"[{ci_lower:.0f}-{ci_upper:.0f}]"),
+            open=False,
         )
-        copy_btn.pack(side=tk.LEFT, padx=(0, 5))
-
-        # Details toggle button - use helper to create callback with captured index
-        idx = rank - 1  # Convert to 0-based index
-
-        def make_toggle_callback(index: int) -> Callable[[], None]:
-            return lambda: self._toggle_details(index)
 
-        detail_btn = ttk.Button(
-            actions,
-            text="Details",
-            width=7,
-            command=make_toggle_callback(idx),
-        )
-        detail_btn.pack(side=tk.LEFT)
+        shown = self._row_details[idx]
+        if shown is None or shown == self._detail_lines(candidate):
+            return
+        self._row_details[idx] = None
+        self.tree.delete(*self.tree.get_children(iid))
+        self.tree.insert(iid, tk.END)
 
-        # Detail frame (initially hidden)
-        detail = ttk.Frame(self._scroll_frame, relief=tk.GROOVE, borderwidth=1)
+    def _populate_details(self, idx: int) -> None:
+        """
+        Replace a row's placeholder child with its detail lines.
 
-        self._populate_detail_frame(detail, candidate)
+        Args:
+            idx: Index of the candidate (0-based)
+        """
+        if self._row_details[idx] is not None:
+            return
 
-        return row, detail
+        iid = self._row_iids[idx]
+        lines = self._detail_lines(self._candidates[idx])
+        self.tree.delete(*self.tree.get_children(iid))
+        for text, tag in lines:
+            self.tree.insert(iid, tk.END, text=text, tags=(tag,))
+        self._row_details[idx] = lines
+
+    def _on_open(self, event: tk.Event) -> None:
+        """Fill in the detail rows of the candidate being expanded."""
+        try:
+            idx = self._row_iids.index(self.tree.focus())
+        except ValueError:
+            return
+        self._populate_details(idx)
 
-    def _populate_detail_frame(
-        self, detail: ttk.Frame, candidate: Dict[str, Any]
-    ) -> None:
+    @staticmethod
+    def _detail_lines(candidate: Dict[str, Any]) -> List[tuple[str, str]]:
         """
-        Populate the detail frame with lineup and stats.
+        Build the lineup and stats lines shown when a candidate is expanded.
 
         Args:
-            detail: The detail frame to populate
             candidate: Candidate data dict
+
+        Returns:
+            List of (text, tag) pairs, one per child row
         """
         lineup = candidate.get("lineup", [])
         stats = candidate.get("stats", {})
 
         # Lineup listing
-        lineup_label = ttk.Label(detail, text="Lineup:", font=("TkDefaultFont", 9, "bold"))
-        lineup_label.pack(anchor=tk.W, padx=10, pady=(5, 2))
-
+        lines = [("Lineup:", "section")]
         for slot, player in enumerate(lineup, start=1):
             player_name = getattr(player, "name", str(player))
             player_ba = getattr(player, "ba", 0)
             player_obp = getattr(player, "obp", 0)
             player_slg = getattr(player, "slg", 0)
-            text = f"  {slot}. {player_name} ({player_ba:.3f}/{player_obp:.3f}/{player_slg:.3f})"
-            ttk.Label(detail, text=text, font=("TkFixedFont", 9)).pack(
-                anchor=tk.W, padx=10
-            )
+            text = f"{slot}. {player_name} ({player_ba:.3f}/{player_obp:.3f}/{player_slg:.3f})"
+            lines.append((text, "detail"))
 
         # Additional stats if available
         if stats:
-            ttk.Separator(detail, orient=tk.HORIZONTAL).pack(
-                fill=tk.X, padx=10, pady=5
-            )
-            stats_label = ttk.Label(
-                detail, text="Statistics:", font=("TkDefaultFont", 9, "bold")
-            )
-            stats_label.pack(anchor=tk.W, padx=10, pady=(0, 2))
-
+            lines.append(("Statistics:", "section"))
             for key, value in stats.items():
                 if isinstance(value, float):
-                    text = f"  {key}: {value:.2f}"
+                    text = f"{key}: {value:.2f}"
                 else:
-                    text = f"  {key}: {value}"
-                ttk.Label(detail, text=text, font=("TkFixedFont", 9)).pack(
-                    anchor=tk.W, padx=10
-                )
+                    text = f"{key}: {value}"
+                lines.append((text, "detail"))
 
-        # Add padding at bottom
-        ttk.Frame(detail, height=5).pack()
+        return lines
 
-    def _toggle_details(self, idx: int) -> None:
+    def _selected_index(self) -> Optional[int]:
         """
-        Toggle detail visibility for a candidate.
+        Get the candidate index of the selected row (or its detail parent).
 
-        Args:
-            idx: Index of the candidate (0-based)
+        Returns:
+            Candidate index (0-based), or None if nothing is selected
         """
-        if idx >= len(self._detail_frames):
-            return
-
-        detail_frame = self._detail_frames[idx]
-        row_frame = self._row_frames[idx]
-
-        if self._detail_visible[idx]:
-            # Hide details
-            detail_frame.pack_forget()
-            self._detail_visible[idx] = False
-        else:
-            # Show details (pack after the row)
-            detail_frame.pack(fill=tk.X, padx=10, pady=(0, 5), after=row_frame)
-            self._detail_visible[idx] = True
+        selection = self.tree.selection()
+        if not selection:
+            return None
+        iid = selection[0]
+        parent = self.tree.parent(iid)
+        if parent:
+            iid = parent
+        try:
+            return self._row_iids.index(iid)
+        except ValueError:
+            return None  # Empty-state placeholder
+
+    def _copy_selected(self) -> None:
+        """Copy the selected candidate's lineup."""
+        idx = self._selected_index()
+        if idx is not None and idx < len(self._candidates):
+            self._handle_copy(self._candidates[idx].get("lineup", []))
+
+    def _on_double_click(self, event: tk.Event) -> Optional[str]:
+        """Copy the candidate under the cursor (ignores headings and blank space)."""
+        if not self.tree.identify_row(event.y):
+            return None
+        self._copy_selected()
+        return "break"  # Don't also toggle the row open
+
+    def _on_return(self, event: tk.Event) -> str:
+        """Copy the selected candidate."""
+        self._copy_selected()
+        return "break"  # Don't also toggle the row open
 
     def _handle_copy(self, lineup: List["Player"]) -> None:
         """
-        Handle copy button click.
+        Handle copy action.
 
         Args:
             lineup: The lineup to copy
@@ -302,15 +414,19 @@ class LineupDiffView(ttk.Frame):
             parent: Parent widget
         """
         super().__init__(parent, **kwargs)
+        # Inputs of the diff currently displayed (None when cleared)
+        self._last_diff_key: Optional[tuple] = None
         self._create_widgets()
 
     def _create_widgets(self) -> None:
         """Create the widget layout."""
+        fonts = _get_fonts(self)
+
         # Header frame with label and clear button
         header = ttk.Frame(self)
         header.pack(fill=tk.X, padx=5, pady=2)
 
-        ttk.Label(header, text="Lineup Comparison", font=("TkDefaultFont", 10, "bold")).pack(
+        ttk.Label(header, text="Lineup Comparison", font=fonts["title"]).pack(
             side=tk.LEFT
         )
 
@@ -323,18 +439,18 @@ class LineupDiffView(ttk.Frame):
             height=8,
             width=50,
             wrap=tk.WORD,
-            font=("TkFixedFont", 9),
+            font=fonts["fixed"],
             state=tk.DISABLED,
             background="#f5f5f5",
         )
         self._text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
 
         # Configure text tags for styling
-        self._text.tag_configure("header", font=("TkDefaultFont", 9, "bold"))
+        self._text.tag_configure("header", font=fonts["bold"])
         self._text.tag_configure("swap", foreground="#0066cc")
         self._text.tag_configure("added", foreground="#008800")
         self._text.tag_configure("removed", foreground="#cc0000")
-        self._text.tag_configure("summary", font=("TkDefaultFont", 9, "italic"))
+        self._text.tag_configure("summary", font=fonts["italic"])
 
     def show_diff(
         self,
@@ -357,7 +473,13 @@ class LineupDiffView(ttk.Frame):
             label_a: Label for first lineup
             label_b: Label for second lineup
         """
-        diff_text = self._compute_diff(lineup_a, lineup_b, label_a, label_b)
+        # Repeated requests for the same comparison leave the text alone
+        key = (_lineup_names(lineup_a), _lineup_names(lineup_b), label_a, label_b)
+        if key == self._last_diff_key:
+            return
+        self._last_diff_key = key
+
+        diff_text = _compute_diff_names(*key)
 
         self._text.config(state=tk.NORMAL)
         self._text.delete("1.0", tk.END)
@@ -383,90 +505,13 @@ class LineupDiffView(ttk.Frame):
         Returns:
             Formatted diff string
         """
-        lines: List[str] = []
-
-        # Get player names for comparison
-        names_a = [getattr(p, "name", str(p)) for p in lineup_a]
-        names_b = [getattr(p, "name", str(p)) for p in lineup_b]
-
-        # Check for identical lineups
-        if names_a == names_b:
-            return "Lineups are identical."
-
-        lines.append(f"{label_a} vs {label_b}")
-        lines.append("=" * 40)
-        lines.append("")
-
-        # Find slot changes
-        changes: List[str] = []
-        swaps: List[tuple[int, int]] = []  # Track detected swaps
-        processed_swaps: set[tuple[int, int]] = set()
-
-        # Build position maps
-        pos_a = {name: idx for idx, name in enumerate(names_a)}
-        pos_b = {name: idx for idx, name in enumerate(names_b)}
-
-        # Find players in different slots
-        for slot, name_a in enumerate(names_a):
-            if slot < len(names_b):
-                name_b = names_b[slot]
-                if name_a != name_b:
-                    # Check if this is a simple swap
-                    if name_a in pos_b and name_b in pos_a:
-                        slot_of_a_in_b = pos_b[name_a]
-                        slot_of_b_in_a = pos_a[name_b]
-                        if slot_of_a_in_b == slot_of_b_in_a:
-                            # It's a swap - create explicit tuple for type safety
-                            min_slot = min(slot, slot_of_a_in_b)
-                            max_slot = max(slot, slot_of_a_in_b)
-                            swap_key: tuple[int, int] = (min_slot, max_slot)
-                            if swap_key not in processed_swaps:
-                                swaps.append((slot + 1, slot_of_a_in_b + 1))
-                                processed_swaps.add(swap_key)
-                        else:
-                            changes.append(
-                                f"Slot {slot + 1}: {name_a} -> {name_b}"
-                            )
-                    else:
-                        changes.append(f"Slot {slot + 1}: {name_a} -> {name_b}")
-
-        # Report swaps compactly
-        if swaps:
-            swap_strs = [f"{a}<->{b}" for a, b in swaps]
-            lines.append(f"Swaps: {', '.join(swap_strs)}")
-            lines.append("")
-
-        # Report other changes
-        if changes:
-            lines.append("Slot Changes:")
-            for change in changes:
-                lines.append(f"  {change}")
-            lines.append("")
-
-        # Players only in A (removed)
-        only_in_a = set(names_a) - set(names_b)
-        if only_in_a:
-            lines.append(f"Removed from {label_b}:")
-            for name in only_in_a:
-                lines.append(f"  - {name}")
-            lines.append("")
-
-        # Players only in B (added)
-        only_in_b = set(names_b) - set(names_a)
-        if only_in_b:
-            lines.append(f"Added in {label_b}:")
-            for name in only_in_b:
-                lines.append(f"  + {name}")
-            lines.append("")
-
-        # Summary
-        total_changes = len(swaps) + len(changes) + len(only_in_a) + len(only_in_b)
-        lines.append(f"Total: {total_changes} change(s)")
-
-        return "\n".join(lines)
+        return _compute_diff_names(
+            _lineup_names(lineup_a), _lineup_names(lineup_b), label_a, label_b
+        )
 
     def clear(self) -> None:
         """Clear the diff display."""
+        self._last_diff_key = None
         self._text.config(state=tk.NORMAL)
         self._text.delete("1.0", tk.END)
         self._text.config(state=tk.DISABLED)
@@ -25,9 +25,16 @@ from typing import Optional, Dict, Any, List
 import matplotlib
 matplotlib.use('TkAgg')
 from matplotlib.figure import Figure
+from matplotlib.patches import Rectangle
+from matplotlib.text import Text
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import numpy as np
-import seaborn as sns
+
+# The x-axis extends this far past the longest bar (matplotlib's autoscale margin)
+XLIM_MARGIN = 1.05
+
+# Rescale the x-axis once the longest bar spans less than this share of it
+XLIM_MIN_FILL = 0.8
 
 
 class PlayerContributionChart(ttk.Frame):
@@ -47,6 +54,18 @@ class PlayerContributionChart(ttk.Frame):
 
     SLOT_LABELS = ['1st', '2nd', '3rd', '4th', '5th', '6th', '7th', '8th', '9th']
 
+    # Bar colors, lightest first; built by _get_palette() on first use
+    _palette: Optional[np.ndarray] = None
+
+    @classmethod
+    def _get_palette(cls) -> np.ndarray:
+        """Get the 9-color Blues palette as a (9, 3) RGB array."""
+        if cls._palette is None:
+            import seaborn as sns  # Deferred: only needed once real data is drawn
+
+            cls._palette = np.array(sns.color_palette("Blues_d", n_colors=9))
+        return cls._palette
+
     def __init__(self, parent, **kwargs):
         """
         Initialize player contribution chart.
@@ -59,6 +78,14 @@ class PlayerContributionChart(ttk.Frame):
 
         self._view_mode: str = 'slot'  # 'slot' or 'player'
         self._data: Optional[Dict[str, Any]] = None
+        # (view mode, labels, values) currently drawn; None for the placeholder
+        self._last_fingerprint: Optional[tuple] = None
+
+        # Persistent bar artists, rebuilt only when the labels change
+        self._chart_key: Optional[tuple] = None  # (view mode, labels)
+        self._bars: List[Rectangle] = []
+        self._value_texts: List[Text] = []
+        self._background = None  # Axes pixels without the bars, for blitting
 
         self._create_widgets()
 
@@ -103,6 +130,8 @@ class PlayerContributionChart(ttk.Frame):
         self.ax = self.figure.add_subplot(111)
         self.canvas = FigureCanvasTkAgg(self.figure, master=chart_frame)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        # Every full draw (including resizes) re-captures the blit background
+        self.canvas.mpl_connect('draw_event', self._on_draw)
 
         # Initialize with placeholder
         self._show_placeholder()
@@ -150,8 +179,6 @@ class PlayerContributionChart(ttk.Frame):
             self._show_placeholder()
             return
 
-        self.ax.clear()
-
         # Get data based on view mode
         if self._view_mode == 'slot':
             slot_contributions = self._data.get('slot_contributions', {})
@@ -177,58 +204,46 @@ class PlayerContributionChart(ttk.Frame):
             labels = list(player_names[:9])  # Limit to 9 players
             values = [player_contributions.get(name, 0.0) for name in labels]
 
-        # Create color gradient from high to low contribution
-        values_arr = np.array(values)
-        if values_arr.max() > values_arr.min():
-            # Normalize to 0-1 for color mapping
-            normalized = (values_arr - values_arr.min()) / (values_arr.max() - values_arr.min())
-        else:
-            normalized = np.ones_like(values_arr) * 0.5
+        # Nothing to do if the chart already shows these bars
+        fingerprint = (self._view_mode, tuple(labels), tuple(round(v, 4) for v in values))
+        if fingerprint == self._last_fingerprint:
+            return
 
-        # Use Blues palette - higher values get darker colors
-        colors = sns.color_palette("Blues_d", n_colors=9)
-        # Sort indices by normalized value to assign colors
-        sorted_indices = np.argsort(normalized)
-        bar_colors = [colors[0]] * len(values)  # Initialize with lightest
-        for rank, idx in enumerate(sorted_indices):
-            bar_colors[idx] = colors[rank]
+        if (self._view_mode, tuple(labels)) != self._chart_key:
+            self._build_chart(labels)
+        self._refresh_values(values)
+        self._last_fingerprint = fingerprint
+
+    def _build_chart(self, labels: List[str]):
+        """
+        Create the axes decoration and one bar and value label per row.
+
+        Bars and value labels are animated artists: full draws leave them
+        out, and _refresh_values() blits them over the captured background.
+
+        Args:
+            labels: Y-axis labels, top to bottom
+        """
+        self.ax.clear()
+        self.ax.set_axis_on()
 
-        # Create horizontal bar chart
         y_positions = np.arange(len(labels))
-        bars = self.ax.barh(y_positions, values, color=bar_colors, edgecolor='black', linewidth=0.5)
+        bars = self.ax.barh(
+            y_positions, np.zeros(len(labels)), edgecolor='black', linewidth=0.5, animated=True
+        )
+        self._bars = list(bars)
+        self._value_texts = [
+            self.ax.text(
+                0, bar.get_y() + bar.get_height() / 2, '',
+                va='center', fontsize=8, animated=True
+            )
+            for bar in self._bars
+        ]
 
         # Set y-axis labels
         self.ax.set_yticks(y_positions)
         self.ax.set_yticklabels(labels)
 
-        # Add value labels on bars
-        for bar, value in zip(bars, values):
-            width = bar.get_width()
-            # Position label inside or outside bar depending on size
-            if width > max(values) * 0.1:
-                # Inside bar
-                self.ax.text(
-                    width - max(values) * 0.02,
-                    bar.get_y() + bar.get_height() / 2,
-                    f'{value:.1f}',
-                    ha='right',
-                    va='center',
-                    fontsize=8,
-                    color='white',
-                    fontweight='bold'
-                )
-            else:
-                # Outside bar
-                self.ax.text(
-                    width + max(values) * 0.02,
-                    bar.get_y() + bar.get_height() / 2,
-                    f'{value:.1f}',
-                    ha='left',
-                    va='center',
-                    fontsize=8,
-                    color='black'
-                )
-
         # Set labels
         self.ax.set_xlabel('Runs Contributed')
         if self._view_mode == 'slot':
@@ -236,20 +251,99 @@ class PlayerContributionChart(ttk.Frame):
         else:
             self.ax.set_title('Contribution by Player')
 
-        # Clip x-axis to 0 minimum
-        self.ax.set_xlim(0, None)
-
         # Add grid for readability
         self.ax.grid(True, axis='x', alpha=0.3)
 
         # Invert y-axis so 1st slot is at top
         self.ax.invert_yaxis()
 
-        self.figure.tight_layout()
-        self.canvas.draw()
+        self._chart_key = (self._view_mode, tuple(labels))
+        self._background = None  # Axes changed; next refresh does a full draw
+
+    def _refresh_values(self, values: List[float]):
+        """
+        Update bar widths, colors, and value labels.
+
+        Blits just the bars when the x-axis range still fits the values;
+        otherwise rescales the axis and redraws the figure.
+
+        Args:
+            values: Bar values, one per label
+        """
+        # Create color gradient from high to low contribution
+        values_arr = np.array(values)
+        if values_arr.max() > values_arr.min():
+            # Normalize to 0-1 for color mapping
+            normalized = (values_arr - values_arr.min()) / (values_arr.max() - values_arr.min())
+        else:
+            normalized = np.ones_like(values_arr) * 0.5
+
+        # Use Blues palette - higher values get darker colors; each bar
+        # takes the palette entry at its rank among the values
+        sorted_indices = np.argsort(normalized)
+        ranks = np.empty_like(sorted_indices)
+        ranks[sorted_indices] = np.arange(len(values))
+        bar_colors = self._get_palette()[ranks]
+
+        max_value = max(values)
+        for bar, text, value, color in zip(self._bars, self._value_texts, values, bar_colors):
+            bar.set_width(value)
+            bar.set_facecolor(color)
+            # Position label inside or outside bar depending on size
+            if value > max_value * 0.1:
+                # Inside bar
+                text.set_x(value - max_value * 0.02)
+                text.set_horizontalalignment('right')
+                text.set_color('white')
+                text.set_fontweight('bold')
+            else:
+                # Outside bar
+                text.set_x(value + max_value * 0.02)
+                text.set_horizontalalignment('left')
+                text.set_color('black')
+                text.set_fontweight('normal')
+            text.set_text(f'{value:.1f}')
+
+        # Clip x-axis to 0 minimum. The range (and the blit background) is
+        # kept while the longest bar still fills most of it.
+        x_max = max_value * XLIM_MARGIN
+        current_max = self.ax.get_xlim()[1]
+        if (
+            self._background is None
+            or x_max <= 0
+            or not current_max * XLIM_MIN_FILL <= x_max <= current_max
+        ):
+            self.ax.set_xlim(0, x_max if x_max > 0 else 1)
+            self.figure.tight_layout()
+            self.canvas.draw()  # _on_draw captures the background and draws the bars
+        else:
+            self._blit_bars()
+
+    def _on_draw(self, event):
+        """Capture the background after a full draw, then draw the bars over it."""
+        if not self._bars:
+            self._background = None
+            return
+        self._background = self.canvas.copy_from_bbox(self.ax.bbox)
+        self._draw_bars()
+
+    def _draw_bars(self):
+        """Draw the animated bar artists onto the canvas renderer."""
+        for artist in self._bars + self._value_texts:
+            self.ax.draw_artist(artist)
+
+    def _blit_bars(self):
+        """Redraw only the bars over the saved background."""
+        self.canvas.restore_region(self._background)
+        self._draw_bars()
+        self.canvas.blit(self.ax.bbox)
 
     def _show_placeholder(self):
         """Show placeholder when no data available."""
+        self._last_fingerprint = None
+        self._chart_key = None
+        self._bars = []
+        self._value_texts = []
         self.ax.clear()
         self.ax.text(
             0.5, 0.5,
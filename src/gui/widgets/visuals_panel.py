@@ -15,8 +15,8 @@ import numpy as np
 from src.gui.utils.chart_utils import (
     create_histogram_with_kde,
     create_radar_chart,
-    create_run_expectancy_chart,
     create_multi_overlay,
+    RunExpectancyChart,
 )
 from src.gui.utils.results_manager import ResultsManager
 from src.gui.widgets import PlayerContributionChart
@@ -164,6 +164,10 @@ class VisualsPanel(ttk.Frame):
         self.run_exp_ax = self.run_exp_figure.add_subplot(111)
         self.run_exp_canvas = FigureCanvasTkAgg(self.run_exp_figure, master=frame)
         self.run_exp_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self.run_exp_chart = RunExpectancyChart(
+            self.run_exp_ax,
+            title='Average Runs by Batting Order Position'
+        )
 
         # Initial empty state
         self._clear_run_expectancy()
@@ -347,14 +351,8 @@ class VisualsPanel(ttk.Frame):
         self.histogram_canvas.draw()
 
     def _create_run_expectancy(self, slot_data: Dict[int, float]):
-        """Create run expectancy bar chart."""
-        self.run_exp_ax.clear()
-
-        create_run_expectancy_chart(
-            self.run_exp_ax,
-            slot_data,
-            title='Average Runs by Batting Order Position'
-        )
+        """Create or update run expectancy bar chart."""
+        self.run_exp_chart.update(slot_data)
 
         self.run_exp_figure.tight_layout()
         self.run_exp_canvas.draw()
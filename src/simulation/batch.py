@@ -51,15 +51,19 @@ def _calculate_win_probability(
     }
 
 
-def run_simulations(
+def simulate_seasons(
     lineup: List[Player],
-    n_iterations: int = config.N_SIMULATIONS,
-    n_games: int = config.N_GAMES_PER_SEASON,
-    random_seed: int = config.RANDOM_SEED,
-    verbose: int = config.VERBOSITY,
+    n_iterations: int,
+    n_games: int,
+    random_seed: Optional[int],
+    verbose: int = 0,
     progress_callback: Optional[Callable[[int, int], None]] = None
-) -> Dict:
-    """Run multiple season simulations and aggregate results.
+) -> Dict[str, List[int]]:
+    """Simulate seasons and return per-season totals without summarizing.
+
+    Split out of run_simulations so independent batches (e.g. one per
+    worker process) can be simulated separately and their raw totals
+    concatenated before summarize_simulations is applied once.
 
     Args:
         lineup: List of 9 Player objects in batting order
@@ -70,13 +74,8 @@ def run_simulations(
         progress_callback: Optional callback function(current, total) for progress updates
 
     Returns:
-        Dictionary with aggregated statistics across all simulations
+        Dictionary of per-season total lists (season_runs, season_hits, ...)
     """
-    if verbose >= 1:
-        print(f"Running {n_iterations:,} season simulations...")
-        print(f"Games per season: {n_games}")
-        print(f"Random seed: {random_seed}\n")
-
     # Initialize PA generator with seed
     pa_gen = PAOutcomeGenerator(random_state=random_seed)
 
@@ -113,20 +112,39 @@ def run_simulations(
         if progress_callback and (i % 100 == 0 or i == n_iterations - 1):
             progress_callback(i + 1, n_iterations)
 
-    if verbose >= 1:
-        print("\nSimulation complete!\n")
+    return {
+        'season_runs': season_runs,
+        'season_hits': season_hits,
+        'season_walks': season_walks,
+        'season_sb': season_sb,
+        'season_cs': season_cs,
+        'season_sf': season_sf,
+        'season_lob': season_lob
+    }
+
+
+def summarize_simulations(raw_data: Dict[str, List[int]], n_games: int) -> Dict:
+    """Aggregate per-season totals from simulate_seasons into summary statistics.
+
+    Args:
+        raw_data: Dictionary of per-season total lists from simulate_seasons
+        n_games: Games per season
 
+    Returns:
+        Summary statistics dictionary (the 'summary' entry of run_simulations)
+    """
     # Convert to numpy arrays for statistics
-    season_runs_arr = np.array(season_runs)
-    season_hits_arr = np.array(season_hits)
-    season_walks_arr = np.array(season_walks)
-    season_sb_arr = np.array(season_sb)
-    season_cs_arr = np.array(season_cs)
-    season_sf_arr = np.array(season_sf)
-    season_lob_arr = np.array(season_lob)
+    season_runs_arr = np.array(raw_data['season_runs'])
+    season_hits_arr = np.array(raw_data['season_hits'])
+    season_walks_arr = np.array(raw_data['season_walks'])
+    season_sb_arr = np.array(raw_data['season_sb'])
+    season_cs_arr = np.array(raw_data['season_cs'])
+    season_sf_arr = np.array(raw_data['season_sf'])
+    season_lob_arr = np.array(raw_data['season_lob'])
+    n_iterations = len(season_runs_arr)
 
     # Calculate statistics
-    summary = {
+    return {
         'n_simulations': n_iterations,
         'n_games_per_season': n_games,
 
@@ -205,19 +223,61 @@ def run_simulations(
         'risp_conversion': None  # TODO: Add RISP tracking to game engine in future phase
     }
 
-    # Store raw data for further analysis
-    raw_data = {
-        'season_runs': season_runs,
-        'season_hits': season_hits,
-        'season_walks': season_walks,
-        'season_sb': season_sb,
-        'season_cs': season_cs,
-        'season_sf': season_sf,
-        'season_lob': season_lob
-    }
 
+def run_simulations(
+    lineup: List[Player],
+    n_iterations: int = config.N_SIMULATIONS,
+    n_games: int = config.N_GAMES_PER_SEASON,
+    random_seed: int = config.RANDOM_SEED,
+    verbose: int = config.VERBOSITY,
+    progress_callback: Optional[Callable[[int, int], None]] = None
+) -> Dict:
+    """Run multiple season simulations and aggregate results.
+
+    Args:
+        lineup: List of 9 Player objects in batting order
+        n_iterations: Number of seasons to simulate
+        n_games: Games per season
+        random_seed: Random seed for reproducibility
+        verbose: Verbosity level (0=silent, 1=progress, 2=debug)
+        progress_callback: Optional callback function(current, total) for progress updates
+
+    Returns:
+        Dictionary with aggregated statistics across all simulations
+    """
+    if verbose >= 1:
+        print(f"Running {n_iterations:,} season simulations...")
+        print(f"Games per season: {n_games}")
+        print(f"Random seed: {random_seed}\n")
+
+    raw_data = simulate_seasons(
+        lineup,
+        n_iterations=n_iterations,
+        n_games=n_games,
+        random_seed=random_seed,
+        verbose=verbose,
+        progress_callback=progress_callback
+    )
+
+    if verbose >= 1:
+        print("\nSimulation complete!\n")
+
+    return build_results(raw_data, n_games, lineup)
+
+
+def build_results(raw_data: Dict[str, List[int]], n_games: int, lineup: List[Player]) -> Dict:
+    """Package raw per-season totals into the run_simulations result format.
+
+    Args:
+        raw_data: Dictionary of per-season total lists from simulate_seasons
+        n_games: Games per season
+        lineup: Lineup that was simulated
+
+    Returns:
+        Dictionary with 'summary', 'raw_data' and 'lineup' entries
+    """
     return {
-        'summary': summary,
+        'summary': summarize_simulations(raw_data, n_games),
         'raw_data': raw_data,
         'lineup': [{'name': p.name, 'ba': p.ba, 'obp': p.obp, 'slg': p.slg} for p in lineup]
     }
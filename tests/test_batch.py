@@ -0,0 +1,85 @@
+# ============================================================================
+# tests/test_batch.py
+# ============================================================================
+"""Regression tests for batch simulation and summary statistics."""
+
+import pandas as pd
+import pytest
+from src.data.processor import create_player_from_stats
+from src.simulation.batch import (
+    build_results,
+    run_simulations,
+    simulate_seasons,
+    summarize_simulations,
+)
+
+# Output of run_simulations(n_iterations=10, n_games=5, random_seed=7) on
+# the lineup below, recorded before simulate_seasons/summarize_simulations
+# were split out of it
+BASELINE_RAW_DATA = {
+    'season_runs': [22, 13, 24, 16, 21, 16, 32, 17, 32, 16],
+    'season_hits': [69, 52, 59, 55, 52, 47, 62, 47, 66, 49],
+    'season_walks': [15, 14, 17, 10, 13, 13, 16, 12, 17, 16],
+    'season_sb': [2, 2, 2, 1, 1, 2, 1, 2, 2, 0],
+    'season_cs': [2, 1, 1, 0, 0, 0, 0, 0, 0, 1],
+    'season_sf': [2, 3, 3, 2, 0, 1, 1, 1, 6, 2],
+    'season_lob': [58, 49, 49, 48, 43, 40, 46, 40, 50, 48],
+}
+
+BASELINE_RUNS = {
+    'mean': 20.9,
+    'std': 6.378871373526825,
+    'median': 19.0,
+    'min': 13,
+    'max': 32,
+    'percentiles': {'5th': 14.35, '25th': 16.0, '50th': 19.0, '75th': 23.5, '95th': 32.0},
+    'ci_95': (13.675, 32.0),
+}
+
+
+@pytest.fixture
+def sample_lineup():
+    """Create a 9-player lineup of increasing strength."""
+    return [
+        create_player_from_stats(pd.Series({
+            'name': f"Player {i}", 'ba': 0.230 + 0.01 * i, 'obp': 0.300 + 0.01 * i,
+            'slg': 0.380 + 0.015 * i, 'iso': 0.150 + 0.005 * i, 'pa': 500,
+        }))
+        for i in range(1, 10)
+    ]
+
+
+def test_run_simulations_matches_baseline(sample_lineup):
+    """Test a seeded run reproduces the recorded season totals and summary."""
+    results = run_simulations(sample_lineup, n_iterations=10, n_games=5, random_seed=7, verbose=0)
+    summary = results['summary']
+
+    assert results['raw_data'] == BASELINE_RAW_DATA
+    assert summary['n_simulations'] == 10
+    assert summary['n_games_per_season'] == 5
+    assert summary['runs'] == BASELINE_RUNS
+    assert summary['runs_per_game'] == pytest.approx({'mean': 4.18, 'std': 1.2757742747053649})
+    assert summary['lob_per_game'] == pytest.approx({'mean': 9.42, 'std': 1.009752444909147})
+    assert summary['win_probability'] == pytest.approx(
+        {'mean': 0.3, 'ci_lower': 0.10779126740630099, 'ci_upper': 0.6032218525388546}
+    )
+    assert summary['risp_conversion'] is None
+
+
+def test_build_results_matches_run_simulations(sample_lineup):
+    """Test simulate_seasons + build_results is equivalent to run_simulations."""
+    raw_data = simulate_seasons(sample_lineup, n_iterations=10, n_games=5, random_seed=7)
+    results = build_results(raw_data, 5, sample_lineup)
+    expected = run_simulations(sample_lineup, n_iterations=10, n_games=5, random_seed=7, verbose=0)
+
+    assert results == expected
+
+
+def test_summarize_simulations_counts_seasons():
+    """Test the summary reports the number of seasons it was given."""
+    half = {key: values[:5] for key, values in BASELINE_RAW_DATA.items()}
+    summary = summarize_simulations(half, n_games=5)
+
+    assert summary['n_simulations'] == 5
+    assert summary['runs']['min'] == 13
+    assert summary['runs']['max'] == 24
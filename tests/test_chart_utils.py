@@ -0,0 +1,61 @@
+# ============================================================================
+# tests/test_chart_utils.py
+# ============================================================================
+"""Tests for chart helper calculations."""
+
+import numpy as np
+import pytest
+from src.gui.utils import chart_utils
+from src.gui.utils.chart_utils import (
+    KDE_GRID_SIZE,
+    _bin_counts,
+    _mean_m2,
+    _shared_bin_edges,
+)
+
+
+@pytest.mark.parametrize('dtype', [np.int64, np.float64])
+def test_bin_counts_match_numpy_for_integer_data(dtype):
+    """Test integer-valued data (run totals) bins exactly like np.histogram."""
+    rng = np.random.default_rng(0)
+    for _ in range(200):
+        data = rng.integers(500, 900, size=rng.integers(1, 2000)).astype(dtype)
+        bins = int(rng.integers(5, 60))
+        for n_edges in (bins + 1, bins * (-(-KDE_GRID_SIZE // bins)) + 1):
+            edges = np.linspace(*_shared_bin_edges([data], bins)[[0, -1]], n_edges)
+            expected, _ = np.histogram(data, bins=edges)
+            np.testing.assert_array_equal(_bin_counts(data, edges), expected)
+
+
+def test_bin_counts_keep_every_sample():
+    """Test non-integer data is fully counted, including the max value."""
+    rng = np.random.default_rng(1)
+    data = rng.normal(700.0, 40.0, size=5000)
+    edges = _shared_bin_edges([data], 30)
+    counts = _bin_counts(data, edges)
+    assert counts.sum() == len(data)
+    assert counts[-1] >= 1  # The max lies on the closed right edge
+
+
+def test_shared_bin_edges_widen_constant_data():
+    """Test a zero-width range is widened by 0.5 each side, as in numpy."""
+    edges = _shared_bin_edges([np.array([3.0, 3.0])], 4)
+    np.testing.assert_allclose(edges, np.histogram_bin_edges([3.0, 3.0], bins=4))
+
+
+@pytest.mark.parametrize('block_size', [7, 64, chart_utils.STATS_BLOCK_SIZE])
+def test_mean_m2_matches_numpy(block_size, monkeypatch):
+    """Test blocked mean/M2 agrees with np.mean and np.var for any block size."""
+    monkeypatch.setattr(chart_utils, 'STATS_BLOCK_SIZE', block_size)
+    rng = np.random.default_rng(2)
+    for size in (1, 2, 63, 64, 65, 1000):
+        data = rng.normal(700.0, 40.0, size=size)
+        n, mean, m2 = _mean_m2(data)
+        assert n == size
+        assert mean == pytest.approx(np.mean(data), rel=1e-12)
+        assert m2 == pytest.approx(np.var(data) * size, rel=1e-9, abs=1e-9)
+
+
+def test_mean_m2_empty():
+    """Test an empty array gives zero samples."""
+    assert _mean_m2(np.array([], dtype=float)) == (0, 0.0, 0.0)
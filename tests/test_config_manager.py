@@ -0,0 +1,89 @@
+# ============================================================================
+# tests/test_config_manager.py
+# ============================================================================
+"""Tests for GUI configuration persistence."""
+
+import json
+
+import pytest
+from src.gui.utils.config_manager import ConfigManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Create a config manager writing to a temporary directory."""
+    return ConfigManager(config_dir=str(tmp_path))
+
+
+def test_team_lineups_round_trip(manager):
+    """Test saved team lineups can be listed, loaded, and deleted."""
+    assert manager.save_team_lineup("TOR", 2025, "Opening Day", ["A", None, "C"])
+    assert manager.save_team_lineup("TOR", 2025, "Platoon", ["D"])
+
+    assert sorted(manager.get_team_lineup_names("TOR", 2025)) == ["Opening Day", "Platoon"]
+    lineups = {l["name"]: l for l in manager.load_team_lineups("TOR", 2025)}
+    assert lineups["Opening Day"]["players"] == ["A", None, "C"]
+
+    assert manager.delete_team_lineup("TOR", 2025, "Platoon")
+    assert not manager.delete_team_lineup("TOR", 2025, "Platoon")
+    assert manager.get_team_lineup_names("TOR", 2025) == ["Opening Day"]
+
+
+def test_team_lineup_save_keeps_external_edits(manager):
+    """Test a save after the file changed on disk keeps the other changes."""
+    manager.save_team_lineup("TOR", 2025, "Mine", ["A"])
+    lineups_file = manager._get_team_lineups_file("TOR", 2025)
+
+    # Another instance (or a hand edit) adds a lineup
+    data = json.loads(lineups_file.read_text())
+    data["Theirs"] = {"players": ["B"], "created_at": "2025-01-01T00:00:00"}
+    lineups_file.write_text(json.dumps(data))
+
+    manager.save_team_lineup("TOR", 2025, "Mine too", ["C"])
+
+    saved = json.loads(lineups_file.read_text())
+    assert set(saved) == {"Mine", "Theirs", "Mine too"}
+    assert sorted(manager.get_team_lineup_names("TOR", 2025)) == ["Mine", "Mine too", "Theirs"]
+
+
+def test_save_leaves_no_temp_file(manager, tmp_path):
+    """Test atomic saves replace the target and clean up the temp file."""
+    manager.save_session({'compare_mode': False})
+    manager.save_session({'compare_mode': True})
+
+    assert json.loads((tmp_path / 'last_session.json').read_text()) == {'compare_mode': True}
+    assert not list(tmp_path.glob('*.tmp'))
+
+
+def test_unchanged_save_skips_write(manager, tmp_path):
+    """Test saving identical state again does not rewrite the file."""
+    session_file = tmp_path / 'last_session.json'
+    manager.save_session({'compare_mode': False})
+    inode = session_file.stat().st_ino  # Each atomic write creates a new file
+
+    manager.save_session({'compare_mode': False})
+    assert session_file.stat().st_ino == inode
+
+    manager.save_session({'compare_mode': True})
+    assert session_file.stat().st_ino != inode
+
+
+def test_loaded_session_is_independent_of_cache(manager):
+    """Test modifying a loaded session does not affect later loads."""
+    manager.save_session({'compare_mode': False, 'lineup_panels': [{'name': 'A'}]})
+
+    session = manager.load_session()
+    session['compare_mode'] = True
+    session['lineup_panels'].append({'name': 'B'})
+
+    assert manager.load_session() == {'compare_mode': False, 'lineup_panels': [{'name': 'A'}]}
+
+
+def test_loaded_gui_config_is_independent_of_cache(manager):
+    """Test modifying a loaded GUI config does not affect later loads."""
+    manager.save_gui_config({'window': {'width': 800}})
+
+    gui_config = manager.load_gui_config()
+    gui_config['window']['width'] = 1024
+
+    assert manager.load_gui_config() == {'window': {'width': 800}}
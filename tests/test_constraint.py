@@ -0,0 +1,46 @@
+# ============================================================================
+# tests/test_constraint.py
+# ============================================================================
+"""Tests for the Constraint model."""
+
+import pytest
+from src.gui.models.constraint import Constraint
+
+
+@pytest.mark.parametrize('data', [
+    {'type': 'fixed_position', 'player': 'Alice', 'position': 3},
+    {'type': 'batting_order', 'player1': 'Alice', 'player2': 'Bob'},
+    {'type': 'platoon', 'player_a': 'Alice', 'player_b': 'Bob', 'position': 9},
+])
+def test_from_dict_round_trip(data):
+    """Test every field of a valid constraint dict is kept as-is."""
+    constraint = Constraint.from_dict(data, {'Alice', 'Bob'})
+    for key, value in data.items():
+        assert getattr(constraint, key) == value
+
+
+def test_from_dict_drops_invalid_fields():
+    """Test unknown players and out-of-range positions become None."""
+    constraint = Constraint.from_dict(
+        {'type': 'platoon', 'player_a': 'Alice', 'player_b': 'Zed', 'position': 10},
+        {'Alice', 'Bob'},
+    )
+    assert constraint == Constraint(type='platoon', player_a='Alice')
+
+
+def test_from_dict_parses_position_strings():
+    """Test positions stored as strings are converted to int."""
+    constraint = Constraint.from_dict({'type': 'fixed_position', 'player': 'A', 'position': '4'})
+    assert constraint.position == 4
+
+
+def test_from_dict_unknown_type_is_kept():
+    """Test an unrecognized type is passed through for the caller to handle."""
+    constraint = Constraint.from_dict({'type': 'lefty_righty', 'player': 'Alice'})
+    assert constraint == Constraint(type='lefty_righty', player='Alice')
+
+
+@pytest.mark.parametrize('data', [{}, {'type': None}, {'type': 5, 'player': 'Alice'}])
+def test_from_dict_without_type_returns_none(data):
+    """Test dicts without a string type are rejected."""
+    assert Constraint.from_dict(data) is None
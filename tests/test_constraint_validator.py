@@ -0,0 +1,100 @@
+# ============================================================================
+# tests/test_constraint_validator.py
+# ============================================================================
+"""Regression tests for lineup constraint validation.
+
+Expected messages and lineups were recorded from the validator before its
+per-type checks were moved into lookup tables.
+"""
+
+import pytest
+from src.gui.utils.constraint_validator import ConstraintValidator
+
+ROSTER = ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K']
+LINEUP = ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I']
+
+# (constraint, validate_constraint result, description)
+CASES = [
+    ({'type': 'fixed_position', 'player': 'A', 'position': 1},
+     (True, ''), 'A always bats #1'),
+    ({'type': 'fixed_position', 'player': 'A', 'position': 2},
+     (False, "'A' must bat in position 2"), 'A always bats #2'),
+    ({'type': 'fixed_position', 'player': 'Z', 'position': 2},
+     (False, "Player 'Z' not in roster"), 'Z always bats #2'),
+    ({'type': 'fixed_position', 'player': 'A'},
+     (False, "Constraint missing 'position' field"), 'A always bats #None'),
+    ({'type': 'fixed_position', 'player': 'A', 'position': 10},
+     (False, 'Position must be 1-9, got 10'), 'A always bats #10'),
+    ({'type': 'batting_order', 'player1': 'A', 'player2': 'C'},
+     (True, ''), 'C always bats after A'),
+    ({'type': 'batting_order', 'player1': 'C', 'player2': 'A'},
+     (False, "'A' must bat after 'C'"), 'A always bats after C'),
+    ({'type': 'batting_order', 'player1': 'A', 'player2': 'J'},
+     (True, ''), 'J always bats after A'),
+    ({'type': 'batting_order', 'player1': 'A', 'player2': 'Z'},
+     (False, 'Players not in roster'), 'Z always bats after A'),
+    ({'type': 'platoon', 'player_a': 'C', 'player_b': 'J', 'position': 3},
+     (True, ''), 'Platoon C / J at position #3'),
+    ({'type': 'platoon', 'player_a': 'J', 'player_b': 'K', 'position': 3},
+     (False, "Position 3 must be either 'J' or 'K'"), 'Platoon J / K at position #3'),
+    ({'type': 'platoon', 'player_a': 'A', 'player_b': 'B', 'position': 1},
+     (False, "Cannot have both 'A' and 'B' in lineup (platoon)"), 'Platoon A / B at position #1'),
+    ({'type': 'platoon', 'player_a': 'J', 'player_b': 'K'},
+     (False, "Constraint missing 'position' field"), 'Platoon J / K at position #None'),
+    ({'type': 'lefty_righty'},
+     (False, 'Unknown constraint type: lefty_righty'), 'Unknown constraint: lefty_righty'),
+]
+
+
+@pytest.mark.parametrize('constraint, expected, _', CASES)
+def test_validate_constraint(constraint, expected, _):
+    """Test each constraint type's pass and failure messages."""
+    assert ConstraintValidator.validate_constraint(constraint, LINEUP, ROSTER) == expected
+
+
+@pytest.mark.parametrize('constraint, _, expected', CASES)
+def test_get_constraint_description(constraint, _, expected):
+    """Test descriptions, including fields missing from the constraint."""
+    assert ConstraintValidator.get_constraint_description(constraint) == expected
+
+
+def test_validate_all_constraints_collects_errors_in_order():
+    """Test every failing constraint contributes its message, in order."""
+    constraints = [constraint for constraint, _, _ in CASES]
+    all_valid, errors = ConstraintValidator.validate_all_constraints(constraints, LINEUP, ROSTER)
+
+    assert not all_valid
+    assert errors == [message for _, (ok, message), _ in CASES if not ok]
+
+
+def test_validate_all_constraints_valid():
+    """Test a lineup satisfying every constraint has no errors."""
+    constraints = [constraint for constraint, (ok, _), _ in CASES if ok]
+    assert ConstraintValidator.validate_all_constraints(constraints, LINEUP, ROSTER) == (True, [])
+
+
+def test_apply_constraints():
+    """Test fixed positions move players and platoons drop the later player."""
+    lineup = ['A', None, 'C', 'D', 'J', None, 'G', 'K', 'I']
+    constraints = [
+        {'type': 'fixed_position', 'player': 'D', 'position': 2},
+        {'type': 'fixed_position', 'player': 'B', 'position': 6},
+        {'type': 'fixed_position', 'player': 'G', 'position': None},
+        {'type': 'platoon', 'player_a': 'J', 'player_b': 'K', 'position': 5},
+    ]
+
+    result = ConstraintValidator.apply_constraints(constraints, lineup, ROSTER)
+    assert result == ['A', 'D', 'C', None, 'J', 'B', 'G', None, 'I']
+    assert lineup == ['A', None, 'C', 'D', 'J', None, 'G', 'K', 'I']  # Input unchanged
+
+
+def test_apply_constraints_displaces_occupant():
+    """Test a fixed position replaces its occupant before platoons apply."""
+    lineup = ['A', None, 'C', 'D', 'J', None, 'G', 'K', 'I']
+    constraints = [
+        {'type': 'platoon', 'player_a': 'J', 'player_b': 'K', 'position': 5},
+        {'type': 'fixed_position', 'player': 'K', 'position': 1},
+    ]
+
+    result = ConstraintValidator.apply_constraints(constraints, lineup, ROSTER)
+    assert result == ['K', None, 'C', 'D', None, None, 'G', None, 'I']
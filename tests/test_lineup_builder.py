@@ -0,0 +1,62 @@
+# ============================================================================
+# tests/test_lineup_builder.py
+# ============================================================================
+"""Tests for the LineupBuilder roster display (needs a Tk display)."""
+
+import tkinter as tk
+
+import pandas as pd
+import pytest
+from src.data.processor import create_player_from_stats
+from src.gui.widgets.lineup_builder import LineupBuilder
+
+
+@pytest.fixture
+def root():
+    """Create a hidden Tk root, skipping when no display is available."""
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        pytest.skip("no display available")
+    root.withdraw()
+    yield root
+    root.destroy()
+
+
+@pytest.fixture
+def builder(root):
+    """Create a lineup builder loaded with a 10-player roster."""
+    roster = [
+        create_player_from_stats(pd.Series({
+            'name': f"Player {i}", 'ba': 0.250, 'obp': 0.320,
+            'slg': 0.400, 'iso': 0.150, 'pa': 500,
+        }))
+        for i in range(10)
+    ]
+    builder = LineupBuilder(root)
+    builder.load_data(roster, None)
+    return builder
+
+
+def _roster_rows(builder):
+    """Return the roster listbox text after pending updates are drawn."""
+    builder.update_idletasks()
+    return list(builder.roster_listbox.get(0, tk.END))
+
+
+def test_add_marks_player_in_lineup(builder):
+    """Test an added player's roster row is marked."""
+    assert builder.add_player(builder.roster[0])
+    assert _roster_rows(builder)[0].startswith("[IN LINEUP] ")
+
+
+def test_add_to_occupied_slot_unmarks_displaced_player(builder):
+    """Test the player replaced in a slot is shown as available again."""
+    first, second = builder.roster[0], builder.roster[1]
+    builder.add_player(first, 3)
+    assert builder.add_player(second, 3)
+
+    rows = _roster_rows(builder)
+    assert not rows[0].startswith("[IN LINEUP] ")
+    assert rows[1].startswith("[IN LINEUP] ")
+    assert builder.roster_listbox.itemcget(0, 'foreground') != 'gray'
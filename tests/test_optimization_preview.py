@@ -0,0 +1,43 @@
+# ============================================================================
+# tests/test_optimization_preview.py
+# ============================================================================
+"""Regression tests for the lineup diff text.
+
+Expected strings were recorded from LineupDiffView._compute_diff before it
+was moved to the cached, module-level _compute_diff_names.
+"""
+
+import pytest
+from src.gui.widgets.optimization_preview import _compute_diff_names
+
+HEADER = "Current vs Proposed\n" + "=" * 40 + "\n\n"
+
+
+@pytest.mark.parametrize('names_b, expected', [
+    ('ABCDEFGHI', "Lineups are identical."),
+    ('ABDCEFGHI', HEADER + "Swaps: 3<->4\n\nTotal: 1 change(s)"),
+    ('BACDEFGIH', HEADER + "Swaps: 1<->2, 8<->9\n\nTotal: 2 change(s)"),
+    ('BCAEFGHID', HEADER + (
+        "Slot Changes:\n"
+        "  Slot 1: A -> B\n  Slot 2: B -> C\n  Slot 3: C -> A\n"
+        "  Slot 4: D -> E\n  Slot 5: E -> F\n  Slot 6: F -> G\n"
+        "  Slot 7: G -> H\n  Slot 8: H -> I\n  Slot 9: I -> D\n\n"
+        "Total: 9 change(s)"
+    )),
+    ('ABCDEFGHJ', HEADER + (
+        "Slot Changes:\n  Slot 9: I -> J\n\n"
+        "Removed from Proposed:\n  - I\n\n"
+        "Added in Proposed:\n  + J\n\n"
+        "Total: 3 change(s)"
+    )),
+    ('JBCDEFGHA', HEADER + (
+        "Slot Changes:\n  Slot 1: A -> J\n  Slot 9: I -> A\n\n"
+        "Removed from Proposed:\n  - I\n\n"
+        "Added in Proposed:\n  + J\n\n"
+        "Total: 4 change(s)"
+    )),
+])
+def test_compute_diff_matches_baseline(names_b, expected):
+    """Test swaps, slot changes, and roster changes are reported as before."""
+    names_a = tuple('ABCDEFGHI')
+    assert _compute_diff_names(names_a, tuple(names_b), "Current", "Proposed") == expected
@@ -0,0 +1,75 @@
+# ============================================================================
+# tests/test_processor.py
+# ============================================================================
+"""Tests for roster preparation and the pickled roster cache."""
+
+import pickle
+
+import pandas as pd
+import pytest
+from src.data import processor
+from src.data.processor import load_roster_cache, prepare_roster, save_roster_cache
+
+
+@pytest.fixture
+def roster_df():
+    """Create a small prepared-stats DataFrame."""
+    return pd.DataFrame({
+        'name': ['Player 1', 'Player 2'],
+        'ba': [0.250, 0.300],
+        'obp': [0.320, 0.380],
+        'slg': [0.400, 0.500],
+        'iso': [0.150, 0.200],
+        'pa': [500, 450],
+    })
+
+
+@pytest.fixture(autouse=True)
+def data_dir(tmp_path, monkeypatch):
+    """Run each test in an empty directory (caches live under data/)."""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path / 'data' / 'processed'
+
+
+def test_roster_cache_round_trip(roster_df):
+    """Test a saved roster loads back unchanged."""
+    roster = prepare_roster(roster_df)
+    save_roster_cache(roster, roster_df, 'tor_2025_roster.pkl')
+
+    cached_roster, cached_df = load_roster_cache('tor_2025_roster.pkl')
+    assert cached_roster == roster
+    pd.testing.assert_frame_equal(cached_df, roster_df)
+
+
+def test_roster_cache_missing_returns_none():
+    """Test a missing cache is a miss, not an error."""
+    assert load_roster_cache('none.pkl') is None
+
+
+def test_roster_cache_ignored_after_key_change(roster_df, monkeypatch):
+    """Test caches written by other code/config versions are not used."""
+    save_roster_cache(prepare_roster(roster_df), roster_df, 'tor_2025_roster.pkl')
+    monkeypatch.setattr(processor, '_roster_cache_key', lambda: 'other version')
+    assert load_roster_cache('tor_2025_roster.pkl') is None
+
+
+def test_roster_cache_key_includes_format(monkeypatch):
+    """Test bumping ROSTER_CACHE_FORMAT changes the cache key."""
+    key = processor._roster_cache_key.__wrapped__()
+    monkeypatch.setattr(processor, 'ROSTER_CACHE_FORMAT', processor.ROSTER_CACHE_FORMAT + 1)
+    assert processor._roster_cache_key.__wrapped__() != key
+
+
+def test_roster_cache_ignores_old_payload(roster_df, data_dir):
+    """Test a cache in the old (roster, df) tuple format is not used."""
+    data_dir.mkdir(parents=True)
+    with open(data_dir / 'tor_2025_roster.pkl', 'wb') as f:
+        pickle.dump((prepare_roster(roster_df), roster_df), f)
+    assert load_roster_cache('tor_2025_roster.pkl') is None
+
+
+def test_roster_cache_ignores_corrupt_file(data_dir):
+    """Test an unreadable pickle falls back instead of raising."""
+    data_dir.mkdir(parents=True)
+    (data_dir / 'tor_2025_roster.pkl').write_bytes(b'not a pickle')
+    assert load_roster_cache('tor_2025_roster.pkl') is None
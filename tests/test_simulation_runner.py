@@ -0,0 +1,76 @@
+# ============================================================================
+# tests/test_simulation_runner.py
+# ============================================================================
+"""Tests for the GUI simulation runner."""
+
+import pandas as pd
+import pytest
+from src.data.processor import create_player_from_stats
+from src.gui.utils import simulation_runner
+from src.gui.utils.simulation_runner import (
+    PARALLEL_CHUNKS,
+    PARALLEL_MIN_ITERATIONS,
+    SimulationRunner,
+    _chunk_plan,
+)
+from src.simulation.batch import run_simulations
+
+
+@pytest.fixture
+def sample_lineup():
+    """Create a sample 9-player lineup with PA probabilities."""
+    return [
+        create_player_from_stats(pd.Series({
+            'name': f"Player {i}", 'ba': 0.250, 'obp': 0.320,
+            'slg': 0.400, 'iso': 0.150, 'pa': 500,
+        }))
+        for i in range(1, 10)
+    ]
+
+
+def _collect(run, lineup, overrides):
+    """Run a SimulationRunner path and return the results it reports."""
+    received = []
+    run(lineup, overrides, None, received.append)
+    assert len(received) == 1
+    return received[0]
+
+
+def test_chunk_plan_covers_all_iterations():
+    """Test chunks add up to the run and get consecutive seeds."""
+    n_iterations = PARALLEL_MIN_ITERATIONS + 5
+    plan = _chunk_plan(n_iterations, 42)
+    assert len(plan) == PARALLEL_CHUNKS
+    assert sum(size for size, _ in plan) == n_iterations
+    assert [seed for _, seed in plan] == list(range(42, 42 + PARALLEL_CHUNKS))
+
+
+def test_chunk_plan_small_run_is_one_chunk():
+    """Test runs below the parallel threshold keep the run's own seed."""
+    assert _chunk_plan(PARALLEL_MIN_ITERATIONS - 1, 42) == [(PARALLEL_MIN_ITERATIONS - 1, 42)]
+    assert _chunk_plan(0, 42) == []
+
+
+def test_small_serial_run_matches_run_simulations(sample_lineup):
+    """Test small GUI runs reproduce the CLI's run_simulations for a seed."""
+    overrides = {'n_iterations': 20, 'n_games': 3, 'random_seed': 42}
+    serial = _collect(SimulationRunner()._run_serial, sample_lineup, overrides)
+    expected = run_simulations(sample_lineup, n_iterations=20, n_games=3, random_seed=42, verbose=0)
+
+    assert serial['raw_data'] == expected['raw_data']
+    assert serial['summary'] == expected['summary']
+
+
+def test_serial_and_parallel_give_same_results(sample_lineup, monkeypatch):
+    """Test a seed gives the same summary with or without a process pool."""
+    monkeypatch.setattr(simulation_runner, 'PARALLEL_MIN_ITERATIONS', 10)
+    overrides = {'n_iterations': 20, 'n_games': 3, 'random_seed': 42}
+    runner = SimulationRunner()
+    assert len(_chunk_plan(20, 42)) == PARALLEL_CHUNKS
+
+    serial = _collect(runner._run_serial, sample_lineup, overrides)
+    parallel = _collect(runner._run_parallel, sample_lineup, overrides)
+
+    assert 'error' not in serial
+    assert serial['raw_data'] == parallel['raw_data']
+    assert serial['summary'] == parallel['summary']
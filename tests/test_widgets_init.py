@@ -0,0 +1,33 @@
+# ============================================================================
+# tests/test_widgets_init.py
+# ============================================================================
+"""Tests for the lazily-imported widgets package exports."""
+
+import importlib.util
+from pathlib import Path
+
+import src.gui.widgets as widgets
+
+SCRIPT_PATH = Path(__file__).parent.parent / 'scripts' / 'check_widgets_init.py'
+
+
+def test_all_matches_widget_modules():
+    """Test __all__ and the lazy import table list the same names."""
+    assert set(widgets.__all__) == set(widgets._WIDGET_MODULES)
+    assert len(widgets.__all__) == len(set(widgets.__all__))
+
+
+def test_every_export_resolves():
+    """Test every exported name imports from its mapped submodule."""
+    for name, module_name in widgets._WIDGET_MODULES.items():
+        value = getattr(widgets, name)
+        assert value.__name__ == name
+        assert value.__module__ == f'{widgets.__name__}.{module_name}'
+
+
+def test_every_widget_class_is_exported():
+    """Test no public widget class is missing from the exports."""
+    spec = importlib.util.spec_from_file_location('check_widgets_init', SCRIPT_PATH)
+    script = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(script)
+    assert script.check() == []